@@ -0,0 +1,80 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from prometheus_client import Counter, Gauge
+
+from app.domain.exceptions.admission import ServiceOverloadedException
+
+ADMISSION_QUEUE_DEPTH = Gauge(
+    "fintracker_admission_queue_depth",
+    "Requests waiting to be admitted, by endpoint class",
+    ["endpoint"],
+)
+ADMISSION_IN_FLIGHT = Gauge(
+    "fintracker_admission_in_flight",
+    "Admitted requests currently being handled, by endpoint class",
+    ["endpoint"],
+)
+ADMISSION_REJECTIONS = Counter(
+    "fintracker_admission_rejections_total",
+    "Requests shed with a 503, by endpoint class and reason",
+    ["endpoint", "reason"],
+)
+
+
+class AdmissionController:
+    """
+    Limits how many requests of an endpoint class are handled at once
+
+    Up to `max_concurrent` requests run and up to `max_queue` wait, each for at
+    most `queue_timeout_seconds`. Anything beyond that fails fast with a 503
+    and a `Retry-After`, so a burst against CPU-heavy endpoints is shed
+    instead of starving the rest of the worker.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout_seconds: float,
+        retry_after_seconds: int,
+    ) -> None:
+        self.endpoint = endpoint
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._waiting = 0
+
+    def _reject(self, reason: str) -> ServiceOverloadedException:
+        ADMISSION_REJECTIONS.labels(endpoint=self.endpoint, reason=reason).inc()
+        return ServiceOverloadedException(
+            message="Server is busy, try again later",
+            retry_after_seconds=self.retry_after_seconds,
+        )
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        if self._slots.locked() and self._waiting >= self.max_queue:
+            raise self._reject(reason="queue_full")
+
+        self._waiting += 1
+        ADMISSION_QUEUE_DEPTH.labels(endpoint=self.endpoint).inc()
+        try:
+            async with asyncio.timeout(self.queue_timeout_seconds):
+                await self._slots.acquire()
+        except TimeoutError:
+            raise self._reject(reason="queue_timeout") from None
+        finally:
+            self._waiting -= 1
+            ADMISSION_QUEUE_DEPTH.labels(endpoint=self.endpoint).dec()
+
+        ADMISSION_IN_FLIGHT.labels(endpoint=self.endpoint).inc()
+        try:
+            yield
+        finally:
+            ADMISSION_IN_FLIGHT.labels(endpoint=self.endpoint).dec()
+            self._slots.release()
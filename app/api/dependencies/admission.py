@@ -0,0 +1,37 @@
+from collections.abc import AsyncIterator, Callable
+
+from app.api.admission import AdmissionController
+from app.infra.configs.settings import Settings
+
+settings = Settings()  # type: ignore
+
+login_admission = AdmissionController(
+    endpoint="login",
+    max_concurrent=settings.ADMISSION_LOGIN_MAX_CONCURRENT,
+    max_queue=settings.ADMISSION_LOGIN_MAX_QUEUE,
+    queue_timeout_seconds=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    retry_after_seconds=settings.ADMISSION_RETRY_AFTER_SECONDS,
+)
+
+register_admission = AdmissionController(
+    endpoint="register",
+    max_concurrent=settings.ADMISSION_REGISTER_MAX_CONCURRENT,
+    max_queue=settings.ADMISSION_REGISTER_MAX_QUEUE,
+    queue_timeout_seconds=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    retry_after_seconds=settings.ADMISSION_RETRY_AFTER_SECONDS,
+)
+
+
+def admitted_by(controller: AdmissionController) -> Callable[[], AsyncIterator[None]]:
+    """
+    Route dependency holding an admission slot while the request is handled
+
+    Declared in the route `dependencies`, it is solved before the database
+    session, so queued requests do not hold a connection.
+    """
+
+    async def admit() -> AsyncIterator[None]:
+        async with controller.admit():
+            yield
+
+    return admit
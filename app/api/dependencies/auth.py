@@ -1,27 +1,80 @@
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies.base import get_db
+from app.api.dependencies.base import get_current_user, get_db, get_unit_of_work
+from app.domain.abstractions.unit_of_work import AbstractUnitOfWork
+from app.domain.value_objects.auth import JWTPayload
 from app.infra.auth.password_handler import AdapterPasswordHandler
 from app.infra.auth.token import TokenProvider
+from app.infra.cache.backends import user_id_cache_backend
+from app.infra.repositories.refresh_tokens import AdapterRefreshTokenRepo
 from app.infra.repositories.users import AdapterUserRepo
 from app.usecases.auth.create_user import SignUpUseCase
 from app.usecases.auth.login import LoginUseCase
+from app.usecases.auth.refresh_token import RefreshAccessTokenUseCase, RevokeRefreshTokenUseCase
+from app.usecases.auth.resolve_user import ResolveUserIdUseCase
 
 
-async def get_login_use_case(db: Session = Depends(get_db)) -> LoginUseCase:
+async def get_login_use_case(
+    db: AsyncSession = Depends(get_db),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
+) -> LoginUseCase:
     user_repo = AdapterUserRepo(session=db)
     password_handler = AdapterPasswordHandler()
     token_provider = TokenProvider()
     return LoginUseCase(
-        user_repo=user_repo, password_handler=password_handler, token_provider=token_provider
+        user_repo=user_repo,
+        password_handler=password_handler,
+        token_provider=token_provider,
+        unit_of_work=unit_of_work,
+        refresh_token_repo=AdapterRefreshTokenRepo(session=db),
     )
 
 
-async def get_sign_up_use_case(db: Session = Depends(get_db)) -> SignUpUseCase:
+async def get_refresh_access_token_use_case(
+    db: AsyncSession = Depends(get_db),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
+) -> RefreshAccessTokenUseCase:
+    return RefreshAccessTokenUseCase(
+        refresh_token_repo=AdapterRefreshTokenRepo(session=db),
+        token_provider=TokenProvider(),
+        unit_of_work=unit_of_work,
+    )
+
+
+async def get_revoke_refresh_token_use_case(
+    db: AsyncSession = Depends(get_db),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
+) -> RevokeRefreshTokenUseCase:
+    return RevokeRefreshTokenUseCase(
+        refresh_token_repo=AdapterRefreshTokenRepo(session=db),
+        token_provider=TokenProvider(),
+        unit_of_work=unit_of_work,
+    )
+
+
+async def get_sign_up_use_case(
+    db: AsyncSession = Depends(get_db),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
+) -> SignUpUseCase:
     user_repo = AdapterUserRepo(session=db)
     password_handler = AdapterPasswordHandler()
     return SignUpUseCase(
         user_repo=user_repo,
         password_handler=password_handler,
+        unit_of_work=unit_of_work,
     )
+
+
+async def get_resolve_user_id_use_case(
+    db: AsyncSession = Depends(get_db),
+) -> ResolveUserIdUseCase:
+    user_repo = AdapterUserRepo(session=db)
+    return ResolveUserIdUseCase(user_repo=user_repo, cache=user_id_cache_backend)
+
+
+async def get_current_user_id(
+    current_user: JWTPayload = Depends(get_current_user),
+    use_case: ResolveUserIdUseCase = Depends(get_resolve_user_id_use_case),
+) -> int:
+    return await use_case.execute(token_payload=current_user)
@@ -1,9 +1,12 @@
 from fastapi import Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.domain.abstractions.unit_of_work import AbstractUnitOfWork
 from app.domain.value_objects.auth import JWTPayload
 from app.domain.value_objects.pagination import PaginationParams
 from app.infra.auth.token import TokenProvider
-from app.infra.database.session import LocalSessionMaker
+from app.infra.database.session import SessionOpener, open_session
+from app.infra.database.unit_of_work import SqlAlchemyUnitOfWork
 
 
 def get_current_user(
@@ -15,12 +18,25 @@ def get_current_user(
     return token_data
 
 
-def get_db():
-    db = LocalSessionMaker()
-    try:
+async def get_db():
+    async with open_session() as db:
         yield db
-    finally:
-        db.close()
+
+
+async def get_unit_of_work(db: AsyncSession = Depends(get_db)) -> AbstractUnitOfWork:
+    """
+    The transaction of the request, over the same session as its repositories
+    """
+    return SqlAlchemyUnitOfWork(session=db)
+
+
+def get_session_opener() -> SessionOpener:
+    """
+    For work that outlives the request handler, such as a streamed response
+
+    Sessions from `get_db` are closed before the response body is sent.
+    """
+    return open_session
 
 
 def get_pagination_params(
@@ -1,33 +1,83 @@
+import logging
+
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies.base import get_db
+from app.api.dependencies.base import get_db, get_unit_of_work
+from app.domain.abstractions.unit_of_work import AbstractUnitOfWork
+from app.infra.configs.settings import Settings
+from app.infra.database.session import open_session
 from app.infra.repositories.categories import AdapterCategoryRepo
 from app.usecases.categories.delete_category import DeleteCategoryUseCase
 from app.usecases.categories.list_categories import GetOneCategoryUseCase, ListCategoriesUseCase
 from app.usecases.categories.persist_category import CreateCategoryUseCase, UpdateCategoryUseCase
+from app.usecases.categories.registry import CategoryRegistry
+
+logger = logging.getLogger(__name__)
+
+settings = Settings()
+
+category_registry = CategoryRegistry(
+    refresh_interval_seconds=settings.CATEGORY_REGISTRY_REFRESH_SECONDS,
+)
+
+
+async def warm_category_registry() -> None:
+    """
+    Loads the categories before the first request
+
+    A database that is not reachable yet only delays the load to the first
+    request that needs it.
+    """
+    try:
+        async with open_session() as db:
+            await category_registry.refresh(category_repo=AdapterCategoryRepo(session=db))
+    except (OSError, SQLAlchemyError) as exc:
+        logger.warning(f"Category registry not warmed at startup: {exc}")
 
 
-async def get_list_categories_use_case(db: Session = Depends(get_db)) -> ListCategoriesUseCase:
+async def get_list_categories_use_case(db: AsyncSession = Depends(get_db)) -> ListCategoriesUseCase:
     category_repo = AdapterCategoryRepo(session=db)
     return ListCategoriesUseCase(category_repo=category_repo)
 
 
-async def get_one_category_use_case(db: Session = Depends(get_db)) -> GetOneCategoryUseCase:
+async def get_one_category_use_case(db: AsyncSession = Depends(get_db)) -> GetOneCategoryUseCase:
     category_repo = AdapterCategoryRepo(session=db)
     return GetOneCategoryUseCase(category_repo=category_repo)
 
 
-async def get_create_category_use_case(db: Session = Depends(get_db)) -> CreateCategoryUseCase:
+async def get_create_category_use_case(
+    db: AsyncSession = Depends(get_db),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
+) -> CreateCategoryUseCase:
     category_repo = AdapterCategoryRepo(session=db)
-    return CreateCategoryUseCase(category_repo=category_repo)
+    return CreateCategoryUseCase(
+        category_repo=category_repo,
+        unit_of_work=unit_of_work,
+        category_registry=category_registry,
+    )
 
 
-async def get_update_category_use_case(db: Session = Depends(get_db)) -> UpdateCategoryUseCase:
+async def get_update_category_use_case(
+    db: AsyncSession = Depends(get_db),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
+) -> UpdateCategoryUseCase:
     category_repo = AdapterCategoryRepo(session=db)
-    return UpdateCategoryUseCase(category_repo=category_repo)
+    return UpdateCategoryUseCase(
+        category_repo=category_repo,
+        unit_of_work=unit_of_work,
+        category_registry=category_registry,
+    )
 
 
-async def get_delete_category_use_case(db: Session = Depends(get_db)) -> DeleteCategoryUseCase:
+async def get_delete_category_use_case(
+    db: AsyncSession = Depends(get_db),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
+) -> DeleteCategoryUseCase:
     category_repo = AdapterCategoryRepo(session=db)
-    return DeleteCategoryUseCase(category_repo=category_repo)
+    return DeleteCategoryUseCase(
+        category_repo=category_repo,
+        unit_of_work=unit_of_work,
+        category_registry=category_registry,
+    )
@@ -1,13 +1,21 @@
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies.base import get_db
+from app.infra.cache.backends import dashboard_cache_backend
 from app.infra.repositories.transactions import AdapterTransactionRepo
-from app.infra.repositories.users import AdapterUserRepo
+from app.usecases.dashboards.cache import DashboardResumeCache
 from app.usecases.dashboards.resume import DashboardResumeUseCase
 
+# One per worker, as the generations that guard its writes must outlive a request
+dashboard_resume_cache = DashboardResumeCache(backend=dashboard_cache_backend)
 
-async def get_dashboard_resume_use_case(db: Session = Depends(get_db)) -> DashboardResumeUseCase:
-    user_repo = AdapterUserRepo(session=db)
+
+async def get_dashboard_resume_use_case(
+    db: AsyncSession = Depends(get_db),
+) -> DashboardResumeUseCase:
     transaction_repo = AdapterTransactionRepo(session=db)
-    return DashboardResumeUseCase(user_repo=user_repo, transaction_repo=transaction_repo)
+    return DashboardResumeUseCase(
+        transaction_repo=transaction_repo,
+        cache=dashboard_resume_cache,
+    )
@@ -1,60 +1,204 @@
-from fastapi import Depends
-from sqlalchemy.orm import Session
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Annotated
 
-from app.api.dependencies.base import get_db
+from fastapi import Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies.base import (
+    get_current_user,
+    get_db,
+    get_session_opener,
+    get_unit_of_work,
+)
+from app.api.dependencies.categories import category_registry
+from app.api.dependencies.dashboards import dashboard_resume_cache
+from app.domain.abstractions.unit_of_work import AbstractUnitOfWork
+from app.domain.value_objects.auth import JWTPayload
+from app.domain.value_objects.transactions import SearchMode, TransactionsFilter
+from app.infra.configs.settings import Settings
+from app.infra.database.session import SessionOpener, open_writer_session
+from app.infra.database.unit_of_work import SqlAlchemyUnitOfWork
 from app.infra.repositories.categories import AdapterCategoryRepo
 from app.infra.repositories.transactions import AdapterTransactionRepo
-from app.infra.repositories.users import AdapterUserRepo
+from app.usecases.transactions.batch_transactions import BatchTransactionsUseCase
 from app.usecases.transactions.create_transaction import CreateTransactionUseCase
 from app.usecases.transactions.delete_transaction import DeleteTransactionUseCase
 from app.usecases.transactions.edit_transaction import UpdateTransactionUseCase
+from app.usecases.transactions.export_transactions import ExportTransactionsUseCase
+from app.usecases.transactions.group_commit import TransactionGroupCommit
+from app.usecases.transactions.import_transactions import ImportTransactionsUseCase
 from app.usecases.transactions.list_transactions import (
     GetOneTransactionUseCase,
     ListTransactionsUseCase,
 )
 
+settings = Settings()  # type: ignore
+
+
+@asynccontextmanager
+async def open_transaction_writer() -> (
+    AsyncIterator[tuple[AdapterTransactionRepo, SqlAlchemyUnitOfWork]]
+):
+    """
+    Opens the group-commit writer on its reserved connection and slot (see `open_writer_session`)
+    """
+    async with open_writer_session() as db:
+        yield AdapterTransactionRepo(session=db), SqlAlchemyUnitOfWork(session=db)
+
+
+transaction_group_commit = (
+    TransactionGroupCommit(
+        open_writer=open_transaction_writer,
+        window_seconds=settings.TRANSACTION_GROUP_COMMIT_WINDOW_SECONDS,
+        max_size=settings.TRANSACTION_GROUP_COMMIT_MAX_SIZE,
+    )
+    if settings.TRANSACTION_GROUP_COMMIT_ENABLED
+    else None
+)
+
+
+def get_transaction_group_commit() -> TransactionGroupCommit | None:
+    return transaction_group_commit
 
-async def get_list_transactions_use_case(db: Session = Depends(get_db)) -> ListTransactionsUseCase:
-    user_repo = AdapterUserRepo(session=db)
+
+def get_transactions_filter(
+    month: Annotated[int | None, Query(alias="month")] = None,
+    year: Annotated[int | None, Query(alias="year")] = None,
+    description: Annotated[str | None, Query(alias="description")] = None,
+    search_mode: Annotated[SearchMode, Query(alias="searchMode")] = SearchMode.CONTAINS,
+    category: Annotated[str | None, Query(alias="category")] = None,
+    type_of_transaction: Annotated[str | None, Query(alias="typeOfTransaction")] = None,
+    status_of_transaction: Annotated[str | None, Query(alias="status")] = None,
+    current_user: JWTPayload = Depends(get_current_user),
+) -> TransactionsFilter:
+    return TransactionsFilter(
+        username=current_user.sub,
+        month=month,
+        year=year,
+        description=description,
+        category=category,
+        type_of_transaction=type_of_transaction,  # type: ignore
+        status_of_transaction=status_of_transaction,  # type: ignore
+        search_mode=search_mode,
+    )
+
+
+async def get_list_transactions_use_case(
+    db: AsyncSession = Depends(get_db),
+) -> ListTransactionsUseCase:
     transaction_repo = AdapterTransactionRepo(session=db)
-    return ListTransactionsUseCase(user_repo=user_repo, transaction_repo=transaction_repo)
+    category_repo = AdapterCategoryRepo(session=db)
+    return ListTransactionsUseCase(
+        transaction_repo=transaction_repo,
+        category_repo=category_repo,
+        category_registry=category_registry,
+    )
 
 
-async def get_one_transactions_use_case(db: Session = Depends(get_db)) -> GetOneTransactionUseCase:
-    user_repo = AdapterUserRepo(session=db)
+async def get_one_transactions_use_case(
+    db: AsyncSession = Depends(get_db),
+) -> GetOneTransactionUseCase:
     transaction_repo = AdapterTransactionRepo(session=db)
-    return GetOneTransactionUseCase(user_repo=user_repo, transaction_repo=transaction_repo)
+    return GetOneTransactionUseCase(transaction_repo=transaction_repo)
 
 
 async def get_create_transaction_use_case(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
+    group_commit: TransactionGroupCommit | None = Depends(get_transaction_group_commit),
 ) -> CreateTransactionUseCase:
-    user_repo = AdapterUserRepo(session=db)
     transaction_repo = AdapterTransactionRepo(session=db)
     category_repo = AdapterCategoryRepo(session=db)
 
     return CreateTransactionUseCase(
-        user_repo=user_repo, transaction_repo=transaction_repo, category_repo=category_repo
+        transaction_repo=transaction_repo,
+        category_repo=category_repo,
+        unit_of_work=unit_of_work,
+        dashboard_cache=dashboard_resume_cache,
+        category_registry=category_registry,
+        group_commit=group_commit,
     )
 
 
-async def get_edit_transaction_use_case(db: Session = Depends(get_db)) -> UpdateTransactionUseCase:
-    user_repo = AdapterUserRepo(session=db)
+async def get_edit_transaction_use_case(
+    db: AsyncSession = Depends(get_db),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
+) -> UpdateTransactionUseCase:
     transaction_repo = AdapterTransactionRepo(session=db)
     category_repo = AdapterCategoryRepo(session=db)
 
     return UpdateTransactionUseCase(
-        user_repo=user_repo, transaction_repo=transaction_repo, category_repo=category_repo
+        transaction_repo=transaction_repo,
+        category_repo=category_repo,
+        unit_of_work=unit_of_work,
+        dashboard_cache=dashboard_resume_cache,
+        category_registry=category_registry,
     )
 
 
 async def get_delete_transaction_use_case(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
 ) -> DeleteTransactionUseCase:
-    user_repo = AdapterUserRepo(session=db)
     transaction_repo = AdapterTransactionRepo(session=db)
 
     return DeleteTransactionUseCase(
-        user_repo=user_repo,
         transaction_repo=transaction_repo,
+        unit_of_work=unit_of_work,
+        dashboard_cache=dashboard_resume_cache,
+    )
+
+
+async def get_import_transactions_use_case(
+    db: AsyncSession = Depends(get_db),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
+) -> ImportTransactionsUseCase:
+    transaction_repo = AdapterTransactionRepo(session=db)
+    category_repo = AdapterCategoryRepo(session=db)
+
+    return ImportTransactionsUseCase(
+        transaction_repo=transaction_repo,
+        category_repo=category_repo,
+        unit_of_work=unit_of_work,
+        chunk_size=settings.IMPORT_CHUNK_SIZE,
+        max_reported_rejections=settings.IMPORT_MAX_REPORTED_REJECTIONS,
+        category_registry=category_registry,
+        dashboard_cache=dashboard_resume_cache,
+    )
+
+
+async def get_export_transactions_use_case(
+    db: AsyncSession = Depends(get_db),
+    open_db: SessionOpener = Depends(get_session_opener),
+) -> ExportTransactionsUseCase:
+    category_repo = AdapterCategoryRepo(session=db)
+
+    @asynccontextmanager
+    async def open_transaction_repo() -> AsyncIterator[AdapterTransactionRepo]:
+        async with open_db() as export_db:
+            yield AdapterTransactionRepo(session=export_db)
+
+    return ExportTransactionsUseCase(
+        open_transaction_repo=open_transaction_repo,
+        batch_size=settings.EXPORT_BATCH_SIZE,
+        category_repo=category_repo,
+        category_registry=category_registry,
+    )
+
+
+async def get_batch_transactions_use_case(
+    db: AsyncSession = Depends(get_db),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
+) -> BatchTransactionsUseCase:
+    transaction_repo = AdapterTransactionRepo(session=db)
+    category_repo = AdapterCategoryRepo(session=db)
+
+    return BatchTransactionsUseCase(
+        transaction_repo=transaction_repo,
+        category_repo=category_repo,
+        unit_of_work=unit_of_work,
+        max_operations=settings.BATCH_MAX_OPERATIONS,
+        category_registry=category_registry,
+        dashboard_cache=dashboard_resume_cache,
     )
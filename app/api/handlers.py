@@ -21,6 +21,8 @@ def get_status_code_by_exception_type(exception_type: ExceptionType) -> int:
             return status.HTTP_404_NOT_FOUND
         case ExceptionType.INTERNAL_SERVER_ERROR:
             return status.HTTP_500_INTERNAL_SERVER_ERROR
+        case ExceptionType.SERVICE_UNAVAILABLE:
+            return status.HTTP_503_SERVICE_UNAVAILABLE
         case _:
             return status.HTTP_500_INTERNAL_SERVER_ERROR
 
@@ -32,7 +34,9 @@ async def domain_exception_handler(request: Request, exc: BaseDomainException):
     # You can map specific exception names to specific status codes if needed
     status_code = get_status_code_by_exception_type(exception_type=exc.type)
 
-    return JSONResponse(status_code=status_code, content={"detail": exc.message})
+    return JSONResponse(
+        status_code=status_code, content={"detail": exc.message}, headers=exc.headers
+    )
 
 
 async def global_500_exception_handler(request: Request, exc: Exception):
@@ -26,6 +26,11 @@ class CreateUserDTO(BaseModel):
 class PublicTokenResponse(BaseModel):
     access_token: str = Field(serialization_alias="accessToken")
     token_type: str = Field(serialization_alias="tokenType")
+    refresh_token: str | None = Field(default=None, serialization_alias="refreshToken")
+
+
+class RefreshTokenDTO(BaseModel):
+    refresh_token: str = Field(alias="refreshToken")
 
 
 class UserPublicResponse(BaseModel):
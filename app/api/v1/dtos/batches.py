@@ -0,0 +1,95 @@
+from collections.abc import Iterator
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
+
+from app.api.v1.dtos.imports import validation_error_reason
+from app.api.v1.dtos.transactions import SaveTransactionRequestDTO, TransactionResponse
+from app.domain.entities.transactions import SaveTransaction
+from app.domain.exceptions.base import BaseDomainException
+from app.domain.value_objects.batches import (
+    BatchItemStatus,
+    BatchOperation,
+    BatchOperationType,
+    BatchRejection,
+)
+from app.infra.configs.settings import Settings
+
+settings = Settings()  # type: ignore
+
+
+class BatchOperationDTO(BaseModel):
+    operation: BatchOperationType = Field(alias="op")
+    transaction_id: int | None = Field(alias="id", default=None)
+    transaction: SaveTransactionRequestDTO | None = None
+
+    @model_validator(mode="after")
+    def validate_operation(self) -> "BatchOperationDTO":
+        if self.operation != BatchOperationType.CREATE and self.transaction_id is None:
+            raise ValueError(f"An id is required to {self.operation} a transaction")
+        if self.operation != BatchOperationType.DELETE and self.transaction is None:
+            raise ValueError(f"A transaction is required to {self.operation} a transaction")
+        return self
+
+
+class BatchTransactionsRequestDTO(BaseModel):
+    operations: list[dict[str, Any]] = Field(
+        max_length=settings.BATCH_MAX_OPERATIONS,
+        description=(
+            'Each one is {"op": "create", "transaction": {...}}, '
+            '{"op": "update", "id": 1, "transaction": {...}} or {"op": "delete", "id": 1}'
+        ),
+    )
+
+
+def validate_batch_operations(
+    operations: list[dict[str, Any]],
+) -> Iterator[BatchOperation | BatchRejection]:
+    """
+    Validates each operation on its own, so one invalid item does not fail the batch
+    """
+    for index, item in enumerate(operations):
+        try:
+            payload = BatchOperationDTO.model_validate(item)
+            transaction = (
+                SaveTransaction(
+                    description=payload.transaction.description,
+                    amount=payload.transaction.amount,
+                    type_of_transaction=payload.transaction.type_of_transaction,
+                    registration_date=payload.transaction.registration_date,
+                    due_date=payload.transaction.due_date,
+                    category=payload.transaction.category,
+                    transaction_status=payload.transaction.transaction_status,
+                )
+                if payload.transaction
+                else None
+            )
+        except ValidationError as error:
+            yield BatchRejection(index=index, reason=validation_error_reason(error))
+        except BaseDomainException as error:
+            yield BatchRejection(index=index, reason=error.message)
+        except ValueError as error:
+            yield BatchRejection(index=index, reason=str(error))
+        else:
+            yield BatchOperation(
+                index=index,
+                operation=payload.operation,
+                transaction_id=payload.transaction_id,
+                transaction=transaction,
+            )
+
+
+class BatchItemResponse(BaseModel):
+    index: int
+    status: BatchItemStatus
+    transaction_id: int | None = Field(serialization_alias="id", default=None)
+    transaction: TransactionResponse | None = None
+    error: str | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BatchTransactionsResponse(BaseModel):
+    results: list[BatchItemResponse]
+
+    model_config = ConfigDict(from_attributes=True)
@@ -12,27 +12,50 @@ class DashboardResponse(BaseModel):
     yearly_revenues: Decimal = Field(serialization_alias="yearlyRevenues")
     yearly_expenses: Decimal = Field(serialization_alias="yearlyExpenses")
     yearly_balance: Decimal = Field(serialization_alias="yearlyBalance")
-
-    @field_serializer("monthly_revenues")
-    def serialize_monthly_revenues(self, amount: Decimal) -> str:
-        return format_decimal_to_brl_format(amount=amount)
-
-    @field_serializer("monthly_expenses")
-    def serialize_monthly_expenses(self, amount: Decimal) -> str:
-        return format_decimal_to_brl_format(amount=amount)
-
-    @field_serializer("monthly_balance")
-    def serialize_monthly_balance(self, amount: Decimal) -> str:
-        return format_decimal_to_brl_format(amount=amount)
-
-    @field_serializer("yearly_revenues")
-    def serialize_yearly_revenues(self, amount: Decimal) -> str:
-        return format_decimal_to_brl_format(amount=amount)
-
-    @field_serializer("yearly_expenses")
-    def serialize_yearly_expenses(self, amount: Decimal) -> str:
-        return format_decimal_to_brl_format(amount=amount)
-
-    @field_serializer("yearly_balance")
-    def serialize_yearly_balance(self, amount: Decimal) -> str:
+    previous_monthly_revenues: Decimal = Field(serialization_alias="previousMonthlyRevenues")
+    previous_monthly_expenses: Decimal = Field(serialization_alias="previousMonthlyExpenses")
+    previous_monthly_balance: Decimal = Field(serialization_alias="previousMonthlyBalance")
+    previous_yearly_revenues: Decimal = Field(serialization_alias="previousYearlyRevenues")
+    previous_yearly_expenses: Decimal = Field(serialization_alias="previousYearlyExpenses")
+    previous_yearly_balance: Decimal = Field(serialization_alias="previousYearlyBalance")
+    trailing_twelve_months_revenues: Decimal = Field(
+        serialization_alias="trailingTwelveMonthsRevenues"
+    )
+    trailing_twelve_months_expenses: Decimal = Field(
+        serialization_alias="trailingTwelveMonthsExpenses"
+    )
+    trailing_twelve_months_balance: Decimal = Field(
+        serialization_alias="trailingTwelveMonthsBalance"
+    )
+    monthly_revenues_delta: Decimal = Field(serialization_alias="monthlyRevenuesDelta")
+    monthly_expenses_delta: Decimal = Field(serialization_alias="monthlyExpensesDelta")
+    monthly_balance_delta: Decimal = Field(serialization_alias="monthlyBalanceDelta")
+    yearly_revenues_delta: Decimal = Field(serialization_alias="yearlyRevenuesDelta")
+    yearly_expenses_delta: Decimal = Field(serialization_alias="yearlyExpensesDelta")
+    yearly_balance_delta: Decimal = Field(serialization_alias="yearlyBalanceDelta")
+
+    @field_serializer(
+        "monthly_revenues",
+        "monthly_expenses",
+        "monthly_balance",
+        "yearly_revenues",
+        "yearly_expenses",
+        "yearly_balance",
+        "previous_monthly_revenues",
+        "previous_monthly_expenses",
+        "previous_monthly_balance",
+        "previous_yearly_revenues",
+        "previous_yearly_expenses",
+        "previous_yearly_balance",
+        "trailing_twelve_months_revenues",
+        "trailing_twelve_months_expenses",
+        "trailing_twelve_months_balance",
+        "monthly_revenues_delta",
+        "monthly_expenses_delta",
+        "monthly_balance_delta",
+        "yearly_revenues_delta",
+        "yearly_expenses_delta",
+        "yearly_balance_delta",
+    )
+    def serialize_amount(self, amount: Decimal) -> str:
         return format_decimal_to_brl_format(amount=amount)
@@ -0,0 +1,59 @@
+from collections.abc import Iterable, Iterator
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from app.api.v1.dtos.transactions import SaveTransactionRequestDTO
+from app.domain.entities.transactions import SaveTransaction
+from app.domain.exceptions.base import BaseDomainException
+from app.domain.value_objects.imports import ImportRejection, ImportRow
+
+
+def validation_error_reason(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(location) for location in detail['loc']) or 'row'}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+def validate_import_rows(
+    rows: Iterable[tuple[int, dict[str, str | None]]],
+) -> Iterator[ImportRow | ImportRejection]:
+    """
+    Validates each parsed row like the body of `POST /transactions/`
+    """
+    for line_number, row in rows:
+        try:
+            payload = SaveTransactionRequestDTO.model_validate(row)
+            transaction = SaveTransaction(
+                description=payload.description,
+                amount=payload.amount,
+                type_of_transaction=payload.type_of_transaction,
+                registration_date=payload.registration_date,
+                due_date=payload.due_date,
+                category=payload.category,
+                transaction_status=payload.transaction_status,
+            )
+        except ValidationError as error:
+            yield ImportRejection(line_number=line_number, reason=validation_error_reason(error))
+        except BaseDomainException as error:
+            yield ImportRejection(line_number=line_number, reason=error.message)
+        except ValueError as error:
+            yield ImportRejection(line_number=line_number, reason=str(error))
+        else:
+            yield ImportRow(line_number=line_number, transaction=transaction)
+
+
+class ImportRejectionResponse(BaseModel):
+    line_number: int = Field(serialization_alias="line")
+    reason: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ImportSummaryResponse(BaseModel):
+    inserted: int
+    duplicates: int
+    rejected: int
+    rejections: list[ImportRejectionResponse]
+
+    model_config = ConfigDict(from_attributes=True)
@@ -2,17 +2,23 @@ from typing import Generic, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.domain.value_objects.pagination import CountStrategy
+
 T = TypeVar("T")
 
 
 class Pagination(BaseModel, Generic[T]):
     items: list[T]
     page: int
-    total_count: int = Field(alias="totalItems")
-    total_of_pages: int = Field(alias="totalOfPages")
+    total_count: int | None = Field(alias="totalItems")
+    total_of_pages: int | None = Field(alias="totalOfPages")
     items_per_page: int = Field(alias="itemsPerPage")
     prev: int | None
     next_page: int | None = Field(alias="next")
+    next_cursor: str | None = Field(alias="nextCursor", default=None)
+    prev_cursor: str | None = Field(alias="prevCursor", default=None)
+    count_strategy: CountStrategy = Field(alias="countStrategy", default=CountStrategy.EXACT)
+    has_next: bool = Field(alias="hasNext", default=False)
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -1,6 +1,7 @@
 from http import HTTPStatus
+from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
 from app.api.dependencies.base import get_current_user, get_pagination_params
 from app.api.dependencies.categories import (
@@ -17,7 +18,7 @@ from app.api.v1.dtos.categories import (
     UpdatePartialCategoryDTO,
 )
 from app.domain.entities.categories import PartialUpdateCategory, SaveCategory
-from app.domain.value_objects.pagination import PaginationParams
+from app.domain.value_objects.pagination import CountStrategy, PaginationParams
 from app.usecases.categories.delete_category import DeleteCategoryUseCase
 from app.usecases.categories.list_categories import GetOneCategoryUseCase, ListCategoriesUseCase
 from app.usecases.categories.persist_category import CreateCategoryUseCase, UpdateCategoryUseCase
@@ -35,9 +36,10 @@ categories_router = APIRouter(
 )
 async def get_all_categories(
     pagination: PaginationParams = Depends(get_pagination_params),
+    count_strategy: Annotated[CountStrategy, Query(alias="countStrategy")] = CountStrategy.EXACT,
     use_case: ListCategoriesUseCase = Depends(get_list_categories_use_case),
 ):
-    return await use_case.execute(pagination=pagination)
+    return await use_case.execute(pagination=pagination, count_strategy=count_strategy)
 
 
 @categories_router.get(
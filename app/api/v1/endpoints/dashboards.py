@@ -1,8 +1,9 @@
 from http import HTTPStatus
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Query
 
+from app.api.dependencies.auth import get_current_user_id
 from app.api.dependencies.base import get_current_user
 from app.api.dependencies.dashboards import get_dashboard_resume_use_case
 from app.api.v1.dtos.dashboard import DashboardResponse
@@ -20,10 +21,9 @@ dashboard_router = APIRouter(
     status_code=HTTPStatus.OK,
 )
 async def get_dashboard_resume(
-    request: Request,
     month: Annotated[int | None, Query()] = None,
     year: Annotated[int | None, Query()] = None,
     use_case: DashboardResumeUseCase = Depends(get_dashboard_resume_use_case),
+    user_id: int = Depends(get_current_user_id),
 ):
-    current_user = request.state.user
-    return await use_case.execute(username=current_user.sub, month=month, year=year)
+    return await use_case.execute(user_id=user_id, month=month, year=year)
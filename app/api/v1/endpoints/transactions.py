@@ -1,26 +1,47 @@
+import io
 from http import HTTPStatus
-from typing import Annotated
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Query, UploadFile
+from fastapi.responses import StreamingResponse
 
+from app.api.dependencies.auth import get_current_user_id
 from app.api.dependencies.base import get_current_user
 from app.api.dependencies.transactions import (
+    get_batch_transactions_use_case,
     get_create_transaction_use_case,
     get_delete_transaction_use_case,
     get_edit_transaction_use_case,
+    get_export_transactions_use_case,
+    get_import_transactions_use_case,
     get_list_transactions_use_case,
     get_one_transactions_use_case,
+    get_transactions_filter,
 )
+from app.api.v1.dtos.batches import (
+    BatchTransactionsRequestDTO,
+    BatchTransactionsResponse,
+    validate_batch_operations,
+)
+from app.api.v1.dtos.imports import ImportSummaryResponse, validate_import_rows
 from app.api.v1.dtos.transactions import (
     PaginatedTransactions,
     SaveTransactionRequestDTO,
     TransactionResponse,
 )
 from app.domain.entities.transactions import SaveTransaction
+from app.domain.value_objects.exports import ExportFormat
+from app.domain.value_objects.imports import ImportFormat
+from app.domain.value_objects.pagination import CountStrategy, PaginationMode
 from app.domain.value_objects.transactions import TransactionsFilter
+from app.infra.exports.encoders import EXPORT_MEDIA_TYPES, encode_export
+from app.infra.imports.parsers import read_statement
+from app.usecases.transactions.batch_transactions import BatchTransactionsUseCase
 from app.usecases.transactions.create_transaction import CreateTransactionUseCase
 from app.usecases.transactions.delete_transaction import DeleteTransactionUseCase
 from app.usecases.transactions.edit_transaction import UpdateTransactionUseCase
+from app.usecases.transactions.export_transactions import ExportTransactionsUseCase
+from app.usecases.transactions.import_transactions import ImportTransactionsUseCase
 from app.usecases.transactions.list_transactions import (
     GetOneTransactionUseCase,
     ListTransactionsUseCase,
@@ -38,33 +59,44 @@ transactions_router = APIRouter(
     status_code=HTTPStatus.OK,
 )
 async def get_all_transactions(
-    request: Request,
-    month: Annotated[int | None, Query(alias="month")] = None,
-    year: Annotated[int | None, Query(alias="year")] = None,
-    description: Annotated[str | None, Query(alias="description")] = None,
-    category: Annotated[str | None, Query(alias="category")] = None,
-    type_of_transaction: Annotated[str | None, Query(alias="typeOfTransaction")] = None,
-    status_of_transaction: Annotated[str | None, Query(alias="status")] = None,
+    filters: TransactionsFilter = Depends(get_transactions_filter),
     items_per_page: Annotated[int, Query(alias="itemsPerPage")] = 10,
     page: Annotated[int, Query(alias="page")] = 1,
+    pagination_mode: Annotated[PaginationMode, Query(alias="paginationMode")] = PaginationMode.PAGE,
+    cursor: Annotated[str | None, Query(alias="cursor")] = None,
+    count_strategy: Annotated[CountStrategy, Query(alias="countStrategy")] = CountStrategy.EXACT,
     use_case: ListTransactionsUseCase = Depends(get_list_transactions_use_case),
+    user_id: int = Depends(get_current_user_id),
 ):
-    current_user = request.state.user
-
-    filters = TransactionsFilter(
-        username=current_user.sub,
-        month=month,
-        year=year,
-        description=description,
-        category=category,
-        type_of_transaction=type_of_transaction,  # type: ignore
-        status_of_transaction=status_of_transaction,  # type: ignore
-    )
-
     return await use_case.execute(
+        user_id=user_id,
         filters=filters,
         page=page,
         page_size=items_per_page,
+        pagination_mode=pagination_mode,
+        cursor=cursor,
+        count_strategy=count_strategy,
+    )
+
+
+@transactions_router.get(
+    path="/export",
+    response_class=StreamingResponse,
+    status_code=HTTPStatus.OK,
+)
+async def export_transactions(
+    filters: TransactionsFilter = Depends(get_transactions_filter),
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.CSV,
+    use_case: ExportTransactionsUseCase = Depends(get_export_transactions_use_case),
+    user_id: int = Depends(get_current_user_id),
+):
+    batches = await use_case.execute(user_id=user_id, filters=filters)
+    return StreamingResponse(
+        content=encode_export(batches=batches, export_format=export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="transactions.{export_format.value}"'
+        },
     )
 
 
@@ -74,15 +106,13 @@ async def get_all_transactions(
     status_code=HTTPStatus.OK,
 )
 async def fetch_one_transaction(
-    request: Request,
     transaction_id: int,
     use_case: GetOneTransactionUseCase = Depends(get_one_transactions_use_case),
+    user_id: int = Depends(get_current_user_id),
 ):
-    current_user = request.state.user
-
     return await use_case.execute(
         transaction_id=transaction_id,
-        username=current_user.sub,
+        user_id=user_id,
     )
 
 
@@ -92,11 +122,10 @@ async def fetch_one_transaction(
     status_code=HTTPStatus.CREATED,
 )
 async def create_transaction(
-    request: Request,
     payload: SaveTransactionRequestDTO,
     use_case: CreateTransactionUseCase = Depends(get_create_transaction_use_case),
+    user_id: int = Depends(get_current_user_id),
 ):
-    current_user = request.state.user
     new_transaction = SaveTransaction(
         description=payload.description,
         amount=payload.amount,
@@ -109,22 +138,60 @@ async def create_transaction(
 
     return await use_case.execute(
         new_transaction=new_transaction,
-        username=current_user.sub,
+        user_id=user_id,
     )
 
 
+@transactions_router.post(
+    path="/import",
+    response_model=ImportSummaryResponse,
+    status_code=HTTPStatus.OK,
+)
+async def import_transactions(
+    file: UploadFile,
+    import_format: Annotated[ImportFormat, Query(alias="format")] = ImportFormat.CSV,
+    category: Annotated[
+        str | None, Query(alias="category", description="Category of every OFX entry")
+    ] = None,
+    encoding: Annotated[
+        Literal["utf-8-sig", "cp1252", "latin-1"], Query(alias="encoding")
+    ] = "utf-8-sig",
+    use_case: ImportTransactionsUseCase = Depends(get_import_transactions_use_case),
+    user_id: int = Depends(get_current_user_id),
+):
+    lines = io.TextIOWrapper(file.file, encoding=encoding, errors="replace", newline="")
+    rows = read_statement(lines=lines, import_format=import_format, category=category)
+    return await use_case.execute(user_id=user_id, rows=validate_import_rows(rows=rows))
+
+
+@transactions_router.post(
+    path="/batch",
+    response_model=BatchTransactionsResponse,
+    status_code=HTTPStatus.OK,
+)
+async def batch_transactions(
+    payload: BatchTransactionsRequestDTO,
+    use_case: BatchTransactionsUseCase = Depends(get_batch_transactions_use_case),
+    user_id: int = Depends(get_current_user_id),
+):
+    results = await use_case.execute(
+        user_id=user_id,
+        operations=list(validate_batch_operations(operations=payload.operations)),
+    )
+    return BatchTransactionsResponse(results=results)  # type: ignore
+
+
 @transactions_router.put(
     path="/{transaction_id}",
     response_model=TransactionResponse,
     status_code=HTTPStatus.OK,
 )
 async def update_transaction(
-    request: Request,
     transaction_id: int,
     payload: SaveTransactionRequestDTO,
     use_case: UpdateTransactionUseCase = Depends(get_edit_transaction_use_case),
+    user_id: int = Depends(get_current_user_id),
 ):
-    current_user = request.state.user
     edit_transaction = SaveTransaction(
         description=payload.description,
         amount=payload.amount,
@@ -138,7 +205,7 @@ async def update_transaction(
     return await use_case.execute(
         transaction_id=transaction_id,
         edit_transaction=edit_transaction,
-        username=current_user.sub,
+        user_id=user_id,
     )
 
 
@@ -147,13 +214,11 @@ async def update_transaction(
     status_code=HTTPStatus.NO_CONTENT,
 )
 async def delete_transaction(
-    request: Request,
     transaction_id: int,
     use_case: DeleteTransactionUseCase = Depends(get_delete_transaction_use_case),
+    user_id: int = Depends(get_current_user_id),
 ):
-    current_user = request.state.user
-
     return await use_case.execute(
         transaction_id=transaction_id,
-        username=current_user.sub,
+        user_id=user_id,
     )
@@ -1,11 +1,19 @@
 from http import HTTPStatus
+from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 
-from app.api.dependencies.auth import get_login_use_case, get_sign_up_use_case
+from app.api.dependencies.admission import admitted_by, login_admission, register_admission
+from app.api.dependencies.auth import (
+    get_login_use_case,
+    get_refresh_access_token_use_case,
+    get_revoke_refresh_token_use_case,
+    get_sign_up_use_case,
+)
 from app.api.v1.dtos.auth import (
     CreateUserDTO,
     PublicTokenResponse,
+    RefreshTokenDTO,
     UserCredentialsDTO,
     UserPublicResponse,
 )
@@ -13,12 +21,16 @@ from app.domain.entities.users import SignUpUser
 from app.domain.value_objects.auth import LoginCredentials
 from app.usecases.auth.create_user import SignUpUseCase
 from app.usecases.auth.login import LoginUseCase
+from app.usecases.auth.refresh_token import RefreshAccessTokenUseCase, RevokeRefreshTokenUseCase
 
 users_router = APIRouter(prefix="/users")
 
 
 @users_router.post(
-    path="/register", response_model=UserPublicResponse, status_code=HTTPStatus.CREATED
+    path="/register",
+    response_model=UserPublicResponse,
+    status_code=HTTPStatus.CREATED,
+    dependencies=[Depends(admitted_by(register_admission))],
 )
 async def create_user(
     new_user: CreateUserDTO, use_case: SignUpUseCase = Depends(get_sign_up_use_case)
@@ -31,10 +43,35 @@ async def create_user(
     return await use_case.execute(create_user=sign_up)
 
 
-@users_router.post(path="/login", response_model=PublicTokenResponse, status_code=HTTPStatus.OK)
+@users_router.post(
+    path="/login",
+    response_model=PublicTokenResponse,
+    status_code=HTTPStatus.OK,
+    dependencies=[Depends(admitted_by(login_admission))],
+)
 async def login(
     user_credentials: UserCredentialsDTO,
     use_case: LoginUseCase = Depends(get_login_use_case),
 ):
     user = LoginCredentials(username=user_credentials.username, password=user_credentials.password)
     return await use_case.execute(credentials=user)
+
+
+@users_router.post(
+    path="/token/refresh", response_model=PublicTokenResponse, status_code=HTTPStatus.OK
+)
+async def refresh_access_token(
+    payload: RefreshTokenDTO,
+    use_case: RefreshAccessTokenUseCase = Depends(get_refresh_access_token_use_case),
+):
+    return await use_case.execute(refresh_token=payload.refresh_token)
+
+
+@users_router.post(path="/token/revoke", status_code=HTTPStatus.NO_CONTENT)
+async def revoke_refresh_token(
+    payload: RefreshTokenDTO,
+    authorization: Annotated[str | None, Header()] = None,
+    use_case: RevokeRefreshTokenUseCase = Depends(get_revoke_refresh_token_use_case),
+):
+    access_token = authorization.split()[-1] if authorization else None
+    return await use_case.execute(refresh_token=payload.refresh_token, access_token=access_token)
@@ -0,0 +1,16 @@
+from typing import Any, Protocol
+
+
+class AbstractCacheBackend(Protocol):
+    """
+    Key/value store for cached use case results
+
+    Values are domain value objects; a backend that leaves the process has
+    to serialize them.
+    """
+
+    async def get(self, key: str) -> Any | None: ...
+
+    async def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None: ...
+
+    async def delete(self, *keys: str) -> None: ...
@@ -1,10 +1,22 @@
+from collections.abc import AsyncIterator, Sequence
 from datetime import date
 from typing import Any, Protocol
 
 from app.domain.entities.categories import CategoryEntity, PartialUpdateCategory
+from app.domain.entities.transactions import SaveTransaction, TransactionEntity
 from app.domain.entities.users import UserEntity
-from app.domain.value_objects.auth import SavedUser, UserLogin
-from app.domain.value_objects.dashboard import DashboardValues
+from app.domain.value_objects.auth import (
+    RefreshTokenGrant,
+    RefreshTokenRecord,
+    SavedUser,
+    UserLogin,
+)
+from app.domain.value_objects.batches import BatchWrite
+from app.domain.value_objects.dashboard import DashboardPeriod, DashboardValues
+from app.domain.value_objects.exports import ExportedTransaction
+from app.domain.value_objects.imports import ImportedChunk
+from app.domain.value_objects.pagination import CountStrategy, TransactionCursor
+from app.domain.value_objects.transactions import TransactionsFilter
 
 
 class AbstractRepository(Protocol):
@@ -12,47 +24,110 @@ class AbstractRepository(Protocol):
 
 
 class AbstractTransactionRepository(AbstractRepository):
-    def fetch_all(self, *args, **kwargs) -> Any: ...
+    async def fetch_all(self, *args, **kwargs) -> Any: ...
 
-    def fetch_one(self, *args, **kwargs) -> Any: ...
+    async def fetch_all_by_cursor(
+        self,
+        user_id: int,
+        filters: TransactionsFilter,
+        page_size: int,
+        cursor: TransactionCursor | None = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> tuple[list[TransactionEntity], int | None, bool]: ...
+
+    def stream_all(
+        self, user_id: int, filters: TransactionsFilter, batch_size: int
+    ) -> AsyncIterator[list[ExportedTransaction]]: ...
 
-    def save(self, *args, **kwargs) -> Any: ...
+    async def fetch_one_for_user(
+        self, transaction_id: int, user_id: int
+    ) -> TransactionEntity | None: ...
 
-    def update(self, *args, **kwargs) -> Any: ...
+    async def save(
+        self, new_transaction: SaveTransaction, user_id: int, category_id: int
+    ) -> TransactionEntity: ...
 
-    def delete(self, *args, **kwargs) -> Any: ...
+    async def save_many(
+        self, new_transactions: Sequence[tuple[SaveTransaction, int, int]]
+    ) -> list[TransactionEntity | None]: ...
 
-    def exists(self, transaction_id: int) -> bool: ...
+    async def bulk_save(
+        self, new_transactions: Sequence[tuple[SaveTransaction, int]], user_id: int
+    ) -> ImportedChunk: ...
+
+    async def apply_batch(
+        self,
+        user_id: int,
+        creates: Sequence[tuple[SaveTransaction, int]],
+        updates: Sequence[tuple[int, SaveTransaction, int]],
+        deletes: Sequence[int],
+    ) -> BatchWrite: ...
 
-    def get_sum_of_transactions_by_interval(
+    async def update(
+        self,
+        transaction_id: int,
+        edit_transaction: SaveTransaction,
+        category_id: int,
+        user_id: int,
+    ) -> tuple[TransactionEntity, TransactionEntity]: ...
+
+    async def delete(self, transaction_id: int, user_id: int) -> TransactionEntity: ...
+
+    async def get_sum_of_transactions_by_interval(
         self,
         user_id: int,
         start_date: date,
         end_date: date,
     ) -> DashboardValues: ...
 
+    async def get_sums_by_periods(
+        self,
+        user_id: int,
+        periods: Sequence[DashboardPeriod],
+    ) -> dict[str, DashboardValues]: ...
+
 
 class AbstractUserRepository(AbstractRepository):
-    def get_user_id_by_username(self, username: str) -> int | None: ...
+    async def get_user_id_by_username(self, username: str) -> int | None: ...
+
+    async def save(self, user: UserEntity) -> SavedUser: ...
+
+    async def get_user_password_by_id(self, user_id: int) -> UserLogin: ...
+
+    async def user_already_exists(self, username: str, email: str) -> bool: ...
 
-    def save(self, user: UserEntity) -> SavedUser: ...
+    async def update_password_hash(self, user_id: int, password_hash: bytes) -> None: ...
 
-    def get_user_password_by_id(self, user_id: int) -> UserLogin: ...
 
-    def user_already_exists(self, username: str, email: str) -> bool: ...
+class AbstractRefreshTokenRepository(AbstractRepository):
+    async def save(
+        self, user_id: int, grant: RefreshTokenGrant, family_id: str | None = None
+    ) -> None: ...
+
+    async def get_unexpired_by_hash(self, token_hash: bytes) -> RefreshTokenRecord | None: ...
+
+    async def rotate(self, current: RefreshTokenRecord, grant: RefreshTokenGrant) -> None: ...
+
+    async def revoke_family(self, family_id: str) -> None: ...
 
 
 class AbstractCategoryRepository(AbstractRepository):
-    def get_category_id_by_name(self, name: str) -> int: ...
+    async def get_category_id_by_name(self, name: str) -> int: ...
+
+    async def get_category_by_id(self, category_id: int) -> CategoryEntity | None: ...
+
+    async def fetch_every_category(self) -> list[CategoryEntity]: ...
 
-    def get_category_by_id(self, category_id: int) -> CategoryEntity | None: ...
+    async def get_categories_version(self) -> str: ...
 
-    def save(self, *args, **kwargs) -> Any: ...
+    async def save(self, *args, **kwargs) -> Any: ...
 
-    def fetch_all(self, *args, **kwargs) -> Any: ...
+    async def fetch_all(self, *args, **kwargs) -> Any: ...
 
-    def fetch_one(self, *args, **kwargs) -> Any: ...
+    async def fetch_one(self, *args, **kwargs) -> Any: ...
 
-    def update(self, category_id: int, edit_category: PartialUpdateCategory) -> CategoryEntity: ...
+    async def update(
+        self, category_id: int, edit_category: PartialUpdateCategory
+    ) -> CategoryEntity: ...
 
-    def delete(self, category_id: int) -> None: ...
+    async def delete(self, category_id: int) -> None: ...
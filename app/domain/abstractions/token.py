@@ -1,14 +1,26 @@
 from abc import ABC, abstractmethod
 from datetime import timedelta
 
-from app.domain.value_objects.auth import JWTPayload, PublicToken
+from app.domain.value_objects.auth import JWTPayload, PublicToken, RefreshTokenGrant
 
 
 class TokenProviderAbstraction(ABC):
     @abstractmethod
     def encode_token(
-        self, username: str, token_expiration: timedelta | None = None
+        self,
+        username: str,
+        token_expiration: timedelta | None = None,
+        user_id: int | None = None,
     ) -> PublicToken: ...
 
     @abstractmethod
     def decode_token(self, *args, **kwargs) -> JWTPayload: ...
+
+    @abstractmethod
+    def encode_refresh_token(self) -> RefreshTokenGrant: ...
+
+    @abstractmethod
+    def hash_refresh_token(self, refresh_token: str) -> bytes: ...
+
+    @abstractmethod
+    def revoke_token(self, token: str) -> None: ...
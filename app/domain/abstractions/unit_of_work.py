@@ -0,0 +1,22 @@
+from contextlib import AbstractAsyncContextManager
+from typing import Protocol
+
+
+class AbstractUnitOfWork(Protocol):
+    """
+    The transaction shared by the repositories of a request
+
+    Repositories only stage their writes; the use case commits once, when all
+    of them succeeded. Whatever is not committed is rolled back when the
+    request ends.
+    """
+
+    async def commit(self) -> None: ...
+
+    async def rollback(self) -> None: ...
+
+    def savepoint(self) -> AbstractAsyncContextManager[None]:
+        """
+        Rolls back only the writes made inside it when it exits with an error
+        """
+        ...
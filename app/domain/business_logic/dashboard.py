@@ -0,0 +1,58 @@
+from datetime import date
+
+from dateutil.relativedelta import relativedelta
+
+from app.domain.value_objects.dashboard import DashboardPeriod
+
+
+def get_monthly_interval(month: int, year: int) -> tuple[date, date]:
+    first_day_of_month = date(year=year, month=month, day=1)
+    last_day_of_month = first_day_of_month + relativedelta(months=1) - relativedelta(days=1)
+    return first_day_of_month, last_day_of_month
+
+
+def get_yearly_interval(year: int) -> tuple[date, date]:
+    return date(year=year, month=1, day=1), date(year=year, month=12, day=31)
+
+
+def build_dashboard_periods(month: int, year: int) -> list[DashboardPeriod]:
+    """
+    Every period the dashboard of `month`/`year` reports on
+    """
+    first_day_of_month, last_day_of_month = get_monthly_interval(month=month, year=year)
+    first_day_of_year, last_day_of_year = get_yearly_interval(year=year)
+    first_day_of_previous_year, last_day_of_previous_year = get_yearly_interval(year=year - 1)
+    return [
+        DashboardPeriod(name="month", start_date=first_day_of_month, end_date=last_day_of_month),
+        DashboardPeriod(name="year", start_date=first_day_of_year, end_date=last_day_of_year),
+        DashboardPeriod(
+            name="previous_month",
+            start_date=first_day_of_month - relativedelta(months=1),
+            end_date=first_day_of_month - relativedelta(days=1),
+        ),
+        DashboardPeriod(
+            name="previous_year",
+            start_date=first_day_of_previous_year,
+            end_date=last_day_of_previous_year,
+        ),
+        DashboardPeriod(
+            name="trailing_twelve_months",
+            start_date=first_day_of_month - relativedelta(months=11),
+            end_date=last_day_of_month,
+        ),
+    ]
+
+
+def dashboards_covering(day: date) -> list[tuple[int, int]]:
+    """
+    (month, year) of every dashboard with `day` inside one of its periods
+    """
+    return [
+        (month, year)
+        for year in (day.year, day.year + 1)
+        for month in range(1, 13)
+        if any(
+            period.start_date <= day <= period.end_date
+            for period in build_dashboard_periods(month=month, year=year)
+        )
+    ]
@@ -0,0 +1,33 @@
+import base64
+import binascii
+import json
+from datetime import date
+
+from app.domain.exceptions.pagination import InvalidCursorException
+from app.domain.value_objects.pagination import CursorDirection, TransactionCursor
+
+
+def encode_transaction_cursor(cursor: TransactionCursor) -> str:
+    """
+    An undated row is encoded with a null date
+    """
+    payload = {
+        "d": cursor.registration_date.isoformat() if cursor.registration_date else None,
+        "id": cursor.transaction_id,
+        "dir": cursor.direction.value,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_transaction_cursor(cursor: str) -> TransactionCursor:
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        return TransactionCursor(
+            registration_date=date.fromisoformat(payload["d"]) if payload["d"] else None,
+            transaction_id=int(payload["id"]),
+            direction=CursorDirection(payload["dir"]),
+        )
+    except (binascii.Error, ValueError, KeyError, TypeError) as error:
+        raise InvalidCursorException(message=f"Invalid pagination cursor: {cursor}") from error
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Generic, TypeVar
 
+from app.domain.value_objects.pagination import CountStrategy
+
 T = TypeVar("T")
 
 
@@ -8,18 +10,30 @@ T = TypeVar("T")
 class PagedResponse(Generic[T]):
     items: list[T]
     page: int
-    total_count: int
+    total_count: int | None
     items_per_page: int
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+    count_strategy: CountStrategy = CountStrategy.EXACT
+    more_items: bool | None = None
 
     @property
-    def total_of_pages(self) -> int:
+    def total_of_pages(self) -> int | None:
+        if self.total_count is None:
+            return None
         if self.total_count == 0:
             return 1
         return (self.total_count + self.items_per_page - 1) // self.items_per_page
 
+    @property
+    def has_next(self) -> bool:
+        if self.more_items is not None:
+            return self.more_items
+        return self.total_of_pages is not None and self.page < self.total_of_pages
+
     @property
     def next_page(self) -> int | None:
-        if self.page < self.total_of_pages:
+        if self.has_next:
             return self.page + 1
         return None
 
@@ -2,10 +2,11 @@ from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
 
+from app.domain.business_logic.validators import due_date_validator, status_validator
 from app.domain.value_objects.transactions import TransactionStatus, TypeOfTransaction
 
 
-@dataclass()
+@dataclass(frozen=True, slots=True)
 class TransactionEntity:
     transaction_id: int
     description: str
@@ -31,3 +32,13 @@ class SaveTransaction:
     def __post_init__(self):
         if self.type_of_transaction == TypeOfTransaction.EXPENSE.value and not self.due_date:
             raise ValueError("Due date is required for expense transactions")
+        # the same rules as the ORM validators, which statements written with Core skip
+        status_validator(
+            type_of_transaction=self.type_of_transaction, value=self.transaction_status
+        )
+        due_date_validator(
+            registration_date=self.registration_date,
+            type_of_transaction=self.type_of_transaction,
+            due_date=self.due_date,
+            value=self.due_date,
+        )
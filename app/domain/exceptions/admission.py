@@ -0,0 +1,11 @@
+from app.domain.exceptions.base import BaseDomainException, ExceptionType
+
+
+class ServiceOverloadedException(BaseDomainException):
+    def __init__(self, message: str, retry_after_seconds: int) -> None:
+        super().__init__(
+            message=message,
+            name="ServiceOverloaded",
+            type=ExceptionType.SERVICE_UNAVAILABLE,
+            headers={"Retry-After": str(retry_after_seconds)},
+        )
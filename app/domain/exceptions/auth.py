@@ -28,3 +28,12 @@ class TokenExpiredException(BaseDomainException):
 class PasswordsDontMatchException(BaseDomainException):
     def __init__(self, message: str) -> None:
         super().__init__(message=message, name="PasswordsDontMatch", type=ExceptionType.BAD_REQUEST)
+
+
+class PasswordHashingUnavailableException(BaseDomainException):
+    def __init__(self, message: str) -> None:
+        super().__init__(
+            message=message,
+            name="PasswordHashingUnavailable",
+            type=ExceptionType.SERVICE_UNAVAILABLE,
+        )
@@ -7,11 +7,19 @@ class ExceptionType(StrEnum):
     FORBIDDEN = auto()
     NOT_FOUND = auto()
     INTERNAL_SERVER_ERROR = auto()
+    SERVICE_UNAVAILABLE = auto()
 
 
 class BaseDomainException(Exception):
-    def __init__(self, message: str, name: str, type: ExceptionType):
+    def __init__(
+        self,
+        message: str,
+        name: str,
+        type: ExceptionType,
+        headers: dict[str, str] | None = None,
+    ):
         self.message = message
         self.name = name
         self.type = type
+        self.headers = headers
         super().__init__(self.message)
@@ -0,0 +1,6 @@
+from app.domain.exceptions.base import BaseDomainException, ExceptionType
+
+
+class InvalidCursorException(BaseDomainException):
+    def __init__(self, message: str = "Invalid pagination cursor") -> None:
+        super().__init__(message=message, name="InvalidCursor", type=ExceptionType.BAD_REQUEST)
@@ -35,3 +35,15 @@ class InvalidFormatCurrencyException(BaseDomainException):
 class DueDateNotProvidedException(BaseDomainException):
     def __init__(self, message: str) -> None:
         super().__init__(message=message, name="DueDateNotProvided", type=ExceptionType.BAD_REQUEST)
+
+
+class ImportCategoryNotProvidedException(BaseDomainException):
+    def __init__(self, message: str) -> None:
+        super().__init__(
+            message=message, name="ImportCategoryNotProvided", type=ExceptionType.BAD_REQUEST
+        )
+
+
+class BatchTooLargeException(BaseDomainException):
+    def __init__(self, message: str) -> None:
+        super().__init__(message=message, name="BatchTooLarge", type=ExceptionType.BAD_REQUEST)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 from enum import StrEnum, auto
 
 
@@ -24,15 +25,33 @@ class UserLogin:
 class PublicToken:
     access_token: str
     token_type: str
+    refresh_token: str | None = None
 
 
 @dataclass(frozen=True)
 class JWTPayload:
     sub: str
     exp: int
+    uid: int | None = None
 
 
 @dataclass(frozen=True)
 class SavedUser:
     username: str
     email: str
+
+
+@dataclass(frozen=True)
+class RefreshTokenGrant:
+    token: str
+    token_hash: bytes
+    expires_at: datetime
+
+
+@dataclass(frozen=True)
+class RefreshTokenRecord:
+    refresh_token_id: int
+    user_id: int
+    username: str
+    family_id: str
+    revoked: bool
@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+from datetime import date
+from enum import StrEnum
+
+from app.domain.entities.transactions import SaveTransaction, TransactionEntity
+
+
+class BatchOperationType(StrEnum):
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+class BatchItemStatus(StrEnum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    INVALID = "invalid"
+    NOT_FOUND = "not_found"
+    CONFLICT = "conflict"
+
+
+@dataclass(frozen=True)
+class BatchOperation:
+    """
+    :param index: position of the operation in the batch
+    :param transaction_id: the transaction to update or delete
+    :param transaction: the new values to create or update with
+    """
+
+    index: int
+    operation: BatchOperationType
+    transaction_id: int | None = None
+    transaction: SaveTransaction | None = None
+
+
+@dataclass(frozen=True)
+class BatchRejection:
+    index: int
+    reason: str
+
+
+@dataclass(frozen=True)
+class BatchItemResult:
+    index: int
+    status: BatchItemStatus
+    transaction_id: int | None = None
+    transaction: TransactionEntity | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchWrite:
+    """
+    :param created: one entry per transaction to create, in the same order,
+        None for those skipped as duplicates
+    :param updated: the updated transactions by id, only those of the user
+    :param deleted: ids of the deleted transactions, only those of the user
+    :param registration_dates: registration dates of every written row, both
+        before and after the write
+    """
+
+    created: list[TransactionEntity | None]
+    updated: dict[int, TransactionEntity]
+    deleted: frozenset[int]
+    registration_dates: frozenset[date]
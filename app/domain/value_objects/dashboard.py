@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import date
 from decimal import Decimal
 
 
@@ -7,6 +8,24 @@ class DashboardValues:
     total_expense: Decimal
     total_income: Decimal
 
+    @property
+    def balance(self) -> Decimal:
+        return Decimal(self.total_income - self.total_expense)
+
+
+@dataclass(frozen=True)
+class DashboardPeriod:
+    """
+    A named interval of the dashboard, both dates inclusive
+    """
+
+    name: str
+    start_date: date
+    end_date: date
+
+
+EMPTY_DASHBOARD_VALUES = DashboardValues(total_expense=Decimal(0), total_income=Decimal(0))
+
 
 @dataclass(frozen=True)
 class DashboardResume:
@@ -14,6 +33,9 @@ class DashboardResume:
     monthly_expenses: Decimal
     yearly_revenues: Decimal
     yearly_expenses: Decimal
+    previous_month: DashboardValues = EMPTY_DASHBOARD_VALUES
+    previous_year: DashboardValues = EMPTY_DASHBOARD_VALUES
+    trailing_twelve_months: DashboardValues = EMPTY_DASHBOARD_VALUES
 
     @property
     def monthly_balance(self) -> Decimal:
@@ -22,3 +44,63 @@ class DashboardResume:
     @property
     def yearly_balance(self) -> Decimal:
         return Decimal(self.yearly_revenues - self.yearly_expenses)
+
+    @property
+    def previous_monthly_revenues(self) -> Decimal:
+        return self.previous_month.total_income
+
+    @property
+    def previous_monthly_expenses(self) -> Decimal:
+        return self.previous_month.total_expense
+
+    @property
+    def previous_monthly_balance(self) -> Decimal:
+        return self.previous_month.balance
+
+    @property
+    def previous_yearly_revenues(self) -> Decimal:
+        return self.previous_year.total_income
+
+    @property
+    def previous_yearly_expenses(self) -> Decimal:
+        return self.previous_year.total_expense
+
+    @property
+    def previous_yearly_balance(self) -> Decimal:
+        return self.previous_year.balance
+
+    @property
+    def trailing_twelve_months_revenues(self) -> Decimal:
+        return self.trailing_twelve_months.total_income
+
+    @property
+    def trailing_twelve_months_expenses(self) -> Decimal:
+        return self.trailing_twelve_months.total_expense
+
+    @property
+    def trailing_twelve_months_balance(self) -> Decimal:
+        return self.trailing_twelve_months.balance
+
+    @property
+    def monthly_revenues_delta(self) -> Decimal:
+        return Decimal(self.monthly_revenues - self.previous_monthly_revenues)
+
+    @property
+    def monthly_expenses_delta(self) -> Decimal:
+        return Decimal(self.monthly_expenses - self.previous_monthly_expenses)
+
+    @property
+    def monthly_balance_delta(self) -> Decimal:
+        return Decimal(self.monthly_balance - self.previous_monthly_balance)
+
+    @property
+    def yearly_revenues_delta(self) -> Decimal:
+        return Decimal(self.yearly_revenues - self.previous_yearly_revenues)
+
+    @property
+    def yearly_expenses_delta(self) -> Decimal:
+        return Decimal(self.yearly_expenses - self.previous_yearly_expenses)
+
+    @property
+    def yearly_balance_delta(self) -> Decimal:
+        return Decimal(self.yearly_balance - self.previous_yearly_balance)
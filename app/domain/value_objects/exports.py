@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from enum import StrEnum
+
+
+class ExportFormat(StrEnum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+@dataclass(frozen=True, slots=True)
+class ExportedTransaction:
+    """
+    A transaction as exported, with the name of its category instead of the id
+    """
+
+    transaction_id: int
+    description: str
+    amount: Decimal
+    type_of_transaction: str
+    transaction_status: str
+    registration_date: date | None
+    due_date: date | None
+    category: str | None
@@ -0,0 +1,41 @@
+from dataclasses import dataclass, field
+from datetime import date
+from enum import StrEnum
+
+from app.domain.entities.transactions import SaveTransaction
+
+
+class ImportFormat(StrEnum):
+    CSV = "csv"
+    OFX = "ofx"
+
+
+@dataclass(frozen=True)
+class ImportRow:
+    line_number: int
+    transaction: SaveTransaction
+
+
+@dataclass(frozen=True)
+class ImportRejection:
+    line_number: int
+    reason: str
+
+
+@dataclass(frozen=True)
+class ImportedChunk:
+    """
+    :param inserted: rows written, the others were duplicates
+    :param registration_dates: registration dates of the rows written
+    """
+
+    inserted: int
+    registration_dates: frozenset[date]
+
+
+@dataclass
+class ImportSummary:
+    inserted: int = 0
+    duplicates: int = 0
+    rejected: int = 0
+    rejections: list[ImportRejection] = field(default_factory=list)
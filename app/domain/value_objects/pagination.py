@@ -1,4 +1,6 @@
 from dataclasses import dataclass
+from datetime import date
+from enum import StrEnum
 
 
 @dataclass(frozen=True)
@@ -9,3 +11,42 @@ class PaginationParams:
     @property
     def offset(self) -> int:
         return (self.page - 1) * self.page_size
+
+
+class PaginationMode(StrEnum):
+    PAGE = "page"
+    CURSOR = "cursor"
+
+
+class CountStrategy(StrEnum):
+    """
+    How a listing reports its total
+
+    EXACT counts in the same query through a window function, CACHED reuses a
+    count invalidated on writes, ESTIMATED trusts the planner above a threshold
+    and NONE omits the total, reporting only whether there is a next page.
+    """
+
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+class CursorDirection(StrEnum):
+    NEXT = "next"
+    PREV = "prev"
+
+
+@dataclass(frozen=True)
+class TransactionCursor:
+    """
+    Position of a row in the (registration_date, transaction_id) listing order
+
+    Rows without a registration date come first, so a cursor on one of them
+    has no date.
+    """
+
+    registration_date: date | None
+    transaction_id: int
+    direction: CursorDirection = CursorDirection.NEXT
@@ -15,6 +15,19 @@ class TransactionStatus(StrEnum):
     ALREADY_PAID = "already_paid"
 
 
+class SearchMode(StrEnum):
+    """
+    How the description filter matches
+
+    CONTAINS matches the text as a substring, FULLTEXT matches stemmed words
+    ranked by relevance and FUZZY tolerates typos, ranked by similarity.
+    """
+
+    CONTAINS = "contains"
+    FULLTEXT = "fulltext"
+    FUZZY = "fuzzy"
+
+
 EXPENSE_STATUS_OF_TRANSACTIONS = ["paying", "already_paid", "not_paid"]
 INCOME_STATUS_OF_TRANSACTIONS = ["received"]
 
@@ -30,3 +43,5 @@ class TransactionsFilter:
     category: str | None
     type_of_transaction: TypeOfTransaction | None
     status_of_transaction: TransactionStatus | None
+    search_mode: SearchMode = SearchMode.CONTAINS
+    category_id: int | None = None
@@ -1,25 +1,60 @@
 import bcrypt
 
 from app.domain.abstractions.password_handler import PasswordHandlerAbstraction
+from app.infra.auth.password_pool import PasswordHashingPool
+from app.infra.configs.settings import Settings
+
+settings = Settings()  # type: ignore
+
+password_hashing_pool = PasswordHashingPool(
+    executor=settings.PASSWORD_HASHING_EXECUTOR,
+    max_workers=settings.PASSWORD_HASHING_WORKERS,
+    max_queue=settings.PASSWORD_HASHING_MAX_QUEUE,
+)
+
+
+def _hash_password(password_as_bytes: bytes, rounds: int) -> bytes:
+    salt = bcrypt.gensalt(rounds=rounds)
+    return bcrypt.hashpw(password=password_as_bytes, salt=salt)
+
+
+def _check_password(password_as_bytes: bytes, hashed_password: bytes) -> bool:
+    return bcrypt.checkpw(password=password_as_bytes, hashed_password=hashed_password)
 
 
 class AdapterPasswordHandler(PasswordHandlerAbstraction):
+    def __init__(
+        self,
+        pool: PasswordHashingPool = password_hashing_pool,
+        rounds: int = settings.PASSWORD_HASH_ROUNDS,
+    ) -> None:
+        self.pool = pool
+        self.rounds = rounds
+
     @classmethod
     def _encoded_password(cls, password: str) -> bytes:
         return password.encode("utf-8")
 
-    @classmethod
-    def _get_password_hash(cls, password_as_bytes: bytes) -> bytes:
-        salt = bcrypt.gensalt()
-        generated_hash = bcrypt.hashpw(password=password_as_bytes, salt=salt)
-        return generated_hash
-
-    def verify_password(self, raw_password: str, hashed_password: bytes) -> bool:
-        return bcrypt.checkpw(
-            password=self._encoded_password(password=raw_password), hashed_password=hashed_password
+    async def verify_password(self, raw_password: str, hashed_password: bytes) -> bool:
+        return await self.pool.run(
+            "verify",
+            _check_password,
+            self._encoded_password(password=raw_password),
+            hashed_password,
         )
 
-    def encrypted_password(self, password: str) -> bytes:
+    async def encrypted_password(self, password: str) -> bytes:
         password_as_bytes = self._encoded_password(password=password)
-        password_hash = self._get_password_hash(password_as_bytes=password_as_bytes)
-        return password_hash
+        return await self.pool.run("hash", _hash_password, password_as_bytes, self.rounds)
+
+    def needs_rehash(self, hashed_password: bytes) -> bool:
+        """
+        Whether the hash was made with another cost factor than the current one
+
+        bcrypt hashes look like `$2b$12$<salt and hash>`, 12 being the cost.
+        """
+        try:
+            hash_rounds = int(hashed_password.split(b"$")[2])
+        except (IndexError, ValueError):
+            return True
+        return hash_rounds != self.rounds
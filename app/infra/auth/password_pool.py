@@ -0,0 +1,108 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Literal, TypeVar
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.domain.exceptions.auth import PasswordHashingUnavailableException
+
+T = TypeVar("T")
+
+PasswordHashingExecutor = Literal["thread", "process"]
+
+PASSWORD_HASHING_QUEUE_DEPTH = Gauge(
+    "fintracker_password_hashing_queue_depth",
+    "Password hashing jobs waiting for a worker",
+    ["pool"],
+)
+PASSWORD_HASHING_IN_USE = Gauge(
+    "fintracker_password_hashing_in_use",
+    "Password hashing jobs currently running on a worker",
+    ["pool"],
+)
+PASSWORD_HASHING_WAIT_SECONDS = Histogram(
+    "fintracker_password_hashing_wait_seconds",
+    "Time password hashing jobs spent waiting for a worker",
+    ["pool"],
+)
+PASSWORD_HASHING_SECONDS = Histogram(
+    "fintracker_password_hashing_seconds",
+    "Time spent hashing or checking a password on a worker",
+    ["pool", "operation"],
+)
+PASSWORD_HASHING_REJECTIONS = Counter(
+    "fintracker_password_hashing_rejections_total",
+    "Password hashing jobs rejected because the queue was full",
+    ["pool"],
+)
+
+
+class PasswordHashingPool:
+    """
+    Runs bcrypt off the event loop on a dedicated, size-limited pool
+
+    bcrypt releases the GIL, so threads are enough to keep the event loop
+    responsive; processes also spread the work over other CPU cores. At most
+    `max_workers` jobs run at once and `max_queue` wait for a worker: further
+    jobs are rejected right away instead of piling up behind a login burst.
+    """
+
+    def __init__(self, executor: PasswordHashingExecutor, max_workers: int, max_queue: int) -> None:
+        self.executor = executor
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Executor | None = None
+        self._slots = asyncio.Semaphore(max_workers)
+        self._pending = 0
+
+    def _get_executor(self) -> Executor:
+        # created on first use, so importing the module never forks
+        if self._executor is None:
+            if self.executor == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="fintracker-password"
+                )
+        return self._executor
+
+    async def run(self, operation: str, func: Callable[..., T], *args: Any) -> T:
+        if self._pending >= self.max_workers + self.max_queue:
+            PASSWORD_HASHING_REJECTIONS.labels(pool=self.executor).inc()
+            raise PasswordHashingUnavailableException(
+                message="Too many authentication requests, try again later"
+            )
+
+        self._pending += 1
+        try:
+            started_at = time.perf_counter()
+            PASSWORD_HASHING_QUEUE_DEPTH.labels(pool=self.executor).inc()
+            try:
+                await self._slots.acquire()
+            finally:
+                PASSWORD_HASHING_QUEUE_DEPTH.labels(pool=self.executor).dec()
+            PASSWORD_HASHING_WAIT_SECONDS.labels(pool=self.executor).observe(
+                time.perf_counter() - started_at
+            )
+
+            PASSWORD_HASHING_IN_USE.labels(pool=self.executor).inc()
+            running_since = time.perf_counter()
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._get_executor(), partial(func, *args))
+            finally:
+                PASSWORD_HASHING_SECONDS.labels(pool=self.executor, operation=operation).observe(
+                    time.perf_counter() - running_since
+                )
+                PASSWORD_HASHING_IN_USE.labels(pool=self.executor).dec()
+                self._slots.release()
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
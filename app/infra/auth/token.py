@@ -1,3 +1,6 @@
+import hashlib
+import secrets
+import time
 from datetime import UTC, datetime, timedelta
 
 import jwt
@@ -9,27 +12,42 @@ from app.domain.exceptions.auth import (
     InvalidTokenException,
     TokenExpiredException,
 )
-from app.domain.value_objects.auth import JWTPayload, PublicToken
+from app.domain.value_objects.auth import JWTPayload, PublicToken, RefreshTokenGrant
+from app.infra.auth.token_cache import VerifiedTokenCache
 from app.infra.configs.settings import Settings
 
 settings = Settings()  # type: ignore
 
+verified_token_cache = VerifiedTokenCache(max_entries=settings.TOKEN_CACHE_MAX_ENTRIES)
+
 
 class TokenProvider(TokenProviderAbstraction):
-    def _build_token_payload(self, username: str, expiration_date: datetime) -> dict:
-        return {
+    def _build_token_payload(
+        self, username: str, expiration_date: datetime, user_id: int | None = None
+    ) -> dict:
+        payload = {
             "sub": username,
             "name": f"{username}'s token",
             "exp": expiration_date,
             "iat": datetime.now(tz=UTC),
         }
+        if user_id is not None:
+            payload["uid"] = user_id
+        return payload
 
-    def encode_token(self, username: str, token_expiration: timedelta | None = None) -> PublicToken:
+    def encode_token(
+        self,
+        username: str,
+        token_expiration: timedelta | None = None,
+        user_id: int | None = None,
+    ) -> PublicToken:
         if not token_expiration:
             token_expiration = timedelta(minutes=45)
 
         expiration_date = datetime.now(tz=UTC) + token_expiration
-        data = self._build_token_payload(username=username, expiration_date=expiration_date)
+        data = self._build_token_payload(
+            username=username, expiration_date=expiration_date, user_id=user_id
+        )
         encoded_jwt = jwt.encode(
             payload=data,
             key=settings.JWT_SECRET_KEY,
@@ -37,22 +55,59 @@ class TokenProvider(TokenProviderAbstraction):
         )
         return PublicToken(access_token=encoded_jwt, token_type=settings.TOKEN_TYPE)
 
+    def encode_refresh_token(self) -> RefreshTokenGrant:
+        """
+        Opaque random token; only its hash is meant to be stored
+        """
+        refresh_token = secrets.token_urlsafe(32)
+        return RefreshTokenGrant(
+            token=refresh_token,
+            token_hash=self.hash_refresh_token(refresh_token=refresh_token),
+            expires_at=datetime.now(tz=UTC)
+            + timedelta(days=settings.REFRESH_TOKEN_EXPIRATION_DAYS),
+        )
+
+    def hash_refresh_token(self, refresh_token: str) -> bytes:
+        return hashlib.sha256(refresh_token.encode()).digest()
+
     def decode_token(self, request: Request) -> JWTPayload:
         auth = request.headers.get("Authorization")
         if not auth:
             raise AuthorizationHeaderMissingException(message="Authorization header is missing")
         try:
             token = auth.split()[1]
-            payload = jwt.decode(
-                jwt=token, key=settings.JWT_SECRET_KEY, algorithms=[settings.ALGORITHM]
-            )
-            token_is_expired = self._token_is_expired(expiration_time=payload.get("exp"))
-            if token_is_expired:
-                raise TokenExpiredException(message="Token is expired")
-            return JWTPayload(sub=payload["sub"], exp=payload["exp"])
+            token_payload = verified_token_cache.get(token)
+            if token_payload and not self._token_is_expired(expiration_time=token_payload.exp):
+                return token_payload
+            if verified_token_cache.is_revoked(token):
+                raise InvalidTokenException(message="Token is invalid")
+
+            token_payload = self._verify_token(token=token)
+            verified_token_cache.set(token, token_payload)
+            return token_payload
         except jwt.InvalidTokenError:
             raise InvalidTokenException(message="Token is invalid")
 
+    def revoke_token(self, token: str) -> None:
+        """
+        Rejects a token that is still valid until it expires
+
+        Tokens that are already invalid are left alone.
+        """
+        try:
+            token_payload = self._verify_token(token=token)
+        except (jwt.InvalidTokenError, TokenExpiredException):
+            return None
+        verified_token_cache.revoke(token, expires_at=token_payload.exp)
+
+    def _verify_token(self, token: str) -> JWTPayload:
+        payload = jwt.decode(
+            jwt=token, key=settings.JWT_SECRET_KEY, algorithms=[settings.ALGORITHM]
+        )
+        token_is_expired = self._token_is_expired(expiration_time=payload.get("exp"))
+        if token_is_expired:
+            raise TokenExpiredException(message="Token is expired")
+        return JWTPayload(sub=payload["sub"], exp=payload["exp"], uid=payload.get("uid"))
+
     def _token_is_expired(self, expiration_time: int) -> bool:
-        expiration_token_datetime = datetime.fromtimestamp(expiration_time)
-        return expiration_token_datetime < datetime.now()
+        return expiration_time < time.time()
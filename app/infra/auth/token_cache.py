@@ -0,0 +1,87 @@
+import hashlib
+import threading
+import time
+
+from prometheus_client import Counter
+
+from app.domain.value_objects.auth import JWTPayload
+from app.infra.cache.memory import TTLCache
+
+TOKEN_CACHE_LOOKUPS = Counter(
+    "fintracker_token_cache_lookups_total",
+    "Verified-token cache lookups by result",
+    ["result"],
+)
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+class VerifiedTokenCache:
+    """
+    Payloads of tokens whose signature was already verified, kept until `exp`
+
+    Entries are keyed by a hash of the raw token, so the tokens themselves are
+    not kept in memory. `revoke` rejects a token until it expires, even though
+    its signature is valid. Revocations are not bounded by `max_entries` and
+    only reach the worker process where they were made.
+
+    The sync dependencies that decode tokens run on the threadpool, so every
+    access is guarded by a lock.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._verified: TTLCache[bytes, JWTPayload] = TTLCache(max_entries=max_entries)
+        self._revoked: dict[bytes, float] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> JWTPayload | None:
+        key = _token_key(token)
+        with self._lock:
+            payload = self._verified.get(key)
+            if payload is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        TOKEN_CACHE_LOOKUPS.labels(result="miss" if payload is None else "hit").inc()
+        return payload
+
+    def set(self, token: str, payload: JWTPayload) -> None:
+        ttl_seconds = payload.exp - time.time()
+        if ttl_seconds <= 0:
+            return
+        key = _token_key(token)
+        with self._lock:
+            if key not in self._revoked:
+                self._verified.set(key, payload, ttl_seconds=ttl_seconds)
+
+    def is_revoked(self, token: str) -> bool:
+        with self._lock:
+            return _token_key(token) in self._revoked
+
+    def revoke(self, token: str, expires_at: float) -> None:
+        """
+        :param expires_at: the `exp` claim, after which the token is rejected anyway
+        """
+        key = _token_key(token)
+        now = time.time()
+        with self._lock:
+            self._verified.delete(key)
+            # revocations are never evicted early, only once the token expired
+            self._revoked = {
+                revoked_key: revoked_until
+                for revoked_key, revoked_until in self._revoked.items()
+                if revoked_until > now
+            }
+            if expires_at > now:
+                self._revoked[key] = expires_at
+
+    def clear(self) -> None:
+        with self._lock:
+            self._verified.clear()
+            self._revoked.clear()
+            self.hits = 0
+            self.misses = 0
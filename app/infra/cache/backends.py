@@ -0,0 +1,14 @@
+from app.infra.cache.memory import InMemoryCacheBackend
+from app.infra.configs.settings import Settings
+
+settings = Settings()
+
+dashboard_cache_backend = InMemoryCacheBackend(
+    max_entries=settings.DASHBOARD_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.DASHBOARD_CACHE_TTL_SECONDS,
+)
+
+user_id_cache_backend = InMemoryCacheBackend(
+    max_entries=settings.USER_ID_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.USER_ID_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,73 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Bounded in-process LRU cache whose entries also expire after a TTL
+
+    It is not thread-safe: it is meant to be used from the event loop only.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float | None = None) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key) is not None
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(list(self._entries))
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl is not None else float("inf")
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class InMemoryCacheBackend:
+    """
+    AbstractCacheBackend kept in the memory of the worker process
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float | None = None) -> None:
+        self._cache: TTLCache[str, Any] = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    async def get(self, key: str) -> Any | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        self._cache.set(key, value, ttl_seconds=ttl_seconds)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._cache.delete(key)
@@ -0,0 +1,101 @@
+"""
+Measures the Python cost per row of turning listed transactions into entities
+
+    python -m app.infra.commands.benchmark_hydration [--rows N] [--repeat R]
+
+Compares loading `Transaction` ORM objects and copying them into
+`TransactionEntity`, as listings used to, with building the entities straight
+from Core rows of `ENTITY_COLUMNS`. Rows come from an in-memory SQLite
+database, so the numbers leave out the network and the Postgres driver.
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from datetime import date, timedelta
+
+from sqlalchemy import Engine, create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app.domain.entities.transactions import TransactionEntity
+from app.infra.database import mapped_registry
+from app.infra.database.orm_transaction import Transaction
+from app.infra.repositories.transactions import ENTITY_COLUMNS, AdapterTransactionRepo
+
+
+def _seed(session: Session, rows: int) -> None:
+    first_day = date(2026, 1, 1)
+    session.execute(
+        insert(Transaction.__table__),
+        [
+            {
+                "description": f"transaction {number}",
+                "amount": number % 1000 + 0.5,
+                "type_of_transaction": "income",
+                "registration_date": first_day + timedelta(days=number % 365),
+                "due_date": None,
+                "user_id": 1,
+                "category_id": 1,
+                "status": "received",
+            }
+            for number in range(rows)
+        ],
+    )
+    session.commit()
+
+
+def _through_orm(session: Session) -> list[TransactionEntity]:
+    transactions = session.execute(select(Transaction)).scalars().all()
+    return [AdapterTransactionRepo._to_entity(transaction) for transaction in transactions]
+
+
+def _through_core(session: Session) -> list[TransactionEntity]:
+    return [TransactionEntity(*row) for row in session.execute(select(*ENTITY_COLUMNS))]
+
+
+def _best_seconds(
+    engine: Engine, load: Callable[[Session], list[TransactionEntity]], repeat: int
+) -> float:
+    timings = []
+    for _ in range(repeat):
+        # a new session every time, so the identity map starts empty like in a request
+        with Session(engine) as session:
+            started_at = time.perf_counter()
+            load(session)
+            timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+def benchmark(rows: int, repeat: int) -> None:
+    engine = create_engine("sqlite://")
+    mapped_registry.metadata.create_all(engine)
+    with Session(engine) as session:
+        _seed(session=session, rows=rows)
+
+    with Session(engine) as session:
+        assert _through_orm(session) == _through_core(session)
+
+    orm_seconds = _best_seconds(engine, load=_through_orm, repeat=repeat)
+    core_seconds = _best_seconds(engine, load=_through_core, repeat=repeat)
+    print(f"{rows} rows, best of {repeat}")
+    print(f"ORM objects copied into entities: {orm_seconds / rows * 1e6:.2f} us/row")
+    print(f"Core rows into entities:          {core_seconds / rows * 1e6:.2f} us/row")
+    print(f"{orm_seconds / core_seconds:.1f}x faster")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.infra.commands.benchmark_hydration",
+        description="Measures the Python cost per row of turning listed transactions into entities",
+    )
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    benchmark(rows=args.rows, repeat=args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Imports a CSV or OFX bank statement into the transactions of a user
+
+    python -m app.infra.commands.import_transactions --user-id ID statement.csv
+    python -m app.infra.commands.import_transactions --user-id ID --format ofx \
+        --category Banco statement.ofx
+
+CSV files use the columns of `POST /transactions/`: description, amount,
+typeOfTransaction, registrationDate, dueDate, category and status. Exits with
+status 1 when some rows were rejected.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from app.api.v1.dtos.imports import validate_import_rows
+from app.domain.value_objects.imports import ImportFormat
+from app.infra.configs.settings import Settings
+from app.infra.database.session import open_session
+from app.infra.database.unit_of_work import SqlAlchemyUnitOfWork
+from app.infra.imports.parsers import read_statement
+from app.infra.repositories.categories import AdapterCategoryRepo
+from app.infra.repositories.transactions import AdapterTransactionRepo
+from app.usecases.categories.registry import CategoryRegistry
+from app.usecases.transactions.import_transactions import ImportTransactionsUseCase
+
+settings = Settings()  # type: ignore
+
+
+async def import_statement(
+    user_id: int,
+    path: str,
+    import_format: ImportFormat,
+    category: str | None,
+    encoding: str,
+    chunk_size: int,
+) -> int:
+    async with open_session() as session:
+        use_case = ImportTransactionsUseCase(
+            transaction_repo=AdapterTransactionRepo(session=session),
+            category_repo=AdapterCategoryRepo(session=session),
+            unit_of_work=SqlAlchemyUnitOfWork(session=session),
+            chunk_size=chunk_size,
+            max_reported_rejections=settings.IMPORT_MAX_REPORTED_REJECTIONS,
+            category_registry=CategoryRegistry(
+                refresh_interval_seconds=settings.CATEGORY_REGISTRY_REFRESH_SECONDS
+            ),
+        )
+        with open(path, encoding=encoding, errors="replace", newline="") as statement:
+            rows = read_statement(lines=statement, import_format=import_format, category=category)
+            summary = await use_case.execute(user_id=user_id, rows=validate_import_rows(rows=rows))
+
+    for rejection in summary.rejections:
+        print(f"line {rejection.line_number}: {rejection.reason}")
+    print(
+        f"Imported {summary.inserted} transactions, skipped {summary.duplicates} duplicates "
+        f"and rejected {summary.rejected} rows"
+    )
+    return 1 if summary.rejected else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.infra.commands.import_transactions",
+        description="Imports a CSV or OFX bank statement into the transactions of a user",
+    )
+    parser.add_argument("path", help="statement file")
+    parser.add_argument("--user-id", type=int, required=True, help="owner of the transactions")
+    parser.add_argument(
+        "--format", choices=[value.value for value in ImportFormat], default=ImportFormat.CSV.value
+    )
+    parser.add_argument("--category", default=None, help="category of every OFX entry")
+    parser.add_argument("--encoding", default="utf-8-sig")
+    parser.add_argument("--chunk-size", type=int, default=settings.IMPORT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    return asyncio.run(
+        import_statement(
+            user_id=args.user_id,
+            path=args.path,
+            import_format=ImportFormat(args.format),
+            category=args.category,
+            encoding=args.encoding,
+            chunk_size=args.chunk_size,
+        )
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+Verifies or rebuilds the monthly_totals rollup
+
+    python -m app.infra.commands.monthly_totals verify [--user-id ID] [--repair]
+    python -m app.infra.commands.monthly_totals rebuild [--user-id ID]
+
+`verify` exits with status 1 when it finds drift that it did not repair.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from app.infra.database.session import open_session
+from app.infra.repositories.monthly_totals import MonthlyTotalsRollup
+
+
+async def rebuild(user_id: int | None) -> None:
+    async with open_session() as session:
+        await MonthlyTotalsRollup(session=session).rebuild(user_id=user_id)
+        await session.commit()
+    print(f"Rebuilt monthly totals of {'user ' + str(user_id) if user_id else 'every user'}")
+
+
+async def verify(user_id: int | None, repair: bool) -> int:
+    async with open_session() as session:
+        drifts = await MonthlyTotalsRollup(session=session).verify(user_id=user_id)
+
+    for drift in sorted(drifts, key=lambda drift: str(drift.key)):
+        print(
+            f"{drift.key}: expected {drift.expected_amount} in {drift.expected_count} "
+            f"transactions, found {drift.actual_amount} in {drift.actual_count}"
+        )
+    if not drifts:
+        print("Monthly totals match the transactions")
+        return 0
+    if not repair:
+        return 1
+
+    for drifted_user_id in sorted({drift.key.user_id for drift in drifts}):
+        await rebuild(user_id=drifted_user_id)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.infra.commands.monthly_totals",
+        description="Verifies or rebuilds the monthly_totals rollup",
+    )
+    parser.add_argument("action", choices=["verify", "rebuild"])
+    parser.add_argument("--user-id", type=int, default=None, help="only this user")
+    parser.add_argument(
+        "--repair", action="store_true", help="rebuild the users whose totals drifted"
+    )
+    args = parser.parse_args(argv)
+
+    if args.action == "rebuild":
+        asyncio.run(rebuild(user_id=args.user_id))
+        return 0
+    return asyncio.run(verify(user_id=args.user_id, repair=args.repair))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
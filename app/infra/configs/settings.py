@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -12,7 +14,65 @@ class Settings(BaseSettings):
     ALGORITHM: str
     TOKEN_TYPE: str
     GH_TOKEN: str
+    DATABASE_EXECUTION_MODE: Literal["async", "threadpool"] = "async"
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30.0
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_PGBOUNCER_MODE: bool = False
+    POSTGRES_REPLICA_HOST: str | None = None
+    POSTGRES_REPLICA_PORT: int | None = None
+    DATABASE_REPLICA_STICKY_SECONDS: float = 5.0
+    DATABASE_REPLICA_MAX_LAG_SECONDS: float = 10.0
+    DATABASE_REPLICA_HEALTH_CHECK_INTERVAL: float = 5.0
+    LISTING_COUNT_CACHE_TTL_SECONDS: float = 60.0
+    LISTING_COUNT_CACHE_MAX_SCOPES: int = 10000
+    LISTING_COUNT_CACHE_MAX_KEYS_PER_SCOPE: int = 32
+    LISTING_COUNT_ESTIMATE_THRESHOLD: int = 10000
+    DASHBOARD_CACHE_TTL_SECONDS: float = 300.0
+    DASHBOARD_CACHE_MAX_ENTRIES: int = 10000
+    USER_ID_CACHE_TTL_SECONDS: float = 3600.0
+    USER_ID_CACHE_MAX_ENTRIES: int = 10000
+    CATEGORY_REGISTRY_REFRESH_SECONDS: float = 5.0
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000
+    REFRESH_TOKEN_EXPIRATION_DAYS: int = 30
+    IMPORT_CHUNK_SIZE: int = 1000
+    IMPORT_MAX_REPORTED_REJECTIONS: int = 100
+    EXPORT_BATCH_SIZE: int = 1000
+    BATCH_MAX_OPERATIONS: int = 100
+    TRANSACTION_GROUP_COMMIT_ENABLED: bool = False
+    TRANSACTION_GROUP_COMMIT_WINDOW_SECONDS: float = 0.005
+    TRANSACTION_GROUP_COMMIT_MAX_SIZE: int = 100
+    PASSWORD_HASH_ROUNDS: int = 12
+    PASSWORD_HASHING_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASHING_WORKERS: int = 2
+    PASSWORD_HASHING_MAX_QUEUE: int = 32
+    ADMISSION_LOGIN_MAX_CONCURRENT: int = 4
+    ADMISSION_LOGIN_MAX_QUEUE: int = 16
+    ADMISSION_REGISTER_MAX_CONCURRENT: int = 2
+    ADMISSION_REGISTER_MAX_QUEUE: int = 8
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 2.0
+    ADMISSION_RETRY_AFTER_SECONDS: int = 1
 
     @property
     def DATABASE_URL(self) -> str:
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+
+    @property
+    def REPLICA_DATABASE_URL(self) -> str | None:
+        if not self.POSTGRES_REPLICA_HOST:
+            return None
+        replica_port = self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT
+        return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_REPLICA_HOST}:{replica_port}/{self.POSTGRES_DB}"
+
+    @property
+    def ASYNC_REPLICA_DATABASE_URL(self) -> str | None:
+        if not self.POSTGRES_REPLICA_HOST:
+            return None
+        replica_port = self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT
+        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_REPLICA_HOST}:{replica_port}/{self.POSTGRES_DB}"
@@ -1,4 +1,6 @@
 import app.infra.database.orm_category
+import app.infra.database.orm_monthly_total
+import app.infra.database.orm_refresh_token
 import app.infra.database.orm_transaction
 import app.infra.database.orm_user
 from app.infra.database.base import mapped_registry
@@ -0,0 +1,49 @@
+from decimal import Decimal
+
+from sqlalchemy import ForeignKey, Numeric, SmallInteger, String, UniqueConstraint
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+)
+
+from app.domain.value_objects.transactions import TransactionStatus, TypeOfTransaction
+from app.infra.database.base import mapped_registry as base_mapped_registry
+
+MONTHLY_TOTAL_KEY_COLUMNS = (
+    "user_id",
+    "year",
+    "month",
+    "type_of_transaction",
+    "status",
+    "category_id",
+)
+
+
+@base_mapped_registry.mapped_as_dataclass
+class MonthlyTotal:
+    """
+    Rollup of the transactions of a user per month, type, status and category
+
+    It is derived data: the transaction repository keeps it up to date and
+    `python -m app.infra.commands.monthly_totals` verifies or rebuilds it.
+    """
+
+    __tablename__ = "monthly_totals"
+
+    monthly_total_id: Mapped[int] = mapped_column(init=False, primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id"))
+    year: Mapped[int] = mapped_column(SmallInteger)
+    month: Mapped[int] = mapped_column(SmallInteger)
+    type_of_transaction: Mapped[TypeOfTransaction] = mapped_column(String(20))
+    status: Mapped[TransactionStatus] = mapped_column(String(20))
+    category_id: Mapped[int | None] = mapped_column(nullable=True)
+    total_amount: Mapped[Decimal] = mapped_column(Numeric(15, 2))
+    transactions_count: Mapped[int]
+
+    __table_args__ = (
+        UniqueConstraint(
+            *MONTHLY_TOTAL_KEY_COLUMNS,
+            name="monthly_totals_key",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, LargeBinary, String, func
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+)
+
+from app.infra.database.base import mapped_registry as base_mapped_registry
+
+
+@base_mapped_registry.mapped_as_dataclass
+class RefreshToken:
+    """
+    Refresh token handed out at login, stored as the sha256 of the token
+
+    Every refresh rotates it: the token used is revoked and a new one joins the
+    same family. Presenting a revoked token again revokes the whole family.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    refresh_token_id: Mapped[int] = mapped_column(init=False, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id", ondelete="CASCADE"))
+    family_id: Mapped[str] = mapped_column(String(32), index=True)
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), unique=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    created_at: Mapped[datetime] = mapped_column(init=False, server_default=func.now())
+    revoked_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), init=False, default=None
+    )
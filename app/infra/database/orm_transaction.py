@@ -1,7 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import Date, Float, ForeignKey, Index, String
+from sqlalchemy import Date, Float, ForeignKey, Index, String, extract
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
@@ -12,6 +12,13 @@ from app.domain.business_logic.validators import due_date_validator, status_vali
 from app.domain.value_objects.transactions import TransactionStatus, TypeOfTransaction
 from app.infra.database.base import mapped_registry as base_mapped_registry
 
+SEARCH_TEXT_CONFIG = "portuguese"
+
+# Generated full-text column and its index. They exist only in the database
+# (see the description search migration) so the mapping stays portable to SQLite.
+DESCRIPTION_SEARCH_COLUMN = "description_search"
+DESCRIPTION_SEARCH_INDEX = "transactions_description_search_idx"
+
 
 @base_mapped_registry.mapped_as_dataclass
 class Transaction:
@@ -43,7 +50,12 @@ class Transaction:
         return status_validator(type_of_transaction=self.type_of_transaction, value=value)
 
     __table_args__ = (
-        Index("transactions_user_id_registration_date_idx", "user_id", "registration_date"),
+        Index(
+            "transactions_user_id_registration_date_id_idx",
+            "user_id",
+            "registration_date",
+            "transaction_id",
+        ),
         Index(
             "transactions_user_id_type_registration_date_idx",
             "user_id",
@@ -51,6 +63,12 @@ class Transaction:
             "registration_date",
         ),
         Index("transactions_category_id_idx", "category_id"),
+        Index(
+            "transactions_description_trgm_idx",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
         Index(
             "description_expense_due_date_idx",
             "description",
@@ -62,3 +80,14 @@ class Transaction:
             unique=True,
         ),
     )
+
+
+# Month-only filters ("every January") compare this exact expression, which is indexed
+registration_month = extract("month", Transaction.registration_date)
+
+Index(
+    "transactions_user_id_registration_month_idx",
+    Transaction.user_id,
+    registration_month,
+    Transaction.registration_date,
+)
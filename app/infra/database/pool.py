@@ -0,0 +1,162 @@
+import time
+from typing import Any
+from uuid import uuid4
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, PoolProxiedConnection, QueuePool
+
+from app.infra.configs.settings import Settings
+
+POOL_SIZE = Gauge(
+    "fintracker_db_pool_size",
+    "Configured number of persistent connections in the pool",
+    ["engine"],
+)
+POOL_MAX_OVERFLOW = Gauge(
+    "fintracker_db_pool_max_overflow",
+    "Configured number of overflow connections allowed above the pool size",
+    ["engine"],
+)
+POOL_CHECKED_OUT = Gauge(
+    "fintracker_db_pool_checked_out",
+    "Connections currently checked out of the pool",
+    ["engine"],
+)
+POOL_OVERFLOW = Gauge(
+    "fintracker_db_pool_overflow",
+    "Overflow connections currently open above the pool size",
+    ["engine"],
+)
+POOL_CHECKOUTS = Counter(
+    "fintracker_db_pool_checkouts_total",
+    "Connections checked out of the pool",
+    ["engine"],
+)
+POOL_CONNECTS = Counter(
+    "fintracker_db_pool_connects_total",
+    "New DBAPI connections opened by the pool",
+    ["engine"],
+)
+POOL_INVALIDATIONS = Counter(
+    "fintracker_db_pool_invalidations_total",
+    "Connections invalidated by the pool (pre-ping failures, disconnects, recycles)",
+    ["engine", "kind"],
+)
+POOL_CHECKOUT_SECONDS = Histogram(
+    "fintracker_db_pool_checkout_seconds",
+    "Time spent waiting for a connection from the pool, including pre-ping",
+    ["engine"],
+)
+
+
+class _InstrumentedPoolMixin:
+    metrics_label: str = "default"
+
+    def connect(self) -> PoolProxiedConnection:
+        started_at = time.perf_counter()
+        try:
+            return super().connect()  # type: ignore
+        finally:
+            POOL_CHECKOUT_SECONDS.labels(engine=self.metrics_label).observe(
+                time.perf_counter() - started_at
+            )
+
+    def _do_return_conn(self, record: Any) -> None:
+        # the checkin event fires before an overflow connection is let go
+        try:
+            super()._do_return_conn(record)  # type: ignore
+        finally:
+            _sample_pool_overflow(pool=self, label=self.metrics_label)  # type: ignore
+
+
+def instrumented_pool_class(base: type[QueuePool], label: str) -> type[QueuePool]:
+    return type(  # type: ignore
+        f"Instrumented{base.__name__}",
+        (_InstrumentedPoolMixin, base),
+        {"metrics_label": label},
+    )
+
+
+def _sample_pool_overflow(pool: Pool, label: str) -> None:
+    if isinstance(pool, QueuePool):
+        POOL_OVERFLOW.labels(engine=label).set(max(pool.overflow(), 0))
+
+
+def instrument_engine(
+    engine: Engine,
+    label: str,
+    settings: Settings,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+) -> None:
+    """
+    Exports pool usage to the default Prometheus registry
+
+    The instrumentator exposes that registry on /metrics, so these series are
+    scraped together with the HTTP ones.
+
+    :param pool_size: the size the engine was created with, when it is not the configured one
+    :param max_overflow: likewise for the overflow
+    """
+    POOL_SIZE.labels(engine=label).set(
+        settings.DATABASE_POOL_SIZE if pool_size is None else pool_size
+    )
+    POOL_MAX_OVERFLOW.labels(engine=label).set(
+        settings.DATABASE_MAX_OVERFLOW if max_overflow is None else max_overflow
+    )
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        POOL_CONNECTS.labels(engine=label).inc()
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        POOL_CHECKOUTS.labels(engine=label).inc()
+        POOL_CHECKED_OUT.labels(engine=label).inc()
+        _sample_pool_overflow(pool=engine.pool, label=label)
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection: Any, connection_record: Any) -> None:
+        POOL_CHECKED_OUT.labels(engine=label).dec()
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection: Any, connection_record: Any, exception: Any) -> None:
+        POOL_INVALIDATIONS.labels(engine=label, kind="hard").inc()
+
+    @event.listens_for(engine, "soft_invalidate")
+    def on_soft_invalidate(dbapi_connection: Any, connection_record: Any, exception: Any) -> None:
+        POOL_INVALIDATIONS.labels(engine=label, kind="soft").inc()
+
+
+def engine_options(
+    settings: Settings,
+    label: str,
+    is_async: bool = False,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+) -> dict[str, Any]:
+    """
+    :param pool_size: overrides DATABASE_POOL_SIZE, for engines with a capacity of their own
+    :param max_overflow: overrides DATABASE_MAX_OVERFLOW
+    """
+    base_pool_class = AsyncAdaptedQueuePool if is_async else QueuePool
+    options: dict[str, Any] = {
+        "poolclass": instrumented_pool_class(base=base_pool_class, label=label),
+        "pool_size": settings.DATABASE_POOL_SIZE if pool_size is None else pool_size,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW if max_overflow is None else max_overflow,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    }
+    if is_async and settings.DATABASE_PGBOUNCER_MODE:
+        # PgBouncer in transaction mode may hand every transaction a different
+        # server connection, so named server-side prepared statements must not
+        # be cached or reused across transactions.
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return options
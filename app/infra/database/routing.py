@@ -0,0 +1,165 @@
+import time
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from typing import Any
+
+from prometheus_client import Counter, Gauge
+from sqlalchemy import Result, exc, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+ROUTER_INFO_KEY = "replica_router"
+HAS_WRITES_INFO_KEY = "has_writes"
+
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+DB_READS = Counter(
+    "fintracker_db_reads_total",
+    "Read-only repository queries by the database that served them",
+    ["target"],
+)
+REPLICA_FALLBACKS = Counter(
+    "fintracker_db_replica_fallbacks_total",
+    "Reads sent to the primary although a replica is configured",
+    ["reason"],
+)
+REPLICA_LAG_SECONDS = Gauge(
+    "fintracker_db_replica_lag_seconds",
+    "Replication lag observed by the last replica health check",
+)
+REPLICA_HEALTHY = Gauge(
+    "fintracker_db_replica_healthy",
+    "Whether the last replica health check allowed reads on the replica",
+)
+
+# Errors that mean the replica cannot serve now, rather than a bad statement;
+# sqlalchemy's TimeoutError is a full replica pool, the builtin one a timed out connect
+REPLICA_ERRORS = (exc.DBAPIError, exc.TimeoutError, OSError, TimeoutError)
+
+ReplicaSessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+class ReplicaRouter:
+    """
+    Sends read-only repository queries to the replica when it is safe to do so
+
+    Reads stay on the primary when the request session already wrote, when
+    the user wrote something in the last `sticky_seconds` (read-your-writes),
+    or when the last health check found the replica down or lagging more than
+    `max_lag_seconds`. A replica error falls back to the primary.
+
+    The read-your-writes window lives in this process only. A user's next
+    request served by another worker or pod within `sticky_seconds` may read
+    from the replica and miss the write, by at most the replication lag.
+    """
+
+    def __init__(
+        self,
+        open_replica_session: ReplicaSessionFactory,
+        sticky_seconds: float,
+        max_lag_seconds: float,
+        health_check_interval: float,
+        max_sticky_users: int = 10_000,
+    ) -> None:
+        self.open_replica_session = open_replica_session
+        self.sticky_seconds = sticky_seconds
+        self.max_lag_seconds = max_lag_seconds
+        self.health_check_interval = health_check_interval
+        self.max_sticky_users = max_sticky_users
+        self._sticky_until: dict[int, float] = {}
+        self._healthy = True
+        self._checked_at = float("-inf")
+
+    def mark_write(self, user_id: int | None) -> None:
+        if not user_id:
+            return
+        now = time.monotonic()
+        if len(self._sticky_until) >= self.max_sticky_users:
+            self._sticky_until = {
+                sticky_user_id: until
+                for sticky_user_id, until in self._sticky_until.items()
+                if until > now
+            }
+        self._sticky_until[user_id] = now + self.sticky_seconds
+
+    def _is_sticky(self, user_id: int | None) -> bool:
+        if not user_id:
+            return False
+        return self._sticky_until.get(user_id, 0.0) > time.monotonic()
+
+    def _mark_unhealthy(self) -> None:
+        self._healthy = False
+        self._checked_at = time.monotonic()
+        REPLICA_HEALTHY.set(0)
+
+    async def _replica_is_usable(self) -> bool:
+        now = time.monotonic()
+        if now - self._checked_at < self.health_check_interval:
+            return self._healthy
+
+        # Concurrent requests keep using the previous verdict meanwhile
+        self._checked_at = now
+        try:
+            async with self.open_replica_session() as replica_session:
+                result = await replica_session.execute(REPLICA_LAG_QUERY)
+                lag = float(result.scalar() or 0)
+        except REPLICA_ERRORS:
+            self._mark_unhealthy()
+            return False
+
+        REPLICA_LAG_SECONDS.set(lag)
+        self._healthy = lag <= self.max_lag_seconds
+        REPLICA_HEALTHY.set(int(self._healthy))
+        return self._healthy
+
+    async def execute_read(
+        self, session: AsyncSession, statement: Any, user_id: int | None = None
+    ) -> Result:
+        if session.info.get(HAS_WRITES_INFO_KEY):
+            fallback_reason = "session_has_writes"
+        elif self._is_sticky(user_id=user_id):
+            fallback_reason = "sticky_user"
+        elif not await self._replica_is_usable():
+            fallback_reason = "replica_unavailable"
+        else:
+            try:
+                async with self.open_replica_session() as replica_session:
+                    result = await replica_session.execute(statement)
+                    frozen_result = result.freeze()
+            except REPLICA_ERRORS:
+                self._mark_unhealthy()
+                fallback_reason = "replica_error"
+            else:
+                DB_READS.labels(target="replica").inc()
+                return frozen_result()
+
+        REPLICA_FALLBACKS.labels(reason=fallback_reason).inc()
+        DB_READS.labels(target="primary").inc()
+        return await session.execute(statement)
+
+
+async def execute_read(session: AsyncSession, statement: Any, user_id: int | None = None) -> Result:
+    """
+    Executes a read-only statement, on the replica when the session has a router
+    """
+    router: ReplicaRouter | None = session.info.get(ROUTER_INFO_KEY)
+    if router is None:
+        return await session.execute(statement)
+    return await router.execute_read(session=session, statement=statement, user_id=user_id)
+
+
+def mark_write(session: AsyncSession, user_id: int | None = None) -> None:
+    """
+    Pins the rest of the session, and the user for a short window, to the primary
+    """
+    session.info[HAS_WRITES_INFO_KEY] = True
+    router: ReplicaRouter | None = session.info.get(ROUTER_INFO_KEY)
+    if router is not None:
+        router.mark_write(user_id=user_id)
@@ -1,8 +1,156 @@
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from functools import partial
+
 import sqlalchemy
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.infra.configs.settings import Settings
+from app.infra.database.pool import engine_options, instrument_engine
+from app.infra.database.routing import ROUTER_INFO_KEY, ReplicaRouter
+from app.infra.database.threadpool import (
+    ThreadPoolRunner,
+    ThreadPoolSession,
+    open_threadpool_session,
+)
+
+settings = Settings()  # type: ignore
 
-engine = sqlalchemy.create_engine(url=Settings().DATABASE_URL)  # type: ignore
+SessionOpener = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+engine = sqlalchemy.create_engine(
+    url=settings.DATABASE_URL,
+    **engine_options(settings=settings, label="sync"),
+)
+instrument_engine(engine=engine, label="sync", settings=settings)
 
 LocalSessionMaker = sessionmaker(engine)
+
+async_engine = create_async_engine(
+    url=settings.ASYNC_DATABASE_URL,
+    **engine_options(settings=settings, label="async", is_async=True),
+)
+instrument_engine(engine=async_engine.sync_engine, label="async", settings=settings)
+
+AsyncLocalSessionMaker = async_sessionmaker(async_engine, expire_on_commit=False)
+
+threadpool_runner = ThreadPoolRunner(
+    max_workers=settings.DATABASE_POOL_SIZE + settings.DATABASE_MAX_OVERFLOW
+)
+
+replica_router: ReplicaRouter | None = None
+
+if settings.REPLICA_DATABASE_URL and settings.ASYNC_REPLICA_DATABASE_URL:
+    replica_engine = sqlalchemy.create_engine(
+        url=settings.REPLICA_DATABASE_URL,
+        **engine_options(settings=settings, label="replica_sync"),
+    )
+    instrument_engine(engine=replica_engine, label="replica_sync", settings=settings)
+    ReplicaLocalSessionMaker = sessionmaker(replica_engine, expire_on_commit=False)
+
+    async_replica_engine = create_async_engine(
+        url=settings.ASYNC_REPLICA_DATABASE_URL,
+        **engine_options(settings=settings, label="replica_async", is_async=True),
+    )
+    instrument_engine(
+        engine=async_replica_engine.sync_engine, label="replica_async", settings=settings
+    )
+    AsyncReplicaSessionMaker = async_sessionmaker(async_replica_engine, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def open_replica_session() -> AsyncIterator[AsyncSession]:
+        """
+        The caller already holds a threadpool slot, so no new slot is taken here
+        """
+        if settings.DATABASE_EXECUTION_MODE == "threadpool":
+            sync_session = ReplicaLocalSessionMaker()
+            async with ThreadPoolSession(sync_session, threadpool_runner) as session:
+                yield session  # type: ignore
+            return
+
+        async with AsyncReplicaSessionMaker() as session:
+            yield session
+
+    replica_router = ReplicaRouter(
+        open_replica_session=open_replica_session,
+        sticky_seconds=settings.DATABASE_REPLICA_STICKY_SECONDS,
+        max_lag_seconds=settings.DATABASE_REPLICA_MAX_LAG_SECONDS,
+        health_check_interval=settings.DATABASE_REPLICA_HEALTH_CHECK_INTERVAL,
+    )
+
+
+@asynccontextmanager
+async def _open_session(
+    new_sync_session: Callable[[], Session],
+    new_async_session: Callable[[], AsyncSession],
+    runner: ThreadPoolRunner,
+) -> AsyncIterator[AsyncSession]:
+    if settings.DATABASE_EXECUTION_MODE == "threadpool":
+        async with open_threadpool_session(new_sync_session, runner) as session:
+            if replica_router is not None:
+                session.info[ROUTER_INFO_KEY] = replica_router
+            yield session  # type: ignore
+        return
+
+    async with new_async_session() as session:
+        if replica_router is not None:
+            session.info[ROUTER_INFO_KEY] = replica_router
+        yield session
+
+
+def open_session() -> AbstractAsyncContextManager[AsyncSession]:
+    """
+    Opens a session for the configured execution mode
+
+    In threadpool mode the sync psycopg2 session is wrapped so it can be
+    awaited like an AsyncSession while its I/O runs on the bounded pool.
+    When a replica is configured its router travels in `session.info`.
+    """
+    return _open_session(
+        partial(LocalSessionMaker, expire_on_commit=False),
+        AsyncLocalSessionMaker,
+        threadpool_runner,
+    )
+
+
+open_writer_session: SessionOpener = open_session
+
+if settings.TRANSACTION_GROUP_COMMIT_ENABLED:
+    # The group-commit writer saves on behalf of requests that keep their own
+    # session (and with it a threadpool slot or a pooled connection) while
+    # they wait. Sharing their capacity would deadlock once every slot is held
+    # by a waiting request, so the writer gets a connection and a slot of its
+    # own, one above DATABASE_POOL_SIZE + DATABASE_MAX_OVERFLOW per worker.
+    writer_engine = sqlalchemy.create_engine(
+        url=settings.DATABASE_URL,
+        **engine_options(settings=settings, label="writer_sync", pool_size=1, max_overflow=0),
+    )
+    instrument_engine(
+        engine=writer_engine, label="writer_sync", settings=settings, pool_size=1, max_overflow=0
+    )
+    WriterLocalSessionMaker = sessionmaker(writer_engine, expire_on_commit=False)
+
+    async_writer_engine = create_async_engine(
+        url=settings.ASYNC_DATABASE_URL,
+        **engine_options(
+            settings=settings, label="writer_async", is_async=True, pool_size=1, max_overflow=0
+        ),
+    )
+    instrument_engine(
+        engine=async_writer_engine.sync_engine,
+        label="writer_async",
+        settings=settings,
+        pool_size=1,
+        max_overflow=0,
+    )
+    AsyncWriterSessionMaker = async_sessionmaker(async_writer_engine, expire_on_commit=False)
+
+    writer_threadpool_runner = ThreadPoolRunner(max_workers=1)
+
+    def _open_reserved_writer_session() -> AbstractAsyncContextManager[AsyncSession]:
+        return _open_session(
+            WriterLocalSessionMaker, AsyncWriterSessionMaker, writer_threadpool_runner
+        )
+
+    open_writer_session = _open_reserved_writer_session
@@ -0,0 +1,168 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, Self, TypeVar
+
+from prometheus_client import Gauge, Histogram
+from sqlalchemy import Result, Row
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+THREADPOOL_QUEUE_DEPTH = Gauge(
+    "fintracker_db_threadpool_queue_depth",
+    "Requests waiting for a database worker thread",
+)
+THREADPOOL_IN_USE = Gauge(
+    "fintracker_db_threadpool_in_use",
+    "Requests currently holding a database worker thread",
+)
+THREADPOOL_WAIT_SECONDS = Histogram(
+    "fintracker_db_threadpool_wait_seconds",
+    "Time spent waiting for a database worker thread",
+)
+
+
+class ThreadPoolRunner:
+    """
+    Runs blocking SQLAlchemy calls on a dedicated, size-limited thread pool
+
+    Each request must hold a slot while it owns a session. The number of slots
+    matches the worker threads and the connection pool capacity, so a thread
+    never blocks waiting for a connection: excess requests wait for a slot on
+    the event loop instead.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="fintracker-db"
+        )
+        self._slots = asyncio.Semaphore(max_workers)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        started_at = time.perf_counter()
+        THREADPOOL_QUEUE_DEPTH.inc()
+        try:
+            await self._slots.acquire()
+        finally:
+            THREADPOOL_QUEUE_DEPTH.dec()
+        THREADPOOL_WAIT_SECONDS.observe(time.perf_counter() - started_at)
+        THREADPOOL_IN_USE.inc()
+        try:
+            yield
+        finally:
+            THREADPOOL_IN_USE.dec()
+            self._slots.release()
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+
+class ThreadPoolStreamResult:
+    """
+    AsyncResult-compatible facade over a sync Result read through a server-side cursor
+    """
+
+    def __init__(self, result: Result, runner: ThreadPoolRunner) -> None:
+        self.result = result
+        self.runner = runner
+
+    async def partitions(self, size: int | None = None) -> AsyncIterator[Sequence[Row]]:
+        partitions = self.result.partitions(size)
+        while partition := await self.runner.run(next, partitions, None):
+            yield partition
+
+    async def close(self) -> None:
+        await self.runner.run(self.result.close)
+
+
+class ThreadPoolSession:
+    """
+    AsyncSession-compatible facade over a sync Session
+
+    Every call that may hit the database runs on the ThreadPoolRunner, so the
+    repositories can await it exactly like an AsyncSession.
+    """
+
+    def __init__(self, sync_session: Session, runner: ThreadPoolRunner) -> None:
+        self.sync_session = sync_session
+        self.runner = runner
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    @property
+    def info(self) -> dict:
+        return self.sync_session.info
+
+    def add(self, instance: object) -> None:
+        self.sync_session.add(instance)
+
+    def get_bind(self, *args: Any, **kwargs: Any) -> Any:
+        return self.sync_session.get_bind(*args, **kwargs)
+
+    async def execute(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        return await self.runner.run(self.sync_session.execute, statement, *args, **kwargs)
+
+    async def scalar(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        return await self.runner.run(self.sync_session.scalar, statement, *args, **kwargs)
+
+    async def stream(self, statement: Any, *args: Any, **kwargs: Any) -> ThreadPoolStreamResult:
+        statement = statement.execution_options(stream_results=True)
+        result = await self.runner.run(self.sync_session.execute, statement, *args, **kwargs)
+        return ThreadPoolStreamResult(result, self.runner)
+
+    async def run_sync(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await self.runner.run(func, self.sync_session, *args, **kwargs)
+
+    async def refresh(self, instance: object) -> None:
+        await self.runner.run(self.sync_session.refresh, instance)
+
+    async def delete(self, instance: object) -> None:
+        self.sync_session.delete(instance)
+
+    @asynccontextmanager
+    async def begin_nested(self) -> AsyncIterator[None]:
+        savepoint = await self.runner.run(self.sync_session.begin_nested)
+        try:
+            yield
+        except BaseException:
+            await self.runner.run(savepoint.rollback)
+            raise
+        await self.runner.run(savepoint.commit)
+
+    async def flush(self) -> None:
+        await self.runner.run(self.sync_session.flush)
+
+    async def commit(self) -> None:
+        await self.runner.run(self.sync_session.commit)
+
+    async def rollback(self) -> None:
+        await self.runner.run(self.sync_session.rollback)
+
+    async def close(self) -> None:
+        await self.runner.run(self.sync_session.close)
+
+
+@asynccontextmanager
+async def open_threadpool_session(
+    new_session: Callable[[], Session], runner: ThreadPoolRunner
+) -> AsyncIterator[ThreadPoolSession]:
+    """
+    Opens a sync session that holds a slot of `runner` until it is closed
+
+    Code that already holds a slot must not open another session on the same
+    runner: once every slot is held by someone waiting for a second one, none
+    is ever released.
+    """
+    async with runner.slot(), ThreadPoolSession(new_session(), runner) as session:
+        yield session
@@ -0,0 +1,44 @@
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.abstractions.unit_of_work import AbstractUnitOfWork
+
+AFTER_COMMIT_INFO_KEY = "after_commit"
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Runs `callback` once the unit of work of the session commits
+
+    For in-process caches that must not be invalidated before the rows they
+    describe are visible to other sessions.
+    """
+    session.info.setdefault(AFTER_COMMIT_INFO_KEY, []).append(callback)
+
+
+class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
+    """
+    One transaction over the request session
+
+    The session autoflushes, so staged ORM objects reach the database only
+    when a query needs them or at the commit.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def commit(self) -> None:
+        await self.session.commit()
+        for callback in self.session.info.pop(AFTER_COMMIT_INFO_KEY, []):
+            callback()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+        self.session.info.pop(AFTER_COMMIT_INFO_KEY, None)
+
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncIterator[None]:
+        async with self.session.begin_nested():
+            yield
@@ -0,0 +1,92 @@
+"""
+Incremental encoders of exported transactions
+
+Each encoder yields one chunk of text per batch it reads, so a response can be
+streamed while the rows are still being fetched.
+"""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+
+from app.domain.business_logic.conversor import (
+    format_date_to_brazilian_date_text_format,
+    format_decimal_to_brl_format,
+)
+from app.domain.value_objects.exports import ExportedTransaction, ExportFormat
+
+# Same columns as the CSV import, so an export can be imported back
+EXPORT_FIELDS = (
+    "id",
+    "description",
+    "amount",
+    "typeOfTransaction",
+    "registrationDate",
+    "dueDate",
+    "category",
+    "status",
+)
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+
+def _exported_values(transaction: ExportedTransaction) -> tuple:
+    return (
+        transaction.transaction_id,
+        transaction.description,
+        format_decimal_to_brl_format(amount=transaction.amount),
+        transaction.type_of_transaction,
+        (
+            format_date_to_brazilian_date_text_format(date_reference=transaction.registration_date)
+            if transaction.registration_date
+            else ""
+        ),
+        (
+            format_date_to_brazilian_date_text_format(date_reference=transaction.due_date)
+            if transaction.due_date
+            else ""
+        ),
+        transaction.category or "",
+        transaction.transaction_status,
+    )
+
+
+async def encode_csv(batches: AsyncIterator[list[ExportedTransaction]]) -> AsyncIterator[str]:
+    """
+    `;` separated, since BRL amounts contain commas
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=";", lineterminator="\n")
+    writer.writerow(EXPORT_FIELDS)
+    async for batch in batches:
+        writer.writerows(_exported_values(transaction) for transaction in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # the header alone, when nothing matched
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+async def encode_ndjson(batches: AsyncIterator[list[ExportedTransaction]]) -> AsyncIterator[str]:
+    async for batch in batches:
+        yield "".join(
+            json.dumps(
+                dict(zip(EXPORT_FIELDS, _exported_values(transaction), strict=True)),
+                ensure_ascii=False,
+            )
+            + "\n"
+            for transaction in batch
+        )
+
+
+def encode_export(
+    batches: AsyncIterator[list[ExportedTransaction]], export_format: ExportFormat
+) -> AsyncIterator[str]:
+    if export_format == ExportFormat.NDJSON:
+        return encode_ndjson(batches=batches)
+    return encode_csv(batches=batches)
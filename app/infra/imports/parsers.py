@@ -0,0 +1,120 @@
+"""
+Streaming readers of bank statements
+
+Each reader yields `(line_number, row)` pairs, `row` being keyed like the
+fields of `SaveTransactionRequestDTO` with its BRL amounts and DD/MM/YYYY dates,
+so every format is validated by the same rules as `POST /transactions/`.
+"""
+
+import csv
+import re
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+from app.domain.business_logic.conversor import (
+    format_date_to_brazilian_date_text_format,
+    format_decimal_to_brl_format,
+)
+from app.domain.exceptions.transactions import ImportCategoryNotProvidedException
+from app.domain.value_objects.imports import ImportFormat
+from app.domain.value_objects.transactions import TransactionStatus, TypeOfTransaction
+
+Row = dict[str, str | None]
+
+OFX_TAG = re.compile(r"<(/?)([A-Za-z0-9.]+)>([^<\r\n]*)")
+
+
+def read_csv(lines: Iterable[str]) -> Iterator[tuple[int, Row]]:
+    """
+    The header names the columns: description, amount, typeOfTransaction,
+    registrationDate, dueDate, category and status
+
+    Columns are separated by `;` or `,`, whichever the header uses; `;` is the
+    usual choice since BRL amounts contain commas.
+    """
+    lines = iter(lines)
+    header = next(lines, None)
+    if header is None:
+        return
+    delimiter = ";" if header.count(";") >= header.count(",") else ","
+    fieldnames = next(csv.reader([header], delimiter=delimiter))
+    reader = csv.DictReader(
+        lines, fieldnames=[name.strip() for name in fieldnames], delimiter=delimiter
+    )
+    for row in reader:
+        # line 1 is the header; quoted fields may span lines
+        yield reader.line_num + 1, {key: (value or "").strip() for key, value in row.items() if key}
+
+
+def _ofx_date(value: str) -> str:
+    try:
+        posted_at = datetime.strptime(value[:8], "%Y%m%d")
+    except ValueError:
+        return value
+    return format_date_to_brazilian_date_text_format(date_reference=posted_at)
+
+
+def _ofx_row(fields: dict[str, str], category: str) -> Row:
+    """
+    Debits become expenses already paid on the day they were posted, credits
+    become incomes already received
+    """
+    try:
+        amount = Decimal(fields.get("TRNAMT", "").replace(",", "."))
+    except InvalidOperation:
+        return {
+            "description": fields.get("MEMO") or fields.get("NAME"),
+            "amount": fields.get("TRNAMT"),
+        }
+
+    posted_at = _ofx_date(fields.get("DTPOSTED", ""))
+    is_expense = amount < 0
+    return {
+        "description": fields.get("MEMO") or fields.get("NAME"),
+        "amount": format_decimal_to_brl_format(amount=abs(amount)),
+        "typeOfTransaction": (
+            TypeOfTransaction.EXPENSE.value if is_expense else TypeOfTransaction.INCOME.value
+        ),
+        "registrationDate": posted_at,
+        "dueDate": posted_at if is_expense else None,
+        "category": category,
+        "status": (
+            TransactionStatus.ALREADY_PAID.value if is_expense else TransactionStatus.RECEIVED.value
+        ),
+    }
+
+
+def read_ofx(lines: Iterable[str], category: str) -> Iterator[tuple[int, Row]]:
+    """
+    Reads the `STMTTRN` entries of SGML (OFX 1.x) and XML (OFX 2.x) statements
+
+    OFX has no categories, so every entry goes to `category`.
+    """
+    fields: dict[str, str] | None = None
+    started_at = 0
+    for line_number, line in enumerate(lines, start=1):
+        for closing, tag, value in OFX_TAG.findall(line):
+            tag = tag.upper()
+            if tag == "STMTTRN" and not closing:
+                fields, started_at = {}, line_number
+            elif tag == "STMTTRN" and fields is not None:
+                yield started_at, _ofx_row(fields=fields, category=category)
+                fields = None
+            elif fields is not None and not closing and value.strip():
+                fields[tag] = value.strip()
+
+
+def read_statement(
+    lines: Iterable[str], import_format: ImportFormat, category: str | None = None
+) -> Iterator[tuple[int, Row]]:
+    """
+    :param category: category of every OFX entry, ignored for CSV
+    """
+    if import_format == ImportFormat.CSV:
+        return read_csv(lines=lines)
+    if not category:
+        raise ImportCategoryNotProvidedException(
+            message="A category must be informed to import OFX statements"
+        )
+    return read_ofx(lines=lines, category=category)
@@ -0,0 +1,91 @@
+"""
+Loads imported transactions into a temporary staging table with COPY
+
+Plain Postgres COPY is all or nothing, so rows are copied into a table without
+constraints first and moved into `transactions` with a single
+`INSERT ... SELECT ... ON CONFLICT DO NOTHING`, which skips duplicates instead
+of failing the batch.
+"""
+
+import io
+from collections.abc import Sequence
+from datetime import date
+from typing import Any
+
+from sqlalchemy import column, table, text
+from sqlalchemy.orm import Session
+from sqlalchemy.util import await_only
+
+STAGING_TABLE = "transactions_import"
+
+STAGING_COLUMNS = (
+    "line_number",
+    "description",
+    "amount",
+    "type_of_transaction",
+    "registration_date",
+    "due_date",
+    "user_id",
+    "category_id",
+    "status",
+)
+
+# Dropped with the commit of the chunk that created it
+CREATE_STAGING_TABLE = text(
+    f"""
+    CREATE TEMPORARY TABLE {STAGING_TABLE} (
+        line_number integer NOT NULL,
+        description varchar(255) NOT NULL,
+        amount double precision NOT NULL,
+        type_of_transaction varchar(20) NOT NULL,
+        registration_date date,
+        due_date date,
+        user_id integer NOT NULL,
+        category_id integer,
+        status varchar(20) NOT NULL
+    ) ON COMMIT DROP
+    """
+)
+
+staging = table(STAGING_TABLE, *(column(name) for name in STAGING_COLUMNS))
+
+
+def _copy_text_field(value: Any) -> str:
+    if value is None:
+        return r"\N"
+    if isinstance(value, date):
+        return value.isoformat()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_to_staging(sync_session: Session, records: Sequence[tuple[Any, ...]]) -> None:
+    """
+    COPYs `records`, ordered like STAGING_COLUMNS, with the driver of the session
+
+    Meant for `session.run_sync`: with asyncpg the COPY coroutine is awaited
+    from the sync side, with psycopg2 the rows go through `copy_expert`.
+    """
+    driver_connection = sync_session.connection().connection.driver_connection
+    if hasattr(driver_connection, "copy_records_to_table"):
+        await_only(
+            driver_connection.copy_records_to_table(
+                STAGING_TABLE, records=records, columns=STAGING_COLUMNS
+            )
+        )
+        return
+
+    buffer = io.StringIO()
+    for record in records:
+        buffer.write("\t".join(_copy_text_field(value) for value in record))
+        buffer.write("\n")
+    buffer.seek(0)
+    with driver_connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {STAGING_TABLE} ({', '.join(STAGING_COLUMNS)}) FROM STDIN", buffer
+        )
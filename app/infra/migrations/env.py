@@ -5,6 +5,10 @@ from sqlalchemy import engine_from_config
 
 from app.infra.configs.settings import Settings
 from app.infra.database import mapped_registry
+from app.infra.database.orm_transaction import (
+    DESCRIPTION_SEARCH_COLUMN,
+    DESCRIPTION_SEARCH_INDEX,
+)
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -23,6 +27,14 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = mapped_registry.metadata
 
+# objects created by migrations only, which autogenerate must not drop
+DATABASE_ONLY_OBJECTS = {DESCRIPTION_SEARCH_COLUMN, DESCRIPTION_SEARCH_INDEX}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    return not (reflected and compare_to is None and name in DATABASE_ONLY_OBJECTS)
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -45,6 +57,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -66,7 +79,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
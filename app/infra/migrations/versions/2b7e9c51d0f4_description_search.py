@@ -0,0 +1,55 @@
+"""description search
+
+Revision ID: 2b7e9c51d0f4
+Revises: 8d2f61c4a9e3
+Create Date: 2026-10-18 11:03:27.190544
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "2b7e9c51d0f4"
+down_revision: str | None = "8d2f61c4a9e3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Serves the substring (ILIKE) and fuzzy (word similarity) searches
+    op.create_index(
+        "transactions_description_trgm_idx",
+        "transactions",
+        ["description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    # Stored generated column, so it is filled for existing rows and kept in sync by Postgres
+    op.add_column(
+        "transactions",
+        sa.Column(
+            "description_search",
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('portuguese', coalesce(description, ''))", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "transactions_description_search_idx",
+        "transactions",
+        ["description_search"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("transactions_description_search_idx", table_name="transactions")
+    op.drop_column("transactions", "description_search")
+    op.drop_index("transactions_description_trgm_idx", table_name="transactions")
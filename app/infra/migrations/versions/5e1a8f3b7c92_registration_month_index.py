@@ -0,0 +1,33 @@
+"""registration month index
+
+Revision ID: 5e1a8f3b7c92
+Revises: 2b7e9c51d0f4
+Create Date: 2026-10-18 12:26:54.832107
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e1a8f3b7c92"
+down_revision: str | None = "2b7e9c51d0f4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Month-only filters compare EXTRACT(MONTH FROM registration_date), so the
+    # index is built on that expression; existing rows are indexed on creation
+    op.create_index(
+        "transactions_user_id_registration_month_idx",
+        "transactions",
+        ["user_id", sa.text("EXTRACT(MONTH FROM registration_date)"), "registration_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("transactions_user_id_registration_month_idx", table_name="transactions")
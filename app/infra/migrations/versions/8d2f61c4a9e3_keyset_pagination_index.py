@@ -0,0 +1,39 @@
+"""keyset pagination index
+
+Revision ID: 8d2f61c4a9e3
+Revises: f4ed6ec7d419
+Create Date: 2026-10-18 09:12:41.503218
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2f61c4a9e3"
+down_revision: str | None = "f4ed6ec7d419"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # The listing seeks on (registration_date, transaction_id) per user, and the
+    # new index also serves every query the (user_id, registration_date) one did
+    op.create_index(
+        "transactions_user_id_registration_date_id_idx",
+        "transactions",
+        ["user_id", "registration_date", "transaction_id"],
+        unique=False,
+    )
+    op.drop_index("transactions_user_id_registration_date_idx", table_name="transactions")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "transactions_user_id_registration_date_idx",
+        "transactions",
+        ["user_id", "registration_date"],
+        unique=False,
+    )
+    op.drop_index("transactions_user_id_registration_date_id_idx", table_name="transactions")
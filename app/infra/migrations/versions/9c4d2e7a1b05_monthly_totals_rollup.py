@@ -0,0 +1,71 @@
+"""monthly totals rollup
+
+Revision ID: 9c4d2e7a1b05
+Revises: 5e1a8f3b7c92
+Create Date: 2026-10-18 13:48:10.274631
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4d2e7a1b05"
+down_revision: str | None = "5e1a8f3b7c92"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "monthly_totals",
+        sa.Column("monthly_total_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("year", sa.SmallInteger(), nullable=False),
+        sa.Column("month", sa.SmallInteger(), nullable=False),
+        sa.Column("type_of_transaction", sa.String(length=20), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("category_id", sa.Integer(), nullable=True),
+        sa.Column("total_amount", sa.Numeric(precision=15, scale=2), nullable=False),
+        sa.Column("transactions_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.user_id"]),
+        sa.PrimaryKeyConstraint("monthly_total_id"),
+        sa.UniqueConstraint(
+            "user_id",
+            "year",
+            "month",
+            "type_of_transaction",
+            "status",
+            "category_id",
+            name="monthly_totals_key",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+    # Backfill; writes wait for it so nothing is counted twice or missed
+    op.execute("LOCK TABLE transactions IN SHARE MODE")
+    op.execute(
+        """
+        INSERT INTO monthly_totals (
+            user_id, year, month, type_of_transaction, status, category_id,
+            total_amount, transactions_count
+        )
+        SELECT
+            user_id,
+            EXTRACT(YEAR FROM registration_date)::smallint,
+            EXTRACT(MONTH FROM registration_date)::smallint,
+            type_of_transaction,
+            status,
+            category_id,
+            SUM(amount::numeric(15, 2)),
+            COUNT(*)
+        FROM transactions
+        WHERE registration_date IS NOT NULL
+        GROUP BY 1, 2, 3, 4, 5, 6
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("monthly_totals")
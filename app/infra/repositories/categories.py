@@ -1,7 +1,7 @@
-from collections.abc import Sequence
+from functools import partial
 
 from sqlalchemy import func, select
-from sqlalchemy.orm import Session as SQLAlchemySession
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.abstractions.repositories import AbstractCategoryRepository
 from app.domain.entities.categories import (
@@ -9,14 +9,20 @@ from app.domain.entities.categories import (
     PartialUpdateCategory,
     SaveCategory,
 )
+from app.domain.value_objects.pagination import CountStrategy
 from app.infra.database.orm_category import Category
+from app.infra.database.routing import mark_write
+from app.infra.database.unit_of_work import after_commit
+from app.infra.repositories.counting import fetch_page_and_count, listing_count_cache
+
+COUNT_CACHE_SCOPE = "categories"
 
 
 class AdapterCategoryRepo(AbstractCategoryRepository):
-    def __init__(self, session: SQLAlchemySession) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    def _get_category_dao(self, category_id: int) -> Category:
+    async def _get_category_dao(self, category_id: int) -> Category:
         """
         It doesn't check if the category exists
 
@@ -26,39 +32,71 @@ class AdapterCategoryRepo(AbstractCategoryRepository):
         :return: Category
         """
         query = select(Category).where(Category.category_id == category_id)
-        result = self.session.execute(statement=query)
+        result = await self.session.execute(statement=query)
         category = result.scalar_one()
         return category
 
-    def get_category_id_by_name(self, name: str) -> int:
+    async def get_category_id_by_name(self, name: str) -> int:
         query = select(Category.category_id).where(func.lower(Category.name) == name.lower())
-        result = self.session.execute(statement=query)
+        result = await self.session.execute(statement=query)
         return result.scalar() or 0
 
-    def get_category_by_id(self, category_id: int) -> CategoryEntity | None:  # type: ignore
-        query = select(Category).where(Category.category_id == category_id)
-        result = self.session.execute(statement=query)
-        category_dao = result.scalar_one_or_none()
-        if not category_dao:
+    async def get_category_by_id(self, category_id: int) -> CategoryEntity | None:  # type: ignore
+        query = select(Category.category_id, Category.name, Category.description).where(
+            Category.category_id == category_id
+        )
+        result = await self.session.execute(statement=query)
+        row = result.one_or_none()
+        if row is None:
             return None
         return CategoryEntity(
-            category_id=category_dao.category_id,
-            name=category_dao.name,
-            description=category_dao.description,
+            category_id=row.category_id, name=row.name, description=row.description
+        )
+
+    async def fetch_every_category(self) -> list[CategoryEntity]:
+        query = select(Category).order_by(Category.category_id.asc())
+        result = await self.session.execute(statement=query)
+        return [
+            CategoryEntity(
+                category_id=category.category_id,
+                name=category.name,
+                description=category.description,
+            )
+            for category in result.scalars()
+        ]
+
+    async def get_categories_version(self) -> str:
+        """
+        Changes whenever a category is created, renamed or deleted
+
+        Inserts raise the greatest id, updates touch `updated_at` and deletes
+        lower the count.
+        """
+        query = select(
+            func.count(Category.category_id),
+            func.max(Category.category_id),
+            func.max(Category.updated_at),
         )
+        result = await self.session.execute(statement=query)
+        count, greatest_id, last_update = result.one()
+        return f"{count}:{greatest_id}:{last_update.isoformat() if last_update else None}"
 
-    def fetch_all(
+    async def fetch_all(
         self,
         limit: int,
         offset: int,
-    ) -> tuple[list[CategoryEntity], int]:
-        query = select(Category)
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = self.session.execute(statement=count_query)
-        total_count = total_result.scalar() or 0
-        query = query.order_by(Category.category_id.asc()).limit(limit=limit).offset(offset=offset)
-        results = self.session.execute(statement=query)
-        categories: Sequence[Category] = results.scalars().all()
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> tuple[list[CategoryEntity], int | None, bool]:
+        query = select(Category).order_by(Category.category_id.asc())
+        categories, total_count, has_more = await fetch_page_and_count(
+            self.session,
+            query=query,
+            limit=limit,
+            offset=offset,
+            count_strategy=count_strategy,
+            cache_scope=COUNT_CACHE_SCOPE,
+            cache_key=None,
+        )
         category_entities = [
             CategoryEntity(
                 category_id=category.category_id,
@@ -67,39 +105,43 @@ class AdapterCategoryRepo(AbstractCategoryRepository):
             )
             for category in categories
         ]
-        return category_entities, total_count
+        return category_entities, total_count, has_more
 
-    def save(self, new_category: SaveCategory) -> CategoryEntity:
+    async def save(self, new_category: SaveCategory) -> CategoryEntity:
         category = Category(
             name=new_category.name.capitalize(),
             description=new_category.description,
             updated_at=new_category.updated_at,
         )
         self.session.add(category)
-        self.session.commit()
-        self.session.refresh(category)
+        await self.session.flush()
+        mark_write(self.session)
+        after_commit(self.session, partial(listing_count_cache.invalidate, COUNT_CACHE_SCOPE))
         return CategoryEntity(
             category_id=category.category_id,
             name=category.name,
             description=category.description,
         )
 
-    def update(self, category_id: int, edit_category: PartialUpdateCategory) -> CategoryEntity:
-        category = self._get_category_dao(category_id=category_id)
+    async def update(
+        self, category_id: int, edit_category: PartialUpdateCategory
+    ) -> CategoryEntity:
+        category = await self._get_category_dao(category_id=category_id)
         category_name = edit_category.name or category.name
         category.name = category_name.capitalize()
         category.description = edit_category.description or category.description
         category.updated_at = edit_category.updated_at
-        self.session.commit()
-        self.session.refresh(category)
+        mark_write(self.session)
+        after_commit(self.session, partial(listing_count_cache.invalidate, COUNT_CACHE_SCOPE))
         return CategoryEntity(
             category_id=category.category_id,
             name=category.name,
             description=category.description,
         )
 
-    def delete(self, category_id: int) -> None:
-        category = self._get_category_dao(category_id=category_id)
-        self.session.delete(category)
-        self.session.commit()
+    async def delete(self, category_id: int) -> None:
+        category = await self._get_category_dao(category_id=category_id)
+        await self.session.delete(category)
+        mark_write(self.session)
+        after_commit(self.session, partial(listing_count_cache.invalidate, COUNT_CACHE_SCOPE))
         return None
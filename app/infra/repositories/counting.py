@@ -0,0 +1,230 @@
+import json
+from collections.abc import Hashable
+from itertools import count
+from typing import Any
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+from app.domain.value_objects.pagination import CountStrategy
+from app.infra.cache.memory import TTLCache
+from app.infra.configs.settings import Settings
+from app.infra.database.routing import execute_read
+
+settings = Settings()
+
+
+class Explain(Executable, ClauseElement):
+    """
+    EXPLAIN (FORMAT JSON) of a statement, used to read the planner's row estimate
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select) -> None:
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: Any, **kwargs: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kwargs)
+
+
+class ListingCountCache:
+    """
+    Totals of listing queries keyed by scope (e.g. the user) and filters
+
+    Writes invalidate a whole scope. Entries also expire after `ttl_seconds`,
+    which bounds how stale a count can get when another worker wrote.
+
+    A total counted before a write commits must not be stored after the write
+    invalidated its scope. `invalidate` bumps the version of the scope, and
+    `set` drops a total whose scope changed version since `version` was read.
+    Versions are kept for the `max_scopes` most recently invalidated scopes.
+    """
+
+    def __init__(self, max_scopes: int, max_keys_per_scope: int, ttl_seconds: float) -> None:
+        self.max_keys_per_scope = max_keys_per_scope
+        self.ttl_seconds = ttl_seconds
+        self._scopes: TTLCache[Hashable, TTLCache[Hashable, int]] = TTLCache(
+            max_entries=max_scopes, ttl_seconds=ttl_seconds
+        )
+        self._versions: TTLCache[Hashable, int] = TTLCache(max_entries=max_scopes)
+        self._next_version = count(1)
+
+    def get(self, scope: Hashable, key: Hashable) -> int | None:
+        counts = self._scopes.get(scope)
+        return counts.get(key) if counts is not None else None
+
+    def version(self, scope: Hashable) -> int:
+        """
+        Read it before counting, and pass it to `set` with the total
+        """
+        return self._versions.get(scope) or 0
+
+    def set(self, scope: Hashable, key: Hashable, total: int, version: int | None = None) -> None:
+        """
+        :param version: what `version` returned before `total` was counted; the
+            total is dropped when the scope was invalidated since
+        """
+        if version is not None and version != self.version(scope):
+            return None
+        counts = self._scopes.get(scope)
+        if counts is None:
+            counts = TTLCache(max_entries=self.max_keys_per_scope, ttl_seconds=self.ttl_seconds)
+            self._scopes.set(scope, counts)
+        counts.set(key, total)
+
+    def invalidate(self, scope: Hashable) -> None:
+        self._versions.set(scope, next(self._next_version))
+        self._scopes.delete(scope)
+
+
+listing_count_cache = ListingCountCache(
+    max_scopes=settings.LISTING_COUNT_CACHE_MAX_SCOPES,
+    max_keys_per_scope=settings.LISTING_COUNT_CACHE_MAX_KEYS_PER_SCOPE,
+    ttl_seconds=settings.LISTING_COUNT_CACHE_TTL_SECONDS,
+)
+
+
+async def _exact_count(session: AsyncSession, query: Select, user_id: int | None) -> int:
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    result = await execute_read(session, statement=count_query, user_id=user_id)
+    return result.scalar() or 0
+
+
+async def _estimated_count(session: AsyncSession, query: Select, user_id: int | None) -> int | None:
+    """
+    Row estimate of the planner for `query`, or None when it is not available
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return None
+
+    result = await execute_read(session, statement=Explain(query.order_by(None)), user_id=user_id)
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+async def _fetch_page(
+    session: AsyncSession,
+    query: Select,
+    limit: int,
+    offset: int,
+    user_id: int | None,
+    as_rows: bool = False,
+) -> tuple[list[Any], bool]:
+    result = await execute_read(
+        session, statement=query.limit(limit + 1).offset(offset), user_id=user_id
+    )
+    items = list(result.all() if as_rows else result.scalars().all())
+    return items[:limit], len(items) > limit
+
+
+async def _fetch_page_with_window_count(
+    session: AsyncSession,
+    query: Select,
+    limit: int,
+    offset: int,
+    user_id: int | None,
+    as_rows: bool = False,
+) -> tuple[list[Any], int, bool]:
+    windowed = query.add_columns(func.count().over().label("total_count"))
+    result = await execute_read(
+        session, statement=windowed.limit(limit + 1).offset(offset), user_id=user_id
+    )
+    rows = result.all()
+    if rows:
+        total_count = rows[0].total_count
+    elif offset:
+        # The page is past the end, so there is no row to carry the window count
+        total_count = await _exact_count(session, query=query, user_id=user_id)
+    else:
+        total_count = 0
+
+    items = [row[:-1] if as_rows else row[0] for row in rows[:limit]]
+    return items, total_count, len(rows) > limit
+
+
+async def fetch_page_and_count(
+    session: AsyncSession,
+    query: Select,
+    limit: int,
+    offset: int,
+    count_strategy: CountStrategy,
+    cache_scope: Hashable,
+    cache_key: Hashable,
+    user_id: int | None = None,
+    as_rows: bool = False,
+) -> tuple[list[Any], int | None, bool]:
+    """
+    Fetches one page of an ordered `query` and counts its rows with `count_strategy`
+
+    :param as_rows: return whole rows, for queries selecting columns rather
+        than one ORM entity
+
+    :return: the page, the total (None when the strategy omits it) and whether
+        there are rows past the page
+    """
+    if count_strategy == CountStrategy.NONE:
+        items, has_more = await _fetch_page(session, query, limit, offset, user_id, as_rows)
+        return items, None, has_more
+
+    if count_strategy == CountStrategy.CACHED:
+        version = listing_count_cache.version(cache_scope)
+        total_count = listing_count_cache.get(cache_scope, cache_key)
+        if total_count is not None:
+            items, has_more = await _fetch_page(session, query, limit, offset, user_id, as_rows)
+            return items, total_count, has_more
+
+        items, total_count, has_more = await _fetch_page_with_window_count(
+            session, query, limit, offset, user_id, as_rows
+        )
+        listing_count_cache.set(cache_scope, cache_key, total_count, version=version)
+        return items, total_count, has_more
+
+    if count_strategy == CountStrategy.ESTIMATED:
+        estimate = await _estimated_count(session, query=query, user_id=user_id)
+        if estimate is not None and estimate >= settings.LISTING_COUNT_ESTIMATE_THRESHOLD:
+            items, has_more = await _fetch_page(session, query, limit, offset, user_id, as_rows)
+            return items, estimate, has_more
+
+    return await _fetch_page_with_window_count(session, query, limit, offset, user_id, as_rows)
+
+
+async def count_rows(
+    session: AsyncSession,
+    query: Select,
+    count_strategy: CountStrategy,
+    cache_scope: Hashable,
+    cache_key: Hashable,
+    user_id: int | None = None,
+) -> int | None:
+    """
+    Counts the rows of `query` on its own, for listings that cannot carry a
+    window count (e.g. keyset pages, which only see the rows past the cursor)
+    """
+    if count_strategy == CountStrategy.NONE:
+        return None
+
+    if count_strategy == CountStrategy.CACHED:
+        version = listing_count_cache.version(cache_scope)
+        total_count = listing_count_cache.get(cache_scope, cache_key)
+        if total_count is None:
+            total_count = await _exact_count(session, query=query, user_id=user_id)
+            listing_count_cache.set(cache_scope, cache_key, total_count, version=version)
+        return total_count
+
+    if count_strategy == CountStrategy.ESTIMATED:
+        estimate = await _estimated_count(session, query=query, user_id=user_id)
+        if estimate is not None and estimate >= settings.LISTING_COUNT_ESTIMATE_THRESHOLD:
+            return estimate
+
+    return await _exact_count(session, query=query, user_id=user_id)
@@ -0,0 +1,336 @@
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Numeric,
+    Select,
+    SmallInteger,
+    and_,
+    cast,
+    delete,
+    extract,
+    func,
+    insert,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.value_objects.dashboard import DashboardPeriod, DashboardValues
+from app.infra.database.orm_monthly_total import MONTHLY_TOTAL_KEY_COLUMNS, MonthlyTotal
+from app.infra.database.orm_transaction import Transaction
+from app.infra.database.routing import execute_read
+
+CENTS = Decimal("0.01")
+
+
+@dataclass(frozen=True)
+class MonthlyTotalKey:
+    user_id: int
+    year: int
+    month: int
+    type_of_transaction: str
+    status: str
+    category_id: int | None
+
+
+@dataclass(frozen=True)
+class MonthlyTotalEntry:
+    """
+    What one transaction contributes to the rollup
+    """
+
+    key: MonthlyTotalKey
+    amount: Decimal
+
+    @classmethod
+    def of(cls, transaction: Transaction) -> "MonthlyTotalEntry | None":
+        if transaction.registration_date is None:
+            return None
+        return cls(
+            key=MonthlyTotalKey(
+                user_id=transaction.user_id,
+                year=transaction.registration_date.year,
+                month=transaction.registration_date.month,
+                type_of_transaction=transaction.type_of_transaction,
+                status=transaction.status,
+                category_id=transaction.category_id,
+            ),
+            amount=Decimal(transaction.amount).quantize(CENTS),
+        )
+
+
+@dataclass(frozen=True)
+class MonthlyTotalDrift:
+    key: MonthlyTotalKey
+    expected_amount: Decimal
+    expected_count: int
+    actual_amount: Decimal
+    actual_count: int
+
+
+def sums_by_period_name(periods: Sequence[DashboardPeriod], row: Any) -> dict[str, DashboardValues]:
+    """
+    Reads the `expense_<index>` and `income_<index>` columns of a period sums row
+    """
+    values = row._mapping if row is not None else {}
+    return {
+        period.name: DashboardValues(
+            total_expense=Decimal(values.get(f"expense_{index}") or 0),
+            total_income=Decimal(values.get(f"income_{index}") or 0),
+        )
+        for index, period in enumerate(periods)
+    }
+
+
+def is_month_aligned(start_date: date, end_date: date) -> bool:
+    """
+    Whether [start_date, end_date] covers whole months only
+    """
+    next_day = date.fromordinal(end_date.toordinal() + 1)
+    return start_date.day == 1 and next_day.day == 1 and start_date <= end_date
+
+
+class MonthlyTotalsRollup:
+    """
+    Keeps `monthly_totals` in step with the transactions
+
+    The deltas run in the caller's session, so they commit (or roll back)
+    together with the transaction write that caused them.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    def _insert(self):
+        if self.session.get_bind().dialect.name == "postgresql":
+            return postgresql.insert(MonthlyTotal)
+        return sqlite.insert(MonthlyTotal)
+
+    @staticmethod
+    def _is_key(key: MonthlyTotalKey) -> ColumnElement[bool]:
+        return and_(
+            MonthlyTotal.user_id == key.user_id,
+            MonthlyTotal.year == key.year,
+            MonthlyTotal.month == key.month,
+            MonthlyTotal.type_of_transaction == key.type_of_transaction,
+            MonthlyTotal.status == key.status,
+            MonthlyTotal.category_id.is_not_distinct_from(key.category_id),
+        )
+
+    async def _add_to(self, key: MonthlyTotalKey, amount: Decimal, count: int) -> None:
+        """
+        Upserts on the key, with NULLS NOT DISTINCT on Postgres
+
+        Other databases never see a conflict on a NULL category, so that key
+        is updated first and only inserted when it has no row yet.
+        """
+        if key.category_id is None and self.session.get_bind().dialect.name != "postgresql":
+            result = await self.session.execute(
+                update(MonthlyTotal)
+                .where(self._is_key(key))
+                .values(
+                    total_amount=MonthlyTotal.total_amount + amount,
+                    transactions_count=MonthlyTotal.transactions_count + count,
+                )
+            )
+            if not result.rowcount:
+                await self.session.execute(
+                    insert(MonthlyTotal).values(
+                        **key.__dict__, total_amount=amount, transactions_count=count
+                    )
+                )
+            return
+
+        statement = self._insert().values(
+            **key.__dict__, total_amount=amount, transactions_count=count
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=list(MONTHLY_TOTAL_KEY_COLUMNS),
+            set_={
+                "total_amount": MonthlyTotal.total_amount + statement.excluded.total_amount,
+                "transactions_count": (
+                    MonthlyTotal.transactions_count + statement.excluded.transactions_count
+                ),
+            },
+        )
+        await self.session.execute(statement)
+
+    async def _drop_if_empty(self, key: MonthlyTotalKey) -> None:
+        await self.session.execute(
+            delete(MonthlyTotal).where(self._is_key(key), MonthlyTotal.transactions_count <= 0)
+        )
+
+    async def apply(
+        self, before: MonthlyTotalEntry | None, after: MonthlyTotalEntry | None
+    ) -> None:
+        """
+        Moves a transaction from `before` to `after` in the rollup
+
+        :param before: its contribution before the write, None when it is new
+        :param after: its contribution after the write, None when it was deleted
+        """
+        if before and after and before.key == after.key:
+            if before.amount != after.amount:
+                await self._add_to(after.key, after.amount - before.amount, count=0)
+            return
+
+        if before:
+            await self._add_to(before.key, -before.amount, count=-1)
+            await self._drop_if_empty(before.key)
+        if after:
+            await self._add_to(after.key, after.amount, count=1)
+
+    async def add(self, entries: Iterable[MonthlyTotalEntry | None]) -> None:
+        """
+        Adds new transactions to the rollup, one upsert per month they touch
+        """
+        await self.move((None, entry) for entry in entries)
+
+    async def move(
+        self, changes: Iterable[tuple[MonthlyTotalEntry | None, MonthlyTotalEntry | None]]
+    ) -> None:
+        """
+        Applies many `(before, after)` changes like `apply`, one upsert per key they touch
+        """
+        totals: dict[MonthlyTotalKey, tuple[Decimal, int]] = {}
+        for before, after in changes:
+            for entry, sign in ((before, -1), (after, 1)):
+                if entry is None:
+                    continue
+                amount, count = totals.get(entry.key, (Decimal(0), 0))
+                totals[entry.key] = (amount + sign * entry.amount, count + sign)
+        for key, (amount, count) in totals.items():
+            if amount or count:
+                await self._add_to(key, amount, count=count)
+            if count < 0:
+                await self._drop_if_empty(key)
+
+    async def sum_by_periods(
+        self, user_id: int, periods: Sequence[DashboardPeriod]
+    ) -> dict[str, DashboardValues]:
+        """
+        Sums every period in one query, with one FILTER clause per period and type
+
+        The periods must be month aligned (see `is_month_aligned`).
+        """
+        year_month = tuple_(MonthlyTotal.year, MonthlyTotal.month)
+        columns = []
+        for index, period in enumerate(periods):
+            in_period = (year_month >= tuple_(period.start_date.year, period.start_date.month)) & (
+                year_month <= tuple_(period.end_date.year, period.end_date.month)
+            )
+            for type_of_transaction in ("expense", "income"):
+                columns.append(
+                    func.sum(MonthlyTotal.total_amount)
+                    .filter(in_period & (MonthlyTotal.type_of_transaction == type_of_transaction))
+                    .label(f"{type_of_transaction}_{index}")
+                )
+
+        first_day = min(period.start_date for period in periods)
+        last_day = max(period.end_date for period in periods)
+        sums = await execute_read(
+            self.session,
+            statement=select(*columns).where(
+                (MonthlyTotal.user_id == user_id)
+                & (year_month >= tuple_(first_day.year, first_day.month))
+                & (year_month <= tuple_(last_day.year, last_day.month))
+            ),
+            user_id=user_id,
+        )
+        return sums_by_period_name(periods=periods, row=sums.first())
+
+    @staticmethod
+    def source_query(user_id: int | None = None) -> Select:
+        """
+        The rollup computed from scratch out of the transactions
+        """
+        year = cast(extract("year", Transaction.registration_date), SmallInteger)
+        month = cast(extract("month", Transaction.registration_date), SmallInteger)
+        query = (
+            select(
+                Transaction.user_id,
+                year.label("year"),
+                month.label("month"),
+                Transaction.type_of_transaction,
+                Transaction.status,
+                Transaction.category_id,
+                func.sum(cast(Transaction.amount, Numeric(15, 2))).label("total_amount"),
+                func.count().label("transactions_count"),
+            )
+            .where(Transaction.registration_date.is_not(None))
+            .group_by(
+                Transaction.user_id,
+                year,
+                month,
+                Transaction.type_of_transaction,
+                Transaction.status,
+                Transaction.category_id,
+            )
+        )
+        if user_id is not None:
+            query = query.where(Transaction.user_id == user_id)
+        return query
+
+    async def rebuild(self, user_id: int | None = None) -> None:
+        """
+        Recomputes the rollup of one user (or everyone); the caller commits
+        """
+        if self.session.get_bind().dialect.name == "postgresql":
+            # Transaction writes take ROW EXCLUSIVE, so they wait for the rebuild
+            await self.session.execute(text("LOCK TABLE transactions IN SHARE MODE"))
+
+        statement = delete(MonthlyTotal)
+        if user_id is not None:
+            statement = statement.where(MonthlyTotal.user_id == user_id)
+        await self.session.execute(statement)
+        await self.session.execute(
+            insert(MonthlyTotal).from_select(
+                [*MONTHLY_TOTAL_KEY_COLUMNS, "total_amount", "transactions_count"],
+                self.source_query(user_id=user_id),
+            )
+        )
+
+    async def verify(self, user_id: int | None = None) -> list[MonthlyTotalDrift]:
+        """
+        Compares the rollup against the transactions
+        """
+        expected_result = await self.session.execute(self.source_query(user_id=user_id))
+        expected = {
+            MonthlyTotalKey(*row[:6]): (Decimal(row.total_amount).quantize(CENTS), row[7])
+            for row in expected_result.all()
+        }
+
+        actual_query = select(
+            *(getattr(MonthlyTotal, column) for column in MONTHLY_TOTAL_KEY_COLUMNS),
+            func.sum(MonthlyTotal.total_amount),
+            func.sum(MonthlyTotal.transactions_count),
+        ).group_by(*(getattr(MonthlyTotal, column) for column in MONTHLY_TOTAL_KEY_COLUMNS))
+        if user_id is not None:
+            actual_query = actual_query.where(MonthlyTotal.user_id == user_id)
+        actual_result = await self.session.execute(actual_query)
+        actual = {
+            MonthlyTotalKey(*row[:6]): (Decimal(row[6]).quantize(CENTS), row[7])
+            for row in actual_result.all()
+            if row[7]
+        }
+
+        missing = (Decimal(0), 0)
+        return [
+            MonthlyTotalDrift(
+                key=key,
+                expected_amount=expected.get(key, missing)[0],
+                expected_count=expected.get(key, missing)[1],
+                actual_amount=actual.get(key, missing)[0],
+                actual_count=actual.get(key, missing)[1],
+            )
+            for key in expected.keys() | actual.keys()
+            if expected.get(key, missing) != actual.get(key, missing)
+        ]
@@ -0,0 +1,69 @@
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.abstractions.repositories import AbstractRefreshTokenRepository
+from app.domain.value_objects.auth import RefreshTokenGrant, RefreshTokenRecord
+from app.infra.database.orm_refresh_token import RefreshToken
+from app.infra.database.orm_user import User
+from app.infra.database.routing import mark_write
+
+
+class AdapterRefreshTokenRepo(AbstractRefreshTokenRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def save(
+        self, user_id: int, grant: RefreshTokenGrant, family_id: str | None = None
+    ) -> None:
+        refresh_token = RefreshToken(
+            user_id=user_id,
+            family_id=family_id or uuid.uuid4().hex,
+            token_hash=grant.token_hash,
+            expires_at=grant.expires_at,
+        )
+        self.session.add(refresh_token)
+        mark_write(self.session, user_id=user_id)
+
+    async def get_unexpired_by_hash(self, token_hash: bytes) -> RefreshTokenRecord | None:
+        """
+        Locks the row, so two refreshes with the same token cannot both rotate it
+        """
+        query = (
+            select(RefreshToken, User.username)
+            .join(User, User.user_id == RefreshToken.user_id)
+            .where(RefreshToken.token_hash == token_hash)
+            .where(RefreshToken.expires_at > datetime.now(tz=UTC))
+            .with_for_update(of=RefreshToken)
+        )
+        result = await self.session.execute(statement=query)
+        row = result.one_or_none()
+        if not row:
+            return None
+        refresh_token, username = row
+        return RefreshTokenRecord(
+            refresh_token_id=refresh_token.refresh_token_id,
+            user_id=refresh_token.user_id,
+            username=username,
+            family_id=refresh_token.family_id,
+            revoked=refresh_token.revoked_at is not None,
+        )
+
+    async def rotate(self, current: RefreshTokenRecord, grant: RefreshTokenGrant) -> None:
+        await self.session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.refresh_token_id == current.refresh_token_id)
+            .values(revoked_at=datetime.now(tz=UTC))
+        )
+        await self.save(user_id=current.user_id, grant=grant, family_id=current.family_id)
+
+    async def revoke_family(self, family_id: str) -> None:
+        await self.session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id)
+            .where(RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=datetime.now(tz=UTC))
+        )
+        mark_write(self.session)
@@ -1,78 +1,275 @@
-import calendar
-from collections.abc import Sequence
-from datetime import date
+from collections import defaultdict, namedtuple
+from collections.abc import AsyncIterator, Sequence
+from datetime import date, datetime
 from decimal import Decimal
+from functools import partial
 
-from sqlalchemy import case, extract, func, select
-from sqlalchemy.orm import Session as SQLAlchemySession
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Row,
+    Select,
+    Update,
+    and_,
+    any_,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    select,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import ARRAY, REGCONFIG, TSVECTOR
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.abstractions.repositories import AbstractTransactionRepository
 from app.domain.entities.transactions import SaveTransaction, TransactionEntity
-from app.domain.value_objects.dashboard import DashboardValues
-from app.domain.value_objects.transactions import TransactionsFilter, TypeOfTransaction
+from app.domain.exceptions.transactions import (
+    TransactionAlreadyExistsException,
+    TransactionNotFoundException,
+)
+from app.domain.value_objects.batches import BatchWrite
+from app.domain.value_objects.dashboard import DashboardPeriod, DashboardValues
+from app.domain.value_objects.exports import ExportedTransaction
+from app.domain.value_objects.imports import ImportedChunk
+from app.domain.value_objects.pagination import (
+    CountStrategy,
+    CursorDirection,
+    TransactionCursor,
+)
+from app.domain.value_objects.transactions import (
+    SearchMode,
+    TransactionsFilter,
+    TypeOfTransaction,
+)
 from app.infra.database.orm_category import Category
-from app.infra.database.orm_transaction import Transaction
+from app.infra.database.orm_transaction import (
+    DESCRIPTION_SEARCH_COLUMN,
+    SEARCH_TEXT_CONFIG,
+    Transaction,
+    registration_month,
+)
+from app.infra.database.routing import execute_read, mark_write
+from app.infra.database.unit_of_work import after_commit
+from app.infra.imports.staging import (
+    CREATE_STAGING_TABLE,
+    STAGING_COLUMNS,
+    copy_to_staging,
+    staging,
+)
+from app.infra.repositories.counting import count_rows, fetch_page_and_count, listing_count_cache
+from app.infra.repositories.monthly_totals import (
+    CENTS,
+    MonthlyTotalEntry,
+    MonthlyTotalsRollup,
+    is_month_aligned,
+    sums_by_period_name,
+)
+
+DESCRIPTION_SEARCH = literal_column(f"transactions.{DESCRIPTION_SEARCH_COLUMN}", TSVECTOR)
+SEARCH_REGCONFIG = literal_column(f"'{SEARCH_TEXT_CONFIG}'::regconfig", REGCONFIG)
+
+IMPORTED_COLUMNS = STAGING_COLUMNS[1:]
+EDITED_COLUMNS = tuple(name for name in IMPORTED_COLUMNS if name != "user_id")
+
+# A transactions row read with Core, in table column order
+TransactionRow = namedtuple(  # type: ignore
+    "TransactionRow", [table_column.key for table_column in Transaction.__table__.c]
+)
+
+# The columns of a TransactionEntity in the order of its fields, so listings
+# build entities straight from Core rows instead of hydrating ORM objects
+ENTITY_COLUMNS = tuple(
+    Transaction.__table__.c[name]
+    for name in (
+        "transaction_id",
+        "description",
+        "amount",
+        "type_of_transaction",
+        "status",
+        "registration_date",
+        "due_date",
+        "user_id",
+        "category_id",
+    )
+)
+
+
+# Newest first. Undated rows lead, where Postgres puts NULLs in descending order
+# and where a backward scan of the (user_id, registration_date, transaction_id)
+# index returns them; SQLite would put them last without NULLS FIRST.
+LISTING_ORDER = (
+    Transaction.registration_date.desc().nulls_first(),
+    Transaction.transaction_id.desc(),
+)
+REVERSED_LISTING_ORDER = (
+    Transaction.registration_date.asc().nulls_last(),
+    Transaction.transaction_id.asc(),
+)
+
+
+def _past_cursor(cursor: TransactionCursor) -> ColumnElement[bool]:
+    """
+    The rows after `cursor` in LISTING_ORDER, or before it when moving backwards
+
+    A row-value comparison alone never matches undated rows, as comparing
+    with NULL is never true, so they are handled apart.
+    """
+    registration_date, transaction_id = Transaction.registration_date, Transaction.transaction_id
+    moving_backwards = cursor.direction == CursorDirection.PREV
+    if cursor.registration_date is None:
+        if moving_backwards:
+            return registration_date.is_(None) & (transaction_id > cursor.transaction_id)
+        return registration_date.is_not(None) | (transaction_id < cursor.transaction_id)
+
+    sort_key = tuple_(registration_date, transaction_id)
+    cursor_key = tuple_(cursor.registration_date, cursor.transaction_id)
+    if moving_backwards:
+        return (sort_key > cursor_key) | registration_date.is_(None)
+    return sort_key < cursor_key
+
+
+def _search_query(term: str) -> ColumnElement:
+    return func.websearch_to_tsquery(SEARCH_REGCONFIG, term)
+
+
+def _first_day_of_next_month(day: date) -> date:
+    if day.month == 12:
+        return date(day.year + 1, 1, 1)
+    return date(day.year, day.month + 1, 1)
+
+
+def _as_date(value: date | datetime | None) -> date | None:
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def _inserted_key(
+    description: str,
+    amount: Decimal | float,
+    type_of_transaction: str,
+    registration_date: date | None,
+    due_date: date | None,
+    user_id: int,
+    category_id: int | None,
+    status: str,
+) -> tuple:
+    """
+    What tells apart the rows of a multi-row insert, taken in IMPORTED_COLUMNS order
+    """
+    return (
+        description,
+        Decimal(amount).quantize(CENTS),
+        type_of_transaction,
+        _as_date(registration_date),
+        _as_date(due_date),
+        user_id,
+        category_id,
+        status,
+    )
 
 
 class AdapterTransactionRepo(AbstractTransactionRepository):
-    def __init__(self, session: SQLAlchemySession) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self.session = session
+        self.rollup = MonthlyTotalsRollup(session=session)
 
-    def _get_transaction_by_id(self, transaction_id: int) -> Transaction:
+    async def fetch_one_for_user(
+        self, transaction_id: int, user_id: int
+    ) -> TransactionEntity | None:
         """
-        It doesn't check if the transaction exists
+        Reads the transaction in one Core query, by primary key and owner
 
-        We must handle it in the use case level
-
-        :param transaction_id: int
-        :return: Transaction
+        Transactions of other users are not found.
         """
-        query = select(Transaction).where(Transaction.transaction_id == transaction_id)
-        result = self.session.execute(statement=query)
-        transaction_dao = result.scalar_one()
-        return transaction_dao
-
-    def exists(self, transaction_id: int) -> bool:
-        query = select(Transaction).where(Transaction.transaction_id == transaction_id)
-        result = self.session.execute(statement=query)
-        return bool(result.scalar_one_or_none())
+        query = select(*ENTITY_COLUMNS).where(
+            Transaction.transaction_id == transaction_id, Transaction.user_id == user_id
+        )
+        result = await execute_read(self.session, statement=query, user_id=user_id)
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return TransactionEntity(*row)
 
-    def fetch_one(self, transaction_id: int) -> TransactionEntity:
-        transaction = self._get_transaction_by_id(transaction_id=transaction_id)
+    @classmethod
+    def _to_entity(cls, transaction: Transaction) -> TransactionEntity:
         return TransactionEntity(
             transaction_id=transaction.transaction_id,
             description=transaction.description,
             amount=transaction.amount,
             type_of_transaction=transaction.type_of_transaction,  # type: ignore
-            transaction_status=transaction.status,  # type: ignore
+            transaction_status=transaction.status,
             registration_date=transaction.registration_date,
             due_date=transaction.due_date,
             user_id=transaction.user_id,
             category_id=transaction.category_id,
         )
 
-    def fetch_all(
-        self,
-        user_id: int,
-        filters: TransactionsFilter,
-        page: int,
-        page_size: int,
-    ) -> tuple[list[TransactionEntity], int]:
-        query = select(Transaction).where(Transaction.user_id == user_id)
+    @staticmethod
+    def _count_cache_scope(user_id: int) -> tuple[str, int]:
+        return "transactions", user_id
+
+    def _invalidate_counts_after_commit(self, user_id: int) -> None:
+        after_commit(
+            self.session,
+            partial(listing_count_cache.invalidate, self._count_cache_scope(user_id=user_id)),
+        )
+
+    def _uses_postgresql(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    def _description_clause(self, filters: TransactionsFilter) -> ColumnElement[bool]:
+        """
+        Off Postgres (e.g. SQLite test databases) full-text search falls back to
+        matching every word as a substring, and fuzzy search to a plain substring
+        """
+        term = filters.description or ""
+        if filters.search_mode == SearchMode.FULLTEXT:
+            if self._uses_postgresql():
+                return DESCRIPTION_SEARCH.op("@@")(_search_query(term))
+            return and_(*(Transaction.description.ilike(f"%{word}%") for word in term.split()))
+
+        if filters.search_mode == SearchMode.FUZZY and self._uses_postgresql():
+            return literal(term).op("<%")(Transaction.description)
+
+        return Transaction.description.ilike(f"%{term}%")
+
+    def _search_rank(self, filters: TransactionsFilter) -> ColumnElement[float] | None:
+        if not filters.description or not self._uses_postgresql():
+            return None
+        if filters.search_mode == SearchMode.FULLTEXT:
+            return func.ts_rank(DESCRIPTION_SEARCH, _search_query(filters.description))
+        if filters.search_mode == SearchMode.FUZZY:
+            return func.word_similarity(filters.description, Transaction.description)
+        return None
+
+    def _filtered_query(self, user_id: int, filters: TransactionsFilter, *columns) -> Select:
+        """
+        :param columns: what to select, the Transaction entity by default
+        """
+        query = select(*(columns or (Transaction,))).where(Transaction.user_id == user_id)
         if filters.month and filters.year:
-            last_day = calendar.monthrange(filters.year, filters.month)[1]
-            query = query.where(
-                Transaction.registration_date >= date(filters.year, filters.month, 1)
-            ).where(Transaction.registration_date <= date(filters.year, filters.month, last_day))
+            first_day = date(filters.year, filters.month, 1)
+            query = query.where(Transaction.registration_date >= first_day).where(
+                Transaction.registration_date < _first_day_of_next_month(first_day)
+            )
         elif filters.year:
             query = query.where(Transaction.registration_date >= date(filters.year, 1, 1)).where(
-                Transaction.registration_date <= date(filters.year, 12, 31)
+                Transaction.registration_date < date(filters.year + 1, 1, 1)
             )
         elif filters.month:
-            query = query.where(extract("month", Transaction.registration_date) == filters.month)
+            query = query.where(registration_month == filters.month)
 
         if filters.description:
-            query = query.where(Transaction.description.ilike(f"%{filters.description}%"))
+            query = query.where(self._description_clause(filters=filters))
         if filters.type_of_transaction and filters.type_of_transaction == TypeOfTransaction.INCOME:
             query = query.where(Transaction.type_of_transaction == TypeOfTransaction.INCOME.value)
         elif (
@@ -80,7 +277,9 @@ class AdapterTransactionRepo(AbstractTransactionRepository):
         ):
             query = query.where(Transaction.type_of_transaction == TypeOfTransaction.EXPENSE.value)
 
-        if filters.category:
+        if filters.category_id:
+            query = query.where(Transaction.category_id == filters.category_id)
+        elif filters.category:
             query = query.join(Category, Transaction.category_id == Category.category_id).where(
                 func.lower(Category.name) == filters.category.lower()
             )
@@ -88,134 +287,616 @@ class AdapterTransactionRepo(AbstractTransactionRepository):
         if filters.status_of_transaction:
             query = query.where(Transaction.status == filters.status_of_transaction)
 
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = self.session.execute(statement=count_query)
-        total_count = total_result.scalar() or 0
-
-        offset = (page - 1) * page_size
-        query = query.order_by(Transaction.registration_date.desc()).limit(page_size).offset(offset)
-
-        result = self.session.execute(statement=query)
-        transactions: Sequence[Transaction] = result.scalars().all()
-        transaction_entities = [
-            TransactionEntity(
-                transaction_id=transaction.transaction_id,
-                description=transaction.description,
-                amount=transaction.amount,
-                type_of_transaction=transaction.type_of_transaction,  # type: ignore
-                transaction_status=transaction.status,
-                registration_date=transaction.registration_date,
-                due_date=transaction.due_date,
-                user_id=transaction.user_id,
-                category_id=transaction.category_id,
-            )
-            for transaction in transactions
-        ]
-        return transaction_entities, total_count
+        return query
+
+    async def fetch_all(
+        self,
+        user_id: int,
+        filters: TransactionsFilter,
+        page: int,
+        page_size: int,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> tuple[list[TransactionEntity], int | None, bool]:
+        """
+        Full-text and fuzzy searches list the best matches first
+
+        :return: the page, the total counted with `count_strategy` and whether
+            there is a next page
+        """
+        query = self._filtered_query(user_id, filters, *ENTITY_COLUMNS)
+        search_rank = self._search_rank(filters=filters)
+        if search_rank is not None:
+            query = query.order_by(search_rank.desc())
+        query = query.order_by(*LISTING_ORDER)
+        rows, total_count, has_more = await fetch_page_and_count(
+            self.session,
+            query=query,
+            limit=page_size,
+            offset=(page - 1) * page_size,
+            count_strategy=count_strategy,
+            cache_scope=self._count_cache_scope(user_id=user_id),
+            cache_key=filters,
+            user_id=user_id,
+            as_rows=True,
+        )
+        return [TransactionEntity(*row) for row in rows], total_count, has_more
+
+    async def stream_all(
+        self, user_id: int, filters: TransactionsFilter, batch_size: int
+    ) -> AsyncIterator[list[ExportedTransaction]]:
+        """
+        Every matching transaction in listing order, `batch_size` rows at a time
+
+        Rows are read through a server-side cursor, so memory does not grow
+        with the number of matches. The cursor keeps its connection until the
+        last batch is consumed, and reads stay on the primary since replica
+        reads are buffered.
+        """
+        category_name = (
+            select(Category.name)
+            .where(Category.category_id == Transaction.category_id)
+            .correlate(Transaction)
+            .scalar_subquery()
+        )
+        query = (
+            self._filtered_query(
+                user_id,
+                filters,
+                Transaction.transaction_id,
+                Transaction.description,
+                Transaction.amount,
+                Transaction.type_of_transaction,
+                Transaction.status,
+                Transaction.registration_date,
+                Transaction.due_date,
+                category_name,
+            )
+            .order_by(*LISTING_ORDER)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(query)
+        try:
+            async for rows in result.partitions(batch_size):
+                yield [ExportedTransaction(*row) for row in rows]
+        finally:
+            await result.close()
 
-    def update(
+    async def fetch_all_by_cursor(
+        self,
+        user_id: int,
+        filters: TransactionsFilter,
+        page_size: int,
+        cursor: TransactionCursor | None = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> tuple[list[TransactionEntity], int | None, bool]:
+        """
+        Seeks on (registration_date, transaction_id) instead of skipping rows with OFFSET
+
+        Searches keep that order, as a relevance order cannot be seeked on
+
+        :return: the page in listing order, the total counted with `count_strategy`
+            and whether more rows exist past the page in the direction of the cursor
+        """
+        query = self._filtered_query(user_id, filters, *ENTITY_COLUMNS)
+        total_count = await count_rows(
+            self.session,
+            query=query,
+            count_strategy=count_strategy,
+            cache_scope=self._count_cache_scope(user_id=user_id),
+            cache_key=filters,
+            user_id=user_id,
+        )
+
+        moving_backwards = cursor is not None and cursor.direction == CursorDirection.PREV
+        if cursor is not None:
+            query = query.where(_past_cursor(cursor=cursor))
+        query = query.order_by(*(REVERSED_LISTING_ORDER if moving_backwards else LISTING_ORDER))
+
+        result = await execute_read(
+            self.session, statement=query.limit(page_size + 1), user_id=user_id
+        )
+        rows = result.all()
+        has_more = len(rows) > page_size
+        transaction_entities = [TransactionEntity(*row) for row in rows[:page_size]]
+        if moving_backwards:
+            transaction_entities.reverse()
+        return transaction_entities, total_count, has_more
+
+    async def update(
         self,
         transaction_id: int,
         edit_transaction: SaveTransaction,
         category_id: int,
-    ) -> TransactionEntity:
-        transaction_dao = self._get_transaction_by_id(transaction_id=transaction_id)
-        transaction_dao.description = edit_transaction.description
-        transaction_dao.amount = edit_transaction.amount
-        transaction_dao.type_of_transaction = edit_transaction.type_of_transaction  # type: ignore
-        transaction_dao.status = edit_transaction.transaction_status  # type: ignore
-        transaction_dao.registration_date = edit_transaction.registration_date
-        transaction_dao.due_date = edit_transaction.due_date  # type: ignore
-        transaction_dao.category_id = category_id
-
-        self.session.commit()
-        self.session.refresh(transaction_dao)
-        return TransactionEntity(
-            transaction_id=transaction_dao.transaction_id,
-            description=transaction_dao.description,
-            amount=transaction_dao.amount,
-            type_of_transaction=transaction_dao.type_of_transaction,  # type: ignore
-            transaction_status=transaction_dao.status,  # type: ignore
-            registration_date=transaction_dao.registration_date,
-            due_date=transaction_dao.due_date,  # type: ignore
-            user_id=transaction_dao.user_id,
-            category_id=transaction_dao.category_id,
-        )
-
-    def save(
+        user_id: int,
+    ) -> tuple[TransactionEntity, TransactionEntity]:
+        """
+        Updates a transaction of `user_id` with a single `UPDATE ... RETURNING`
+
+        On Postgres the row is locked by a sub-select in FROM, which RETURNING
+        reads the previous values from; SQLite reads them with a SELECT first.
+
+        :return: the transaction as it was and as it is now
+        :raises TransactionNotFoundException: when no transaction of the user has that id
+        """
+        transactions = Transaction.__table__
+        edited_values = {
+            name: value
+            for name, value in self._values_of(
+                new_transaction=edit_transaction, user_id=user_id, category_id=category_id
+            ).items()
+            if name in EDITED_COLUMNS
+        }
+        owned = (transactions.c.transaction_id == transaction_id) & (
+            transactions.c.user_id == user_id
+        )
+        try:
+            if self._uses_postgresql():
+                result = await self.session.execute(
+                    self._update_returning_previous(owned=owned, edited_values=edited_values)
+                )
+                row = result.one_or_none()
+            else:
+                result = await self.session.execute(select(*transactions.c).where(owned))
+                row = result.one_or_none()
+                if row is not None:
+                    await self.session.execute(
+                        update(transactions).where(owned).values(edited_values)
+                    )
+        except IntegrityError:
+            raise TransactionAlreadyExistsException() from None
+
+        if row is None:
+            raise TransactionNotFoundException(f"Transaction with id {transaction_id} not found")
+        before = TransactionRow(*row)
+        after = before._replace(**edited_values)
+
+        mark_write(self.session, user_id=user_id)
+        await self.rollup.apply(
+            before=MonthlyTotalEntry.of(before),  # type: ignore
+            after=MonthlyTotalEntry.of(after),  # type: ignore
+        )
+        self._invalidate_counts_after_commit(user_id=user_id)
+        return self._to_entity(before), self._to_entity(after)  # type: ignore
+
+    @staticmethod
+    def _update_returning_previous(owned: ColumnElement[bool], edited_values: dict) -> Update:
+        """
+        `UPDATE transactions ... FROM (SELECT ... FOR UPDATE) AS previous RETURNING previous.*`
+
+        The sub-select reads the row before the update and locks it, so
+        RETURNING hands back the previous values instead of the new ones.
+        """
+        transactions = Transaction.__table__
+        previous = select(*transactions.c).where(owned).with_for_update().subquery("previous")
+        return (
+            update(transactions)
+            .where(transactions.c.transaction_id == previous.c.transaction_id)
+            .values(edited_values)
+            .returning(*previous.c)
+        )
+
+    async def save(
         self, new_transaction: SaveTransaction, user_id: int, category_id: int
     ) -> TransactionEntity:
-        transaction_dao = Transaction(
-            description=new_transaction.description,
-            amount=new_transaction.amount,
-            type_of_transaction=new_transaction.type_of_transaction,  # type: ignore
-            registration_date=new_transaction.registration_date,
-            status=new_transaction.transaction_status,  # type: ignore
-            due_date=new_transaction.due_date,  # type: ignore
+        """
+        Inserts the transaction with a single `INSERT ... RETURNING`
+
+        :raises TransactionAlreadyExistsException: when it breaks a uniqueness rule
+        """
+        transactions = Transaction.__table__
+        try:
+            result = await self.session.execute(
+                insert(transactions)
+                .values(
+                    self._values_of(
+                        new_transaction=new_transaction, user_id=user_id, category_id=category_id
+                    )
+                )
+                .returning(*transactions.c)
+            )
+        except IntegrityError:
+            raise TransactionAlreadyExistsException() from None
+        row = result.one()
+
+        mark_write(self.session, user_id=user_id)
+        await self.rollup.apply(before=None, after=MonthlyTotalEntry.of(row))  # type: ignore
+        self._invalidate_counts_after_commit(user_id=user_id)
+        return self._to_entity(row)  # type: ignore
+
+    @staticmethod
+    def _values_of(new_transaction: SaveTransaction, user_id: int, category_id: int) -> dict:
+        return {
+            "description": new_transaction.description,
+            "amount": new_transaction.amount,
+            "type_of_transaction": new_transaction.type_of_transaction,
+            "registration_date": _as_date(new_transaction.registration_date),
+            "due_date": _as_date(new_transaction.due_date),
+            "user_id": user_id,
+            "category_id": category_id,
+            "status": new_transaction.transaction_status,
+        }
+
+    async def save_many(
+        self, new_transactions: Sequence[tuple[SaveTransaction, int, int]]
+    ) -> list[TransactionEntity | None]:
+        """
+        Inserts transactions of any users with one multi-row `INSERT ... RETURNING`
+
+        Transactions breaking a uniqueness rule are skipped.
+
+        :param new_transactions: each transaction with the ids of its user and its category
+        :return: the saved transaction of each one, in the same order, None for the skipped ones
+        :raises TransactionAlreadyExistsException: when a row breaks another integrity
+            rule, such as a category deleted meanwhile; nothing is inserted then
+        """
+        records = self._owned_records(new_transactions=new_transactions)
+        try:
+            inserted = await self._insert_ignoring_duplicates(
+                records=records, returning=Transaction.__table__.c
+            )
+        except IntegrityError:
+            raise TransactionAlreadyExistsException() from None
+
+        for user_id in {user_id for _, user_id, _ in new_transactions}:
+            mark_write(self.session, user_id=user_id)
+            self._invalidate_counts_after_commit(user_id=user_id)
+        await self.rollup.add(MonthlyTotalEntry.of(row) for row in inserted)  # type: ignore
+        return [
+            self._to_entity(row) if row else None  # type: ignore
+            for row in self._match_inserted(records=records, inserted=inserted)
+        ]
+
+    async def bulk_save(
+        self, new_transactions: Sequence[tuple[SaveTransaction, int]], user_id: int
+    ) -> ImportedChunk:
+        """
+        Inserts a chunk of imported transactions in one statement
+
+        Transactions breaking a uniqueness rule, such as an expense already
+        registered with the same description and due date, are skipped.
+
+        :param new_transactions: each transaction with the id of its category
+        """
+        records = self._records(new_transactions=new_transactions, user_id=user_id)
+        if self._uses_postgresql():
+            inserted = await self._insert_through_staging(records=records)
+        else:
+            inserted = await self._insert_ignoring_duplicates(
+                records=records, returning=self._imported_returning()
+            )
+
+        mark_write(self.session, user_id=user_id)
+        await self.rollup.add(MonthlyTotalEntry.of(row) for row in inserted)  # type: ignore
+        self._invalidate_counts_after_commit(user_id=user_id)
+        return ImportedChunk(
+            inserted=len(inserted),
+            registration_dates=frozenset(
+                _as_date(row.registration_date) for row in inserted if row.registration_date
+            ),
+        )
+
+    @classmethod
+    def _records(
+        cls, new_transactions: Sequence[tuple[SaveTransaction, int]], user_id: int
+    ) -> list[tuple]:
+        """
+        :return: one tuple per transaction, its position followed by IMPORTED_COLUMNS
+        """
+        return cls._owned_records(
+            new_transactions=[
+                (new_transaction, user_id, category_id)
+                for new_transaction, category_id in new_transactions
+            ]
+        )
+
+    @staticmethod
+    def _owned_records(new_transactions: Sequence[tuple[SaveTransaction, int, int]]) -> list[tuple]:
+        """
+        Like `_records`, for transactions of different users
+        """
+        return [
+            (
+                position,
+                new_transaction.description,
+                float(new_transaction.amount),
+                new_transaction.type_of_transaction,
+                _as_date(new_transaction.registration_date),
+                _as_date(new_transaction.due_date),
+                user_id,
+                category_id,
+                new_transaction.transaction_status,
+            )
+            for position, (new_transaction, user_id, category_id) in enumerate(new_transactions)
+        ]
+
+    def _imported_returning(self) -> tuple:
+        transactions = Transaction.__table__
+        return (
+            transactions.c.user_id,
+            transactions.c.registration_date,
+            transactions.c.type_of_transaction,
+            transactions.c.status,
+            transactions.c.category_id,
+            transactions.c.amount,
+        )
+
+    async def _insert_through_staging(self, records: list[tuple]) -> list:
+        await self.session.execute(CREATE_STAGING_TABLE)
+        await self.session.run_sync(copy_to_staging, records)
+        statement = (
+            postgresql.insert(Transaction.__table__)
+            .from_select(
+                IMPORTED_COLUMNS,
+                select(*(staging.c[name] for name in IMPORTED_COLUMNS)).order_by(
+                    staging.c.line_number
+                ),
+            )
+            .on_conflict_do_nothing()
+            .returning(*self._imported_returning())
+        )
+        result = await self.session.execute(statement)
+        return list(result.all())
+
+    async def _insert_ignoring_duplicates(self, records: list[tuple], returning: Sequence) -> list:
+        dialect_insert = postgresql.insert if self._uses_postgresql() else sqlite.insert
+        statement = (
+            dialect_insert(Transaction.__table__).on_conflict_do_nothing().returning(*returning)
+        )
+        result = await self.session.execute(
+            statement, [dict(zip(IMPORTED_COLUMNS, record[1:], strict=True)) for record in records]
+        )
+        return list(result.all())
+
+    async def apply_batch(
+        self,
+        user_id: int,
+        creates: Sequence[tuple[SaveTransaction, int]],
+        updates: Sequence[tuple[int, SaveTransaction, int]],
+        deletes: Sequence[int],
+    ) -> BatchWrite:
+        """
+        Deletes, updates and creates transactions of one user; the caller commits
+
+        Each kind of write is one statement: `DELETE ... RETURNING`,
+        `UPDATE ... FROM (VALUES ...) RETURNING` and a multi-row
+        `INSERT ... ON CONFLICT DO NOTHING RETURNING`. Transactions of other
+        users are neither updated nor deleted, and creations breaking a
+        uniqueness rule are skipped; the result leaves both out.
+
+        :param creates: each new transaction with the id of its category
+        :param updates: id, new values and category id of each transaction to update
+        :param deletes: ids of the transactions to delete
+        """
+        transactions = Transaction.__table__
+        changes: list[tuple[MonthlyTotalEntry | None, MonthlyTotalEntry | None]] = []
+        registration_dates: set[date | None] = set()
+
+        deleted: list[Row] = []
+        if deletes:
+            result = await self.session.execute(
+                delete(transactions)
+                .where(transactions.c.user_id == user_id, self._id_in(deletes))
+                .returning(*transactions.c)
+            )
+            deleted = list(result.all())
+            changes.extend((MonthlyTotalEntry.of(row), None) for row in deleted)  # type: ignore
+            registration_dates.update(row.registration_date for row in deleted)
+
+        updated: list[Row] = []
+        if updates:
+            result = await self.session.execute(
+                select(*transactions.c)
+                .where(
+                    transactions.c.user_id == user_id,
+                    self._id_in([transaction_id for transaction_id, *_ in updates]),
+                )
+                .with_for_update()
+            )
+            before = {row.transaction_id: row for row in result.all()}
+            owned_updates = [edit for edit in updates if edit[0] in before]
+            if owned_updates:
+                updated = await self._update_many(user_id=user_id, updates=owned_updates)
+            changes.extend(
+                (MonthlyTotalEntry.of(before[row.transaction_id]), MonthlyTotalEntry.of(row))  # type: ignore
+                for row in updated
+            )
+            registration_dates.update(row.registration_date for row in before.values())
+            registration_dates.update(row.registration_date for row in updated)
+
+        created: list[Row | None] = []
+        if creates:
+            records = self._records(new_transactions=creates, user_id=user_id)
+            inserted = await self._insert_ignoring_duplicates(
+                records=records, returning=transactions.c
+            )
+            created = self._match_inserted(records=records, inserted=inserted)
+            changes.extend((None, MonthlyTotalEntry.of(row)) for row in inserted)  # type: ignore
+            registration_dates.update(row.registration_date for row in inserted)
+
+        mark_write(self.session, user_id=user_id)
+        await self.rollup.move(changes)
+        self._invalidate_counts_after_commit(user_id=user_id)
+        return BatchWrite(
+            created=[self._to_entity(row) if row else None for row in created],  # type: ignore
+            updated={row.transaction_id: self._to_entity(row) for row in updated},  # type: ignore
+            deleted=frozenset(row.transaction_id for row in deleted),
+            registration_dates=frozenset(
+                _as_date(registration_date)
+                for registration_date in registration_dates
+                if registration_date
+            ),
+        )
+
+    def _id_in(self, transaction_ids: Sequence[int]) -> ColumnElement[bool]:
+        """
+        On Postgres the ids travel as one array, so the statement text does not
+        depend on how many there are
+        """
+        if self._uses_postgresql():
+            return Transaction.transaction_id == any_(
+                literal(list(transaction_ids), ARRAY(Integer))
+            )
+        return Transaction.transaction_id.in_(transaction_ids)
+
+    async def _update_many(
+        self, user_id: int, updates: Sequence[tuple[int, SaveTransaction, int]]
+    ) -> list[Row]:
+        transactions = Transaction.__table__
+        records = self._records(
+            new_transactions=[(edit, category_id) for _, edit, category_id in updates],
             user_id=user_id,
-            category_id=category_id,
         )
-        self.session.add(transaction_dao)
-        self.session.commit()
-        self.session.refresh(transaction_dao)
+        edited_rows = [
+            {
+                "transaction_id": transaction_id,
+                **{
+                    name: value
+                    for name, value in zip(IMPORTED_COLUMNS, record[1:], strict=True)
+                    if name in EDITED_COLUMNS
+                },
+            }
+            for (transaction_id, *_), record in zip(updates, records, strict=True)
+        ]
+        try:
+            if not self._uses_postgresql():
+                # SQLite has no column list for VALUES in FROM: one UPDATE per row
+                updated: list[Row] = []
+                for edited_row in edited_rows:
+                    result = await self.session.execute(
+                        update(transactions)
+                        .where(
+                            transactions.c.transaction_id == edited_row["transaction_id"],
+                            transactions.c.user_id == user_id,
+                        )
+                        .values({name: edited_row[name] for name in EDITED_COLUMNS})
+                        .returning(*transactions.c)
+                    )
+                    updated.extend(result.all())
+                return updated
 
-        return TransactionEntity(
-            transaction_id=transaction_dao.transaction_id,
-            description=transaction_dao.description,
-            amount=transaction_dao.amount,
-            type_of_transaction=transaction_dao.type_of_transaction,  # type: ignore
-            transaction_status=transaction_dao.status,  # type: ignore
-            registration_date=transaction_dao.registration_date,
-            due_date=transaction_dao.due_date,  # type: ignore
-            user_id=transaction_dao.user_id,
-            category_id=transaction_dao.category_id,
-        )
-
-    def delete(self, transaction_id: int) -> None:
-        transaction = self._get_transaction_by_id(transaction_id=transaction_id)
-        self.session.delete(transaction)
-        self.session.commit()
-        return None
+            edited = values(
+                column("transaction_id", Integer),
+                *(column(name, transactions.c[name].type) for name in EDITED_COLUMNS),
+                name="edited",
+            ).data(
+                [
+                    (edited_row["transaction_id"], *(edited_row[name] for name in EDITED_COLUMNS))
+                    for edited_row in edited_rows
+                ]
+            )
+            result = await self.session.execute(
+                update(transactions)
+                .where(
+                    transactions.c.transaction_id == edited.c.transaction_id,
+                    transactions.c.user_id == user_id,
+                )
+                .values(
+                    {
+                        name: cast(edited.c[name], transactions.c[name].type)
+                        for name in EDITED_COLUMNS
+                    }
+                )
+                .returning(*transactions.c)
+            )
+            return list(result.all())
+        except IntegrityError:
+            raise TransactionAlreadyExistsException(
+                "An update conflicts with an existing transaction"
+            ) from None
+
+    @staticmethod
+    def _match_inserted(records: list[tuple], inserted: list[Row]) -> list[Row | None]:
+        """
+        RETURNING does not tell which record each inserted row came from, so
+        they are matched by value; records with the same values are interchangeable
+
+        :return: the row inserted for each record, None for the skipped ones
+        """
+        inserted_by_key: dict[tuple, list[Row]] = defaultdict(list)
+        for row in inserted:
+            inserted_by_key[
+                _inserted_key(*(getattr(row, name) for name in IMPORTED_COLUMNS))
+            ].append(row)
+
+        matched: list[Row | None] = []
+        for record in records:
+            candidates = inserted_by_key[_inserted_key(*record[1:])]
+            matched.append(candidates.pop() if candidates else None)
+        return matched
+
+    async def delete(self, transaction_id: int, user_id: int) -> TransactionEntity:
+        """
+        Deletes a transaction of `user_id` with a single `DELETE ... RETURNING`
+
+        :return: the deleted transaction
+        :raises TransactionNotFoundException: when no transaction of the user has that id
+        """
+        transactions = Transaction.__table__
+        result = await self.session.execute(
+            delete(transactions)
+            .where(
+                transactions.c.transaction_id == transaction_id,
+                transactions.c.user_id == user_id,
+            )
+            .returning(*transactions.c)
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise TransactionNotFoundException(f"Transaction with id {transaction_id} not found")
+
+        mark_write(self.session, user_id=user_id)
+        await self.rollup.apply(before=MonthlyTotalEntry.of(row), after=None)  # type: ignore
+        self._invalidate_counts_after_commit(user_id=user_id)
+        return self._to_entity(row)  # type: ignore
 
-    def get_sum_of_transactions_by_interval(
+    async def get_sum_of_transactions_by_interval(
         self,
         user_id: int,
         start_date: date,
         end_date: date,
     ) -> DashboardValues:
-        result = self.session.execute(
-            select(
-                func.sum(
-                    case(
-                        (
-                            Transaction.type_of_transaction == "expense",
-                            Transaction.amount,
-                        )  # type: ignore
-                    )
-                ).label("total_expense"),
-                func.sum(
-                    case(
-                        (
-                            Transaction.type_of_transaction == "income",
-                            Transaction.amount,
-                        )  # type: ignore
-                    )
-                ).label("total_income"),
-            ).where(
-                (Transaction.user_id == user_id)
-                & (Transaction.registration_date >= start_date)
-                & (Transaction.registration_date <= end_date)
-            )
-        ).first()
+        period = DashboardPeriod(name="interval", start_date=start_date, end_date=end_date)
+        sums = await self.get_sums_by_periods(user_id=user_id, periods=[period])
+        return sums[period.name]
 
-        total_expense: Decimal = (
-            result.total_expense if result and result.total_expense else Decimal(0)
-        )
-        total_income: Decimal = (
-            result.total_income if result and result.total_income else Decimal(0)
-        )
+    async def get_sums_by_periods(
+        self,
+        user_id: int,
+        periods: Sequence[DashboardPeriod],
+    ) -> dict[str, DashboardValues]:
+        """
+        Sums expenses and incomes of every period in a single query
 
-        return DashboardValues(
-            total_expense=total_expense,
-            total_income=total_income,
+        Whole-month periods are summed from the monthly rollup; otherwise one
+        scan over the transactions spanning all periods is used
+
+        :return: the sums keyed by period name
+        """
+        if all(
+            is_month_aligned(start_date=period.start_date, end_date=period.end_date)
+            for period in periods
+        ):
+            return await self.rollup.sum_by_periods(user_id=user_id, periods=periods)
+
+        columns = []
+        for index, period in enumerate(periods):
+            in_period = (Transaction.registration_date >= period.start_date) & (
+                Transaction.registration_date <= period.end_date
+            )
+            for type_of_transaction in ("expense", "income"):
+                columns.append(
+                    func.sum(Transaction.amount)
+                    .filter(in_period & (Transaction.type_of_transaction == type_of_transaction))
+                    .label(f"{type_of_transaction}_{index}")
+                )
+
+        sums = await execute_read(
+            self.session,
+            statement=select(*columns).where(
+                (Transaction.user_id == user_id)
+                & (Transaction.registration_date >= min(period.start_date for period in periods))
+                & (Transaction.registration_date <= max(period.end_date for period in periods))
+            ),
+            user_id=user_id,
         )
+        return sums_by_period_name(periods=periods, row=sums.first())
@@ -1,26 +1,33 @@
 from datetime import datetime
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session as SQLAlchemySession
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.abstractions.repositories import AbstractUserRepository
 from app.domain.entities.users import UserEntity
 from app.domain.value_objects.auth import SavedUser, UserLogin
 from app.infra.database.orm_user import User
+from app.infra.database.routing import execute_read, mark_write
 
 
 class AdapterUserRepo(AbstractUserRepository):
-    def __init__(self, session: SQLAlchemySession) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    def get_user_id_by_username(self, username) -> int:
+    async def get_user_id_by_username(self, username) -> int:
         query = select(User.user_id).where(User.username == username)
-        result = self.session.execute(statement=query)
+        result = await execute_read(self.session, statement=query)
+        user_id = result.scalar()
+        if user_id:
+            return user_id
+
+        # A user registered moments ago may not have reached the replica yet
+        result = await self.session.execute(statement=query)
         return result.scalar() or 0
 
-    def get_user_password_by_id(self, user_id: int) -> UserLogin:
+    async def get_user_password_by_id(self, user_id: int) -> UserLogin:
         query = select(User).where(User.user_id == user_id)
-        result = self.session.execute(statement=query)
+        result = await self.session.execute(statement=query)
         user_dao = result.scalars().first()
         user = UserLogin(
             username=user_dao.username,
@@ -29,13 +36,13 @@ class AdapterUserRepo(AbstractUserRepository):
         )
         return user
 
-    def user_already_exists(self, username: str, email: str) -> bool:
-        user_found = self.session.scalar(
+    async def user_already_exists(self, username: str, email: str) -> bool:
+        user_found = await self.session.scalar(
             select(User).where((User.email == email) | (User.username == username))
         )
         return bool(user_found)
 
-    def save(self, user: UserEntity) -> SavedUser:
+    async def save(self, user: UserEntity) -> SavedUser:
         user_dao = User(
             email=user.email,
             username=user.username,
@@ -43,6 +50,11 @@ class AdapterUserRepo(AbstractUserRepository):
             updated_at=datetime.now(),
         )
         self.session.add(user_dao)
-        self.session.commit()
-        self.session.refresh(user_dao)
+        await self.session.flush()
+        mark_write(self.session, user_id=user_dao.user_id)
         return SavedUser(username=user_dao.username, email=user.email)
+
+    async def update_password_hash(self, user_id: int, password_hash: bytes) -> None:
+        query = update(User).where(User.user_id == user_id).values(password_hash=password_hash)
+        await self.session.execute(statement=query)
+        mark_write(self.session, user_id=user_id)
@@ -1,12 +1,28 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from prometheus_fastapi_instrumentator import Instrumentator
 
+from app.api.dependencies.categories import warm_category_registry
+from app.api.dependencies.transactions import transaction_group_commit
 from app.api.handlers import domain_exception_handler, global_500_exception_handler
 from app.api.v1 import api_v1_router
 from app.domain.exceptions.base import BaseDomainException
+from app.infra.auth.password_handler import password_hashing_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    await warm_category_registry()
+    yield
+    if transaction_group_commit:
+        await transaction_group_commit.close()
+    password_hashing_pool.shutdown()
+
 
-app = FastAPI(title="Fintracker API")
+app = FastAPI(title="Fintracker API", lifespan=lifespan)
 
 origins = [
     "http://localhost:3000",
@@ -1,8 +1,15 @@
 from app.domain.abstractions.password_handler import PasswordHandlerAbstraction
-from app.domain.abstractions.repositories import AbstractUserRepository
+from app.domain.abstractions.repositories import (
+    AbstractRefreshTokenRepository,
+    AbstractUserRepository,
+)
 from app.domain.abstractions.token import TokenProviderAbstraction
+from app.domain.abstractions.unit_of_work import AbstractUnitOfWork
 from app.domain.abstractions.usecases import AbstractUseCase
-from app.domain.exceptions.auth import InvalidCredentialsException
+from app.domain.exceptions.auth import (
+    InvalidCredentialsException,
+    PasswordHashingUnavailableException,
+)
 from app.domain.exceptions.users import UserNotFoundException
 from app.domain.value_objects.auth import LoginCredentials, PublicToken
 
@@ -13,17 +20,21 @@ class LoginUseCase(AbstractUseCase):
         user_repo: AbstractUserRepository,
         password_handler: PasswordHandlerAbstraction,
         token_provider: TokenProviderAbstraction,
+        unit_of_work: AbstractUnitOfWork,
+        refresh_token_repo: AbstractRefreshTokenRepository | None = None,
     ) -> None:
         self.user_repo = user_repo
         self.password_handler = password_handler
         self.token_provider = token_provider
+        self.unit_of_work = unit_of_work
+        self.refresh_token_repo = refresh_token_repo
 
     async def execute(self, credentials: LoginCredentials) -> PublicToken:
-        user_id = self.user_repo.get_user_id_by_username(username=credentials.username)
+        user_id = await self.user_repo.get_user_id_by_username(username=credentials.username)
         if not user_id:
             raise UserNotFoundException(message=f"User with {credentials.username} was not found")
-        user = self.user_repo.get_user_password_by_id(user_id=user_id)
-        user_authenticated = self.password_handler.verify_password(
+        user = await self.user_repo.get_user_password_by_id(user_id=user_id)
+        user_authenticated = await self.password_handler.verify_password(
             raw_password=credentials.password, hashed_password=user.password_hash
         )
         if not user_authenticated:
@@ -31,7 +42,34 @@ class LoginUseCase(AbstractUseCase):
                 message=f"User {credentials.username} with invalid credentials"
             )
 
+        if self.password_handler.needs_rehash(hashed_password=user.password_hash):
+            await self._rehash_password(user_id=user_id, raw_password=credentials.password)
+
         token = self.token_provider.encode_token(
             username=user.username,
+            user_id=user_id,
+        )
+        if not self.refresh_token_repo:
+            await self.unit_of_work.commit()
+            return token
+
+        grant = self.token_provider.encode_refresh_token()
+        await self.refresh_token_repo.save(user_id=user_id, grant=grant)
+        await self.unit_of_work.commit()
+        return PublicToken(
+            access_token=token.access_token,
+            token_type=token.token_type,
+            refresh_token=grant.token,
         )
-        return token
+
+    async def _rehash_password(self, user_id: int, raw_password: str) -> None:
+        """
+        Upgrades the hash to the current cost factor while the raw password is at hand
+
+        A busy hashing pool does not fail the login: the next login tries again.
+        """
+        try:
+            password_hash = await self.password_handler.encrypted_password(password=raw_password)
+        except PasswordHashingUnavailableException:
+            return None
+        await self.user_repo.update_password_hash(user_id=user_id, password_hash=password_hash)
@@ -0,0 +1,81 @@
+from app.domain.abstractions.repositories import AbstractRefreshTokenRepository
+from app.domain.abstractions.token import TokenProviderAbstraction
+from app.domain.abstractions.unit_of_work import AbstractUnitOfWork
+from app.domain.abstractions.usecases import AbstractUseCase
+from app.domain.exceptions.auth import InvalidTokenException
+from app.domain.value_objects.auth import PublicToken
+
+
+class RefreshAccessTokenUseCase(AbstractUseCase):
+    """
+    Trades a refresh token for a new access token without checking the password
+
+    The refresh token is rotated on every use. A refresh token that was already
+    used or revoked means it leaked, so its whole family is revoked and the
+    user has to log in again.
+    """
+
+    def __init__(
+        self,
+        refresh_token_repo: AbstractRefreshTokenRepository,
+        token_provider: TokenProviderAbstraction,
+        unit_of_work: AbstractUnitOfWork,
+    ) -> None:
+        self.refresh_token_repo = refresh_token_repo
+        self.token_provider = token_provider
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, refresh_token: str) -> PublicToken:
+        current = await self.refresh_token_repo.get_unexpired_by_hash(
+            token_hash=self.token_provider.hash_refresh_token(refresh_token=refresh_token)
+        )
+        if not current:
+            raise InvalidTokenException(message="Refresh token is invalid")
+        if current.revoked:
+            await self.refresh_token_repo.revoke_family(family_id=current.family_id)
+            await self.unit_of_work.commit()
+            raise InvalidTokenException(message="Refresh token is invalid")
+
+        grant = self.token_provider.encode_refresh_token()
+        await self.refresh_token_repo.rotate(current=current, grant=grant)
+        await self.unit_of_work.commit()
+
+        token = self.token_provider.encode_token(
+            username=current.username,
+            user_id=current.user_id,
+        )
+        return PublicToken(
+            access_token=token.access_token,
+            token_type=token.token_type,
+            refresh_token=grant.token,
+        )
+
+
+class RevokeRefreshTokenUseCase(AbstractUseCase):
+    def __init__(
+        self,
+        refresh_token_repo: AbstractRefreshTokenRepository,
+        token_provider: TokenProviderAbstraction,
+        unit_of_work: AbstractUnitOfWork,
+    ) -> None:
+        self.refresh_token_repo = refresh_token_repo
+        self.token_provider = token_provider
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, refresh_token: str, access_token: str | None = None) -> None:
+        """
+        Revokes the token and every token rotated from the same login
+
+        Unknown or expired tokens are ignored, there is nothing left to revoke.
+
+        :param access_token: the access token of the session, rejected from now
+            on instead of staying valid until it expires
+        """
+        if access_token:
+            self.token_provider.revoke_token(token=access_token)
+        current = await self.refresh_token_repo.get_unexpired_by_hash(
+            token_hash=self.token_provider.hash_refresh_token(refresh_token=refresh_token)
+        )
+        if current:
+            await self.refresh_token_repo.revoke_family(family_id=current.family_id)
+            await self.unit_of_work.commit()
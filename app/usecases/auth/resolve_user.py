@@ -0,0 +1,33 @@
+from app.domain.abstractions.cache import AbstractCacheBackend
+from app.domain.abstractions.repositories import AbstractUserRepository
+from app.domain.abstractions.usecases import AbstractUseCase
+from app.domain.exceptions.users import UserNotFoundException
+from app.domain.value_objects.auth import JWTPayload
+
+
+class ResolveUserIdUseCase(AbstractUseCase):
+    """
+    User id of an authenticated request
+
+    Tokens carry it in the `uid` claim. Tokens issued before the claim existed
+    only carry the username, which is looked up once and then cached.
+    """
+
+    def __init__(self, user_repo: AbstractUserRepository, cache: AbstractCacheBackend) -> None:
+        self.user_repo = user_repo
+        self.cache = cache
+
+    async def execute(self, token_payload: JWTPayload) -> int:
+        if token_payload.uid is not None:
+            return token_payload.uid
+
+        cache_key = f"user_id:{token_payload.sub}"
+        user_id = await self.cache.get(cache_key)
+        if user_id is not None:
+            return user_id
+
+        user_id = await self.user_repo.get_user_id_by_username(username=token_payload.sub)
+        if not user_id:
+            raise UserNotFoundException(f"User {token_payload.sub} not found")
+        await self.cache.set(cache_key, user_id)
+        return user_id
@@ -1,22 +1,34 @@
 from app.domain.abstractions.repositories import (
     AbstractCategoryRepository,
 )
+from app.domain.abstractions.unit_of_work import AbstractUnitOfWork
 from app.domain.abstractions.usecases import AbstractUseCase
 from app.domain.exceptions.categories import CategoryNotFoundException
+from app.usecases.categories.registry import CategoryRegistry
 
 
 class DeleteCategoryUseCase(AbstractUseCase):
-    def __init__(self, category_repo: AbstractCategoryRepository):
+    def __init__(
+        self,
+        category_repo: AbstractCategoryRepository,
+        unit_of_work: AbstractUnitOfWork,
+        category_registry: CategoryRegistry | None = None,
+    ):
         self.category_repo = category_repo
+        self.unit_of_work = unit_of_work
+        self.category_registry = category_registry
 
     async def execute(
         self,
         category_id: int,
     ) -> None:
-        category = self.category_repo.get_category_by_id(category_id=category_id)
+        category = await self.category_repo.get_category_by_id(category_id=category_id)
         if not category:
             raise CategoryNotFoundException(f"Category with id {category_id} not found")
 
-        return self.category_repo.delete(
+        await self.category_repo.delete(
             category_id=category_id,
         )
+        await self.unit_of_work.commit()
+        if self.category_registry:
+            self.category_registry.invalidate()
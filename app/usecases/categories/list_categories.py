@@ -3,7 +3,7 @@ from app.domain.abstractions.usecases import AbstractUseCase
 from app.domain.entities.base import PagedResponse
 from app.domain.entities.categories import CategoryEntity
 from app.domain.exceptions.categories import CategoryNotFoundException
-from app.domain.value_objects.pagination import PaginationParams
+from app.domain.value_objects.pagination import CountStrategy, PaginationParams
 
 
 class ListCategoriesUseCase(AbstractUseCase):
@@ -13,10 +13,12 @@ class ListCategoriesUseCase(AbstractUseCase):
     async def execute(
         self,
         pagination: PaginationParams,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
     ) -> PagedResponse[CategoryEntity]:
-        categories, total = self.category_repo.fetch_all(
+        categories, total, has_more = await self.category_repo.fetch_all(
             limit=pagination.page_size,
             offset=pagination.offset,
+            count_strategy=count_strategy,
         )
 
         return PagedResponse(
@@ -24,6 +26,8 @@ class ListCategoriesUseCase(AbstractUseCase):
             total_count=total,
             page=pagination.page,
             items_per_page=pagination.page_size,
+            count_strategy=count_strategy,
+            more_items=has_more,
         )
 
 
@@ -35,7 +39,7 @@ class GetOneCategoryUseCase(AbstractUseCase):
         self,
         category_id: int,
     ) -> CategoryEntity | None:
-        category = self.category_repo.get_category_by_id(
+        category = await self.category_repo.get_category_by_id(
             category_id=category_id,
         )
         if not category:
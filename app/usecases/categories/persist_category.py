@@ -1,47 +1,69 @@
 from app.domain.abstractions.repositories import (
     AbstractCategoryRepository,
 )
+from app.domain.abstractions.unit_of_work import AbstractUnitOfWork
 from app.domain.abstractions.usecases import AbstractUseCase
 from app.domain.entities.categories import CategoryEntity, PartialUpdateCategory, SaveCategory
 from app.domain.exceptions.categories import (
     CategoryAlreadyExistsException,
     CategoryNotFoundException,
 )
+from app.usecases.categories.registry import CategoryRegistry
 
 
 class CreateCategoryUseCase(AbstractUseCase):
-    def __init__(self, category_repo: AbstractCategoryRepository):
+    def __init__(
+        self,
+        category_repo: AbstractCategoryRepository,
+        unit_of_work: AbstractUnitOfWork,
+        category_registry: CategoryRegistry | None = None,
+    ):
         self.category_repo = category_repo
+        self.unit_of_work = unit_of_work
+        self.category_registry = category_registry
 
     async def execute(
         self,
         new_category: SaveCategory,
     ) -> CategoryEntity:
-        category_id = self.category_repo.get_category_id_by_name(name=new_category.name)
+        category_id = await self.category_repo.get_category_id_by_name(name=new_category.name)
         if category_id:
             raise CategoryAlreadyExistsException(f"Category {new_category.name} already exists")
 
-        return self.category_repo.save(
+        category = await self.category_repo.save(
             new_category=new_category,
         )
+        await self.unit_of_work.commit()
+        if self.category_registry:
+            self.category_registry.invalidate()
+        return category
 
 
 class UpdateCategoryUseCase(AbstractUseCase):
-    def __init__(self, category_repo: AbstractCategoryRepository):
+    def __init__(
+        self,
+        category_repo: AbstractCategoryRepository,
+        unit_of_work: AbstractUnitOfWork,
+        category_registry: CategoryRegistry | None = None,
+    ):
         self.category_repo = category_repo
+        self.unit_of_work = unit_of_work
+        self.category_registry = category_registry
 
     async def execute(
         self,
         category_id: int,
         edit_category: PartialUpdateCategory,
     ) -> CategoryEntity:
-        category = self.category_repo.get_category_by_id(category_id=category_id)
+        category = await self.category_repo.get_category_by_id(category_id=category_id)
         if not category:
             raise CategoryNotFoundException(message=f"Category with id {category_id} not found")
 
         category_with_the_same_name_already_exists = False
         if edit_category.name:
-            found_category_id = self.category_repo.get_category_id_by_name(name=edit_category.name)
+            found_category_id = await self.category_repo.get_category_id_by_name(
+                name=edit_category.name
+            )
             category_with_the_same_name_already_exists = bool(
                 found_category_id and found_category_id != category_id
             )
@@ -51,7 +73,11 @@ class UpdateCategoryUseCase(AbstractUseCase):
                 message=f"Category {edit_category.name} already exists"
             )
 
-        return self.category_repo.update(
+        category = await self.category_repo.update(
             category_id=category_id,
             edit_category=edit_category,
         )
+        await self.unit_of_work.commit()
+        if self.category_registry:
+            self.category_registry.invalidate()
+        return category
@@ -0,0 +1,91 @@
+import asyncio
+import time
+
+from app.domain.abstractions.repositories import AbstractCategoryRepository
+from app.domain.entities.categories import CategoryEntity
+
+
+class CategoryRegistry:
+    """
+    In-process, case-insensitive map of category names to categories
+
+    Categories are global and rarely change, so every worker keeps all of them
+    in memory. Writes made by this worker invalidate the map right away; writes
+    made by other workers are noticed through the version stamp of the table,
+    checked at most once every `refresh_interval_seconds`.
+    """
+
+    def __init__(self, refresh_interval_seconds: float) -> None:
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._by_name: dict[str, CategoryEntity] | None = None
+        self._version: str | None = None
+        self._checked_at = 0.0
+        self._generation = 0
+        self._stale = True
+        self._lock = asyncio.Lock()
+
+    @property
+    def version(self) -> str | None:
+        return self._version
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._stale = True
+
+    async def refresh(self, category_repo: AbstractCategoryRepository) -> None:
+        async with self._lock:
+            generation = self._generation
+            version = await category_repo.get_categories_version()
+            categories = await category_repo.fetch_every_category()
+            self._by_name = {category.name.lower(): category for category in categories}
+            self._version = version
+            self._checked_at = time.monotonic()
+            # a write committed while loading leaves the map stale for the next caller
+            self._stale = generation != self._generation
+
+    async def _ensure_fresh(self, category_repo: AbstractCategoryRepository) -> None:
+        if self._by_name is None or self._stale:
+            await self.refresh(category_repo=category_repo)
+            return
+
+        if time.monotonic() - self._checked_at < self.refresh_interval_seconds:
+            return
+
+        version = await category_repo.get_categories_version()
+        self._checked_at = time.monotonic()
+        if version != self._version:
+            await self.refresh(category_repo=category_repo)
+
+    async def get_by_name(
+        self, category_repo: AbstractCategoryRepository, name: str
+    ) -> CategoryEntity | None:
+        await self._ensure_fresh(category_repo=category_repo)
+        category = self._by_name.get(name.lower()) if self._by_name is not None else None
+        if category:
+            return category
+
+        # it may have been created by another worker since the last version check
+        category_id = await category_repo.get_category_id_by_name(name=name)
+        if not category_id:
+            return None
+        self.invalidate()
+        return await category_repo.get_category_by_id(category_id=category_id)
+
+    async def get_category_id(self, category_repo: AbstractCategoryRepository, name: str) -> int:
+        category = await self.get_by_name(category_repo=category_repo, name=name)
+        return category.category_id if category else 0
+
+
+async def resolve_category_id(
+    category_repo: AbstractCategoryRepository,
+    category_registry: CategoryRegistry | None,
+    name: str,
+) -> int:
+    """
+    Id of the category named `name`, through the registry when there is one
+
+    :return: 0 when there is no such category
+    """
+    if category_registry:
+        return await category_registry.get_category_id(category_repo=category_repo, name=name)
+    return await category_repo.get_category_id_by_name(name=name)
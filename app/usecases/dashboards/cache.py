@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from datetime import date
+from itertools import count
+
+from app.domain.abstractions.cache import AbstractCacheBackend
+from app.domain.business_logic.dashboard import dashboards_covering
+from app.domain.value_objects.dashboard import DashboardResume
+
+
+class DashboardResumeCache:
+    """
+    Dashboard resumes keyed by (user_id, month, year)
+
+    Writes invalidate exactly the dashboards whose periods contain the dates
+    they touched, but only in the worker that served the write. With an
+    in-process backend, other workers keep serving their copy until it
+    expires, so a dashboard can be up to DASHBOARD_CACHE_TTL_SECONDS behind
+    a write made elsewhere. A per-user stamp would not help much here: with
+    the monthly rollup, reading a stamp costs about as much as recomputing
+    the resume. A shared backend removes the bound.
+
+    A resume computed before a write commits must not be stored after the
+    write invalidated it. `invalidate` bumps a generation per key, and `set`
+    drops a resume whose key changed generation since `generation` was read.
+    Only the `max_generations` most recently invalidated keys keep one; a key
+    dropped while its resume is computed is no longer guarded.
+    """
+
+    def __init__(self, backend: AbstractCacheBackend, max_generations: int = 10000) -> None:
+        self.backend = backend
+        self.max_generations = max_generations
+        self._generations: OrderedDict[str, int] = OrderedDict()
+        self._next_generation = count(1)
+
+    @staticmethod
+    def key(user_id: int, month: int, year: int) -> str:
+        return f"dashboard:{user_id}:{year}:{month}"
+
+    async def get(self, user_id: int, month: int, year: int) -> DashboardResume | None:
+        return await self.backend.get(self.key(user_id=user_id, month=month, year=year))
+
+    def generation(self, user_id: int, month: int, year: int) -> int:
+        """
+        Read it before computing a resume, and pass it to `set` with the resume
+        """
+        return self._generations.get(self.key(user_id=user_id, month=month, year=year), 0)
+
+    async def set(
+        self,
+        user_id: int,
+        month: int,
+        year: int,
+        resume: DashboardResume,
+        generation: int | None = None,
+    ) -> None:
+        """
+        :param generation: what `generation` returned before `resume` was computed;
+            the resume is dropped when the dashboard was invalidated since
+        """
+        if generation is not None and generation != self.generation(user_id, month, year):
+            return None
+        await self.backend.set(self.key(user_id=user_id, month=month, year=year), resume)
+
+    async def invalidate(self, user_id: int, *days: date | None) -> None:
+        keys = {
+            self.key(user_id=user_id, month=month, year=year)
+            for day in days
+            if day is not None
+            for month, year in dashboards_covering(day)
+        }
+        if not keys:
+            return None
+        for key in keys:
+            self._generations[key] = next(self._next_generation)
+            self._generations.move_to_end(key)
+        while len(self._generations) > self.max_generations:
+            self._generations.popitem(last=False)
+        await self.backend.delete(*keys)
@@ -0,0 +1,257 @@
+from collections.abc import Sequence
+
+from app.domain.abstractions.repositories import (
+    AbstractCategoryRepository,
+    AbstractTransactionRepository,
+)
+from app.domain.abstractions.unit_of_work import AbstractUnitOfWork
+from app.domain.abstractions.usecases import AbstractUseCase
+from app.domain.entities.transactions import SaveTransaction
+from app.domain.exceptions.transactions import (
+    BatchTooLargeException,
+    TransactionAlreadyExistsException,
+)
+from app.domain.value_objects.batches import (
+    BatchItemResult,
+    BatchItemStatus,
+    BatchOperation,
+    BatchOperationType,
+    BatchRejection,
+    BatchWrite,
+)
+from app.usecases.categories.registry import CategoryRegistry, resolve_category_id
+from app.usecases.dashboards.cache import DashboardResumeCache
+
+
+class BatchTransactionsUseCase(AbstractUseCase):
+    """
+    Creates, updates and deletes many transactions of a user in one commit
+
+    Every operation gets its own result: invalid ones, unknown categories and
+    transactions that are not the user's are reported without failing the
+    others. Deletes run first, then updates, then creations, so a batch may
+    delete an expense and create it again with the same description and
+    due date.
+
+    The writes run in a savepoint. When an update breaks a uniqueness rule the
+    savepoint is rolled back and the updates are retried one savepoint each,
+    so only the conflicting ones fail.
+    """
+
+    def __init__(
+        self,
+        transaction_repo: AbstractTransactionRepository,
+        category_repo: AbstractCategoryRepository,
+        unit_of_work: AbstractUnitOfWork,
+        max_operations: int,
+        category_registry: CategoryRegistry | None = None,
+        dashboard_cache: DashboardResumeCache | None = None,
+    ):
+        self.transaction_repo = transaction_repo
+        self.category_repo = category_repo
+        self.unit_of_work = unit_of_work
+        self.max_operations = max_operations
+        self.category_registry = category_registry
+        self.dashboard_cache = dashboard_cache
+
+    async def execute(
+        self, user_id: int, operations: Sequence[BatchOperation | BatchRejection]
+    ) -> list[BatchItemResult]:
+        if len(operations) > self.max_operations:
+            raise BatchTooLargeException(f"A batch takes at most {self.max_operations} operations")
+
+        results: dict[int, BatchItemResult] = {}
+        creates: list[BatchOperation] = []
+        updates: list[BatchOperation] = []
+        deletes: list[BatchOperation] = []
+        category_ids = await self._get_category_ids(operations=operations)
+        seen_transaction_ids: set[int] = set()
+        for operation in operations:
+            if isinstance(operation, BatchRejection):
+                results[operation.index] = BatchItemResult(
+                    index=operation.index, status=BatchItemStatus.INVALID, error=operation.reason
+                )
+                continue
+
+            if operation.transaction_id is not None:
+                if operation.transaction_id in seen_transaction_ids:
+                    results[operation.index] = BatchItemResult(
+                        index=operation.index,
+                        status=BatchItemStatus.INVALID,
+                        transaction_id=operation.transaction_id,
+                        error=f"Transaction {operation.transaction_id} appears more than once",
+                    )
+                    continue
+                seen_transaction_ids.add(operation.transaction_id)
+
+            if operation.transaction and not category_ids[operation.transaction.category.lower()]:
+                results[operation.index] = BatchItemResult(
+                    index=operation.index,
+                    status=BatchItemStatus.INVALID,
+                    transaction_id=operation.transaction_id,
+                    error=f"Category {operation.transaction.category} not found",
+                )
+            elif operation.operation == BatchOperationType.CREATE:
+                creates.append(operation)
+            elif operation.operation == BatchOperationType.UPDATE:
+                updates.append(operation)
+            else:
+                deletes.append(operation)
+
+        if creates or updates or deletes:
+            await self._write(
+                user_id=user_id,
+                creates=creates,
+                updates=updates,
+                deletes=deletes,
+                category_ids=category_ids,
+                results=results,
+            )
+        return [results[index] for index in sorted(results)]
+
+    async def _get_category_ids(
+        self, operations: Sequence[BatchOperation | BatchRejection]
+    ) -> dict[str, int]:
+        names = {
+            operation.transaction.category.lower()
+            for operation in operations
+            if isinstance(operation, BatchOperation) and operation.transaction
+        }
+        return {
+            name: await resolve_category_id(
+                category_repo=self.category_repo,
+                category_registry=self.category_registry,
+                name=name,
+            )
+            for name in names
+        }
+
+    async def _write(
+        self,
+        user_id: int,
+        creates: list[BatchOperation],
+        updates: list[BatchOperation],
+        deletes: list[BatchOperation],
+        category_ids: dict[str, int],
+        results: dict[int, BatchItemResult],
+    ) -> None:
+        def with_category_id(transaction: SaveTransaction) -> tuple[SaveTransaction, int]:
+            return transaction, category_ids[transaction.category.lower()]
+
+        create_values = [with_category_id(operation.transaction) for operation in creates]  # type: ignore
+        update_values = [
+            (operation.transaction_id, *with_category_id(operation.transaction))  # type: ignore
+            for operation in updates
+        ]
+        delete_ids = [operation.transaction_id for operation in deletes]
+        conflicting_ids: set[int] = set()
+        try:
+            async with self.unit_of_work.savepoint():
+                written = await self.transaction_repo.apply_batch(
+                    user_id=user_id,
+                    creates=create_values,
+                    updates=update_values,  # type: ignore
+                    deletes=delete_ids,  # type: ignore
+                )
+        except TransactionAlreadyExistsException:
+            written, conflicting_ids = await self._write_updates_one_at_a_time(
+                user_id=user_id,
+                creates=create_values,
+                updates=update_values,  # type: ignore
+                deletes=delete_ids,  # type: ignore
+            )
+        await self.unit_of_work.commit()
+
+        for operation, created in zip(creates, written.created, strict=True):
+            results[operation.index] = (
+                BatchItemResult(
+                    index=operation.index,
+                    status=BatchItemStatus.CREATED,
+                    transaction_id=created.transaction_id,
+                    transaction=created,
+                )
+                if created
+                else BatchItemResult(
+                    index=operation.index,
+                    status=BatchItemStatus.CONFLICT,
+                    error="Transaction already exists",
+                )
+            )
+        for operation in updates:
+            if operation.transaction_id in conflicting_ids:
+                results[operation.index] = BatchItemResult(
+                    index=operation.index,
+                    status=BatchItemStatus.CONFLICT,
+                    transaction_id=operation.transaction_id,
+                    error="Transaction already exists",
+                )
+                continue
+            updated = written.updated.get(operation.transaction_id)  # type: ignore
+            results[operation.index] = BatchItemResult(
+                index=operation.index,
+                status=BatchItemStatus.UPDATED if updated else BatchItemStatus.NOT_FOUND,
+                transaction_id=operation.transaction_id,
+                transaction=updated,
+                error=None if updated else f"Transaction {operation.transaction_id} not found",
+            )
+        for operation in deletes:
+            was_deleted = operation.transaction_id in written.deleted
+            results[operation.index] = BatchItemResult(
+                index=operation.index,
+                status=BatchItemStatus.DELETED if was_deleted else BatchItemStatus.NOT_FOUND,
+                transaction_id=operation.transaction_id,
+                error=None if was_deleted else f"Transaction {operation.transaction_id} not found",
+            )
+
+        if self.dashboard_cache and written.registration_dates:
+            months = {day.replace(day=1) for day in written.registration_dates}
+            await self.dashboard_cache.invalidate(user_id, *months)
+
+    async def _write_updates_one_at_a_time(
+        self,
+        user_id: int,
+        creates: list[tuple[SaveTransaction, int]],
+        updates: list[tuple[int, SaveTransaction, int]],
+        deletes: list[int],
+    ) -> tuple[BatchWrite, set[int]]:
+        """
+        Keeps the order of a batch: deletes, then updates, then creations
+
+        :return: what was written and the ids of the updates that conflicted
+        """
+        written = [
+            await self.transaction_repo.apply_batch(
+                user_id=user_id, creates=[], updates=[], deletes=deletes
+            )
+        ]
+        conflicting_ids: set[int] = set()
+        for update in updates:
+            try:
+                async with self.unit_of_work.savepoint():
+                    written.append(
+                        await self.transaction_repo.apply_batch(
+                            user_id=user_id, creates=[], updates=[update], deletes=[]
+                        )
+                    )
+            except TransactionAlreadyExistsException:
+                conflicting_ids.add(update[0])
+        created = await self.transaction_repo.apply_batch(
+            user_id=user_id, creates=creates, updates=[], deletes=[]
+        )
+        written.append(created)
+
+        return (
+            BatchWrite(
+                created=created.created,
+                updated={
+                    transaction_id: transaction
+                    for write in written
+                    for transaction_id, transaction in write.updated.items()
+                },
+                deleted=frozenset().union(*(write.deleted for write in written)),
+                registration_dates=frozenset().union(
+                    *(write.registration_dates for write in written)
+                ),
+            ),
+            conflicting_ids,
+        )
@@ -1,38 +1,60 @@
 from app.domain.abstractions.repositories import (
     AbstractCategoryRepository,
     AbstractTransactionRepository,
-    AbstractUserRepository,
 )
+from app.domain.abstractions.unit_of_work import AbstractUnitOfWork
 from app.domain.abstractions.usecases import AbstractUseCase
 from app.domain.entities.transactions import SaveTransaction, TransactionEntity
 from app.domain.exceptions.categories import CategoryNotFoundException
-from app.domain.exceptions.users import UserNotFoundException
+from app.usecases.categories.registry import CategoryRegistry, resolve_category_id
+from app.usecases.dashboards.cache import DashboardResumeCache
+from app.usecases.transactions.group_commit import TransactionGroupCommit
 
 
 class CreateTransactionUseCase(AbstractUseCase):
+    """
+    With a `group_commit` the transaction is saved and committed together
+    with the others created at the same time, outside the request session.
+    """
+
     def __init__(
         self,
-        user_repo: AbstractUserRepository,
         transaction_repo: AbstractTransactionRepository,
         category_repo: AbstractCategoryRepository,
+        unit_of_work: AbstractUnitOfWork,
+        dashboard_cache: DashboardResumeCache | None = None,
+        category_registry: CategoryRegistry | None = None,
+        group_commit: TransactionGroupCommit | None = None,
     ):
-        self.user_repo = user_repo
         self.transaction_repo = transaction_repo
         self.category_repo = category_repo
+        self.unit_of_work = unit_of_work
+        self.dashboard_cache = dashboard_cache
+        self.category_registry = category_registry
+        self.group_commit = group_commit
 
     async def execute(
         self,
         new_transaction: SaveTransaction,
-        username: str,
+        user_id: int,
     ) -> TransactionEntity:
-        user_id = self.user_repo.get_user_id_by_username(username=username)
-        if not user_id:
-            raise UserNotFoundException(f"User {username} not found")
-
-        category_id = self.category_repo.get_category_id_by_name(name=new_transaction.category)
+        category_id = await resolve_category_id(
+            category_repo=self.category_repo,
+            category_registry=self.category_registry,
+            name=new_transaction.category,
+        )
         if not category_id:
             raise CategoryNotFoundException(f"Category {new_transaction.category} not found")
 
-        return self.transaction_repo.save(
-            new_transaction=new_transaction, user_id=user_id, category_id=category_id
-        )
+        if self.group_commit:
+            transaction = await self.group_commit.save(
+                new_transaction=new_transaction, user_id=user_id, category_id=category_id
+            )
+        else:
+            transaction = await self.transaction_repo.save(
+                new_transaction=new_transaction, user_id=user_id, category_id=category_id
+            )
+            await self.unit_of_work.commit()
+        if self.dashboard_cache:
+            await self.dashboard_cache.invalidate(user_id, transaction.registration_date)
+        return transaction
@@ -1,34 +1,30 @@
-from app.domain.abstractions.repositories import (
-    AbstractTransactionRepository,
-    AbstractUserRepository,
-)
+from app.domain.abstractions.repositories import AbstractTransactionRepository
+from app.domain.abstractions.unit_of_work import AbstractUnitOfWork
 from app.domain.abstractions.usecases import AbstractUseCase
-from app.domain.exceptions.transactions import TransactionNotFoundException
-from app.domain.exceptions.users import UserNotFoundException
+from app.usecases.dashboards.cache import DashboardResumeCache
 
 
 class DeleteTransactionUseCase(AbstractUseCase):
     def __init__(
         self,
-        user_repo: AbstractUserRepository,
         transaction_repo: AbstractTransactionRepository,
+        unit_of_work: AbstractUnitOfWork,
+        dashboard_cache: DashboardResumeCache | None = None,
     ):
-        self.user_repo = user_repo
         self.transaction_repo = transaction_repo
+        self.unit_of_work = unit_of_work
+        self.dashboard_cache = dashboard_cache
 
     async def execute(
         self,
         transaction_id: int,
-        username: str,
+        user_id: int,
     ) -> None:
-        user_id = self.user_repo.get_user_id_by_username(username=username)
-        if not user_id:
-            raise UserNotFoundException(f"User {username} not found")
-
-        transaction = self.transaction_repo.fetch_one(transaction_id=transaction_id)
-        if not transaction:
-            raise TransactionNotFoundException(f"Transaction with id {transaction_id} not found")
-
-        return self.transaction_repo.delete(
+        transaction = await self.transaction_repo.delete(
             transaction_id=transaction_id,
+            user_id=user_id,
         )
+        await self.unit_of_work.commit()
+        if self.dashboard_cache:
+            await self.dashboard_cache.invalidate(user_id, transaction.registration_date)
+        return None
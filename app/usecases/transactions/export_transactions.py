@@ -0,0 +1,55 @@
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager
+
+from app.domain.abstractions.repositories import (
+    AbstractCategoryRepository,
+    AbstractTransactionRepository,
+)
+from app.domain.abstractions.usecases import AbstractUseCase
+from app.domain.value_objects.exports import ExportedTransaction
+from app.domain.value_objects.transactions import TransactionsFilter
+from app.usecases.categories.registry import CategoryRegistry
+from app.usecases.transactions.list_transactions import resolve_category_filter
+
+TransactionRepoFactory = Callable[[], AbstractAsyncContextManager[AbstractTransactionRepository]]
+
+
+class ExportTransactionsUseCase(AbstractUseCase):
+    """
+    Streams every transaction matching the filters, `batch_size` rows at a time
+
+    The export outlives the request handler, so it reads through a repository
+    of its own, opened once the first batch is requested and closed after the
+    last one.
+    """
+
+    def __init__(
+        self,
+        open_transaction_repo: TransactionRepoFactory,
+        batch_size: int,
+        category_repo: AbstractCategoryRepository | None = None,
+        category_registry: CategoryRegistry | None = None,
+    ):
+        self.open_transaction_repo = open_transaction_repo
+        self.batch_size = batch_size
+        self.category_repo = category_repo
+        self.category_registry = category_registry
+
+    async def execute(
+        self, user_id: int, filters: TransactionsFilter
+    ) -> AsyncIterator[list[ExportedTransaction]]:
+        filters = await resolve_category_filter(
+            filters=filters,
+            category_repo=self.category_repo,
+            category_registry=self.category_registry,
+        )
+        return self._stream(user_id=user_id, filters=filters)
+
+    async def _stream(
+        self, user_id: int, filters: TransactionsFilter
+    ) -> AsyncIterator[list[ExportedTransaction]]:
+        async with self.open_transaction_repo() as transaction_repo:
+            async for batch in transaction_repo.stream_all(
+                user_id=user_id, filters=filters, batch_size=self.batch_size
+            ):
+                yield batch
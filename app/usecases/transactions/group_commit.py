@@ -0,0 +1,142 @@
+import asyncio
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+
+from app.domain.abstractions.repositories import AbstractTransactionRepository
+from app.domain.abstractions.unit_of_work import AbstractUnitOfWork
+from app.domain.entities.transactions import SaveTransaction, TransactionEntity
+from app.domain.exceptions.transactions import TransactionAlreadyExistsException
+
+TransactionWriterFactory = Callable[
+    [], AbstractAsyncContextManager[tuple[AbstractTransactionRepository, AbstractUnitOfWork]]
+]
+
+
+@dataclass(slots=True)
+class PendingTransaction:
+    new_transaction: SaveTransaction
+    user_id: int
+    category_id: int
+    saved: asyncio.Future[TransactionEntity]
+
+    @property
+    def values(self) -> tuple[SaveTransaction, int, int]:
+        return self.new_transaction, self.user_id, self.category_id
+
+
+class TransactionGroupCommit:
+    """
+    Saves the transactions created concurrently in this worker with one commit
+
+    The first transaction opens a window of `window_seconds`. Everything
+    created until the window closes, or until `max_size` transactions wait, is
+    inserted with a single multi-row statement and committed once, so a burst
+    pays for one WAL flush instead of one per transaction.
+
+    Each caller still gets its own transaction or its own error. Duplicates
+    are skipped by the insert itself. Any other integrity error rolls the
+    group back, and it is retried with one savepoint per transaction.
+    """
+
+    def __init__(
+        self, open_writer: TransactionWriterFactory, window_seconds: float, max_size: int
+    ) -> None:
+        self.open_writer = open_writer
+        self.window_seconds = window_seconds
+        self.max_size = max_size
+        self._pending: list[PendingTransaction] = []
+        self._window: asyncio.TimerHandle | None = None
+        self._writes: set[asyncio.Task] = set()
+
+    async def save(
+        self, new_transaction: SaveTransaction, user_id: int, category_id: int
+    ) -> TransactionEntity:
+        """
+        :raises TransactionAlreadyExistsException: when it breaks an integrity rule
+        """
+        loop = asyncio.get_running_loop()
+        saved: asyncio.Future[TransactionEntity] = loop.create_future()
+        self._pending.append(
+            PendingTransaction(
+                new_transaction=new_transaction,
+                user_id=user_id,
+                category_id=category_id,
+                saved=saved,
+            )
+        )
+        if len(self._pending) >= self.max_size:
+            self._close_window()
+        elif self._window is None:
+            self._window = loop.call_later(self.window_seconds, self._close_window)
+        return await saved
+
+    async def close(self) -> None:
+        """
+        Writes what is waiting and waits for the writes in progress
+        """
+        self._close_window()
+        await asyncio.gather(*self._writes, return_exceptions=True)
+
+    def _close_window(self) -> None:
+        if self._window is not None:
+            self._window.cancel()
+            self._window = None
+        group, self._pending = self._pending, []
+        if not group:
+            return None
+
+        write = asyncio.create_task(self._write(group=group))
+        self._writes.add(write)
+        write.add_done_callback(self._writes.discard)
+
+    async def _write(self, group: list[PendingTransaction]) -> None:
+        try:
+            async with self.open_writer() as (transaction_repo, unit_of_work):
+                try:
+                    saved = await transaction_repo.save_many(
+                        new_transactions=[pending.values for pending in group]
+                    )
+                except TransactionAlreadyExistsException:
+                    await unit_of_work.rollback()
+                    saved = await self._write_one_at_a_time(
+                        group=group, transaction_repo=transaction_repo, unit_of_work=unit_of_work
+                    )
+                await unit_of_work.commit()
+        except Exception as error:
+            for pending in group:
+                if not pending.saved.done():
+                    pending.saved.set_exception(error)
+            return None
+        except BaseException:
+            # cancelled, e.g. on shutdown: its callers must not wait forever
+            for pending in group:
+                pending.saved.cancel()
+            raise
+
+        for pending, transaction in zip(group, saved, strict=True):
+            # a caller that gave up waiting has cancelled its future
+            if pending.saved.done():
+                continue
+            if transaction:
+                pending.saved.set_result(transaction)
+            else:
+                pending.saved.set_exception(TransactionAlreadyExistsException())
+
+    @staticmethod
+    async def _write_one_at_a_time(
+        group: list[PendingTransaction],
+        transaction_repo: AbstractTransactionRepository,
+        unit_of_work: AbstractUnitOfWork,
+    ) -> list[TransactionEntity | None]:
+        saved: list[TransactionEntity | None] = []
+        for pending in group:
+            try:
+                async with unit_of_work.savepoint():
+                    [transaction] = await transaction_repo.save_many(
+                        new_transactions=[pending.values]
+                    )
+            except TransactionAlreadyExistsException:
+                transaction = None
+            saved.append(transaction)
+        return saved
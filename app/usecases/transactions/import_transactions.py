@@ -0,0 +1,108 @@
+import asyncio
+from collections.abc import Iterable
+from itertools import islice
+
+from app.domain.abstractions.repositories import (
+    AbstractCategoryRepository,
+    AbstractTransactionRepository,
+)
+from app.domain.abstractions.unit_of_work import AbstractUnitOfWork
+from app.domain.abstractions.usecases import AbstractUseCase
+from app.domain.entities.transactions import SaveTransaction
+from app.domain.value_objects.imports import ImportRejection, ImportRow, ImportSummary
+from app.usecases.categories.registry import CategoryRegistry, resolve_category_id
+from app.usecases.dashboards.cache import DashboardResumeCache
+
+
+class ImportTransactionsUseCase(AbstractUseCase):
+    """
+    Saves a stream of validated statement rows, `chunk_size` rows per statement
+
+    Rows whose category does not exist are rejected, duplicates are skipped
+    and neither fails the rest of the import. Only the first
+    `max_reported_rejections` rejections are kept in the summary. Each chunk
+    is committed on its own, so a long import does not hold one transaction.
+
+    `rows` may parse the upload as it is iterated, which reads a file and
+    validates each row synchronously, so every chunk is pulled in a thread
+    rather than on the event loop.
+    """
+
+    def __init__(
+        self,
+        transaction_repo: AbstractTransactionRepository,
+        category_repo: AbstractCategoryRepository,
+        unit_of_work: AbstractUnitOfWork,
+        chunk_size: int,
+        max_reported_rejections: int,
+        category_registry: CategoryRegistry | None = None,
+        dashboard_cache: DashboardResumeCache | None = None,
+    ):
+        self.transaction_repo = transaction_repo
+        self.category_repo = category_repo
+        self.unit_of_work = unit_of_work
+        self.chunk_size = chunk_size
+        self.max_reported_rejections = max_reported_rejections
+        self.category_registry = category_registry
+        self.dashboard_cache = dashboard_cache
+
+    async def execute(
+        self, user_id: int, rows: Iterable[ImportRow | ImportRejection]
+    ) -> ImportSummary:
+        summary = ImportSummary()
+        rows = iter(rows)
+        while chunk := await asyncio.to_thread(tuple, islice(rows, self.chunk_size)):
+            await self._import_chunk(user_id=user_id, chunk=chunk, summary=summary)
+        return summary
+
+    def _reject(self, rejection: ImportRejection, summary: ImportSummary) -> None:
+        summary.rejected += 1
+        if len(summary.rejections) < self.max_reported_rejections:
+            summary.rejections.append(rejection)
+
+    async def _import_chunk(
+        self,
+        user_id: int,
+        chunk: tuple[ImportRow | ImportRejection, ...],
+        summary: ImportSummary,
+    ) -> None:
+        category_ids = {
+            name: await resolve_category_id(
+                category_repo=self.category_repo,
+                category_registry=self.category_registry,
+                name=name,
+            )
+            for name in {
+                row.transaction.category.lower() for row in chunk if isinstance(row, ImportRow)
+            }
+        }
+
+        new_transactions: list[tuple[SaveTransaction, int]] = []
+        for row in chunk:
+            if isinstance(row, ImportRejection):
+                self._reject(rejection=row, summary=summary)
+            elif not category_ids[row.transaction.category.lower()]:
+                self._reject(
+                    rejection=ImportRejection(
+                        line_number=row.line_number,
+                        reason=f"Category {row.transaction.category} not found",
+                    ),
+                    summary=summary,
+                )
+            else:
+                new_transactions.append(
+                    (row.transaction, category_ids[row.transaction.category.lower()])
+                )
+
+        if not new_transactions:
+            return None
+
+        imported = await self.transaction_repo.bulk_save(
+            new_transactions=new_transactions, user_id=user_id
+        )
+        await self.unit_of_work.commit()
+        summary.inserted += imported.inserted
+        summary.duplicates += len(new_transactions) - imported.inserted
+        if self.dashboard_cache:
+            months = {day.replace(day=1) for day in imported.registration_dates}
+            await self.dashboard_cache.invalidate(user_id, *months)
@@ -1,59 +1,168 @@
+from dataclasses import replace
+
 from app.domain.abstractions.repositories import (
+    AbstractCategoryRepository,
     AbstractTransactionRepository,
-    AbstractUserRepository,
 )
 from app.domain.abstractions.usecases import AbstractUseCase
+from app.domain.business_logic.pagination import (
+    decode_transaction_cursor,
+    encode_transaction_cursor,
+)
 from app.domain.entities.base import PagedResponse
 from app.domain.entities.transactions import TransactionEntity
 from app.domain.exceptions.transactions import TransactionNotFoundException
-from app.domain.exceptions.users import UserNotFoundException
+from app.domain.value_objects.pagination import (
+    CountStrategy,
+    CursorDirection,
+    PaginationMode,
+    TransactionCursor,
+)
 from app.domain.value_objects.transactions import TransactionsFilter
+from app.usecases.categories.registry import CategoryRegistry
+
+
+async def resolve_category_filter(
+    filters: TransactionsFilter,
+    category_repo: AbstractCategoryRepository | None,
+    category_registry: CategoryRegistry | None,
+) -> TransactionsFilter:
+    """
+    Filters by the category id, sparing the listing a join on the category name
+
+    Unknown names are left to the join, which matches nothing.
+    """
+    if not (filters.category and category_repo and category_registry):
+        return filters
+
+    category = await category_registry.get_by_name(
+        category_repo=category_repo, name=filters.category
+    )
+    if not category:
+        return filters
+    return replace(filters, category_id=category.category_id)
 
 
 class ListTransactionsUseCase(AbstractUseCase):
     def __init__(
-        self, user_repo: AbstractUserRepository, transaction_repo: AbstractTransactionRepository
+        self,
+        transaction_repo: AbstractTransactionRepository,
+        category_repo: AbstractCategoryRepository | None = None,
+        category_registry: CategoryRegistry | None = None,
     ):
-        self.user_repo = user_repo
         self.transaction_repo = transaction_repo
+        self.category_repo = category_repo
+        self.category_registry = category_registry
 
     async def execute(
-        self, filters: TransactionsFilter, page: int, page_size: int
+        self,
+        user_id: int,
+        filters: TransactionsFilter,
+        page: int,
+        page_size: int,
+        pagination_mode: PaginationMode = PaginationMode.PAGE,
+        cursor: str | None = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
     ) -> PagedResponse[TransactionEntity]:
-        user_id = self.user_repo.get_user_id_by_username(username=filters.username)
-        if not user_id:
-            raise UserNotFoundException(f"User {filters.username} not found")
+        filters = await self._resolve_category(filters=filters)
+        if cursor or pagination_mode == PaginationMode.CURSOR:
+            return await self._list_by_cursor(
+                user_id=user_id,
+                filters=filters,
+                page=page,
+                page_size=page_size,
+                cursor=cursor,
+                count_strategy=count_strategy,
+            )
 
-        items, total = self.transaction_repo.fetch_all(
+        items, total, has_more = await self.transaction_repo.fetch_all(
             user_id=user_id,
             filters=filters,
             page=page,
             page_size=page_size,
+            count_strategy=count_strategy,
+        )
+
+        return PagedResponse(
+            items=items,
+            total_count=total,
+            page=page,
+            items_per_page=page_size,
+            count_strategy=count_strategy,
+            more_items=has_more,
+        )
+
+    async def _resolve_category(self, filters: TransactionsFilter) -> TransactionsFilter:
+        return await resolve_category_filter(
+            filters=filters,
+            category_repo=self.category_repo,
+            category_registry=self.category_registry,
+        )
+
+    async def _list_by_cursor(
+        self,
+        user_id: int,
+        filters: TransactionsFilter,
+        page: int,
+        page_size: int,
+        cursor: str | None,
+        count_strategy: CountStrategy,
+    ) -> PagedResponse[TransactionEntity]:
+        transaction_cursor = decode_transaction_cursor(cursor=cursor) if cursor else None
+        items, total, has_more = await self.transaction_repo.fetch_all_by_cursor(
+            user_id=user_id,
+            filters=filters,
+            page_size=page_size,
+            cursor=transaction_cursor,
+            count_strategy=count_strategy,
+        )
+
+        moving_backwards = (
+            transaction_cursor is not None and transaction_cursor.direction == CursorDirection.PREV
         )
+        next_cursor = None
+        prev_cursor = None
+        if items and (has_more or moving_backwards):
+            next_cursor = encode_transaction_cursor(
+                cursor=TransactionCursor(
+                    registration_date=items[-1].registration_date,
+                    transaction_id=items[-1].transaction_id,
+                    direction=CursorDirection.NEXT,
+                )
+            )
+        if items and transaction_cursor is not None and (has_more or not moving_backwards):
+            prev_cursor = encode_transaction_cursor(
+                cursor=TransactionCursor(
+                    registration_date=items[0].registration_date,
+                    transaction_id=items[0].transaction_id,
+                    direction=CursorDirection.PREV,
+                )
+            )
 
-        return PagedResponse(items=items, total_count=total, page=page, items_per_page=page_size)
+        return PagedResponse(
+            items=items,
+            total_count=total,
+            page=page,
+            items_per_page=page_size,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+            count_strategy=count_strategy,
+            more_items=next_cursor is not None,
+        )
 
 
 class GetOneTransactionUseCase(AbstractUseCase):
-    def __init__(
-        self, user_repo: AbstractUserRepository, transaction_repo: AbstractTransactionRepository
-    ):
-        self.user_repo = user_repo
+    def __init__(self, transaction_repo: AbstractTransactionRepository):
         self.transaction_repo = transaction_repo
 
     async def execute(
         self,
         transaction_id: int,
-        username: str,
+        user_id: int,
     ) -> TransactionEntity:
-        user_id = self.user_repo.get_user_id_by_username(username=username)
-        if not user_id:
-            raise UserNotFoundException(f"User {username} not found")
-
-        transaction = self.transaction_repo.exists(transaction_id=transaction_id)
+        transaction = await self.transaction_repo.fetch_one_for_user(
+            transaction_id=transaction_id, user_id=user_id
+        )
         if not transaction:
             raise TransactionNotFoundException(f"Transaction with id {transaction_id} not found")
-
-        return self.transaction_repo.fetch_one(
-            transaction_id=transaction_id,
-        )
+        return transaction
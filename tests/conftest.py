@@ -0,0 +1,130 @@
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import pytest
+
+# Settings has no defaults for these; the suite never reaches Postgres
+for name, value in {
+    "POSTGRES_USER": "fintracker",
+    "POSTGRES_PASSWORD": "fintracker",
+    "POSTGRES_DB": "fintracker",
+    "POSTGRES_PORT": "5432",
+    "POSTGRES_HOST": "localhost",
+    "JWT_SECRET_KEY": "test-secret",
+    "ALGORITHM": "HS256",
+    "TOKEN_TYPE": "bearer",
+    "GH_TOKEN": "unused",
+}.items():
+    os.environ.setdefault(name, value)
+
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.domain.entities.categories import CategoryEntity  # noqa: E402
+from app.infra.database import mapped_registry  # noqa: E402
+from app.infra.database.orm_category import Category  # noqa: E402
+from app.infra.database.orm_user import User  # noqa: E402
+
+
+@pytest.fixture
+def open_database(tmp_path):
+    """
+    Opens a fresh SQLite database with users 1 and 2 and the category Home (id 1)
+
+    Use it inside the `asyncio.run` of the test, as the engine belongs to that loop.
+    """
+
+    @asynccontextmanager
+    async def open_database() -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'fintracker.db'}")
+        async with engine.begin() as connection:
+            await connection.run_sync(mapped_registry.metadata.drop_all)
+            await connection.run_sync(mapped_registry.metadata.create_all)
+            await connection.execute(
+                insert(User.__table__),
+                [
+                    {
+                        "username": f"user{user_id}",
+                        "password_hash": b"",
+                        "email": f"user{user_id}@example.com",
+                        "updated_at": datetime(2026, 1, 1),
+                    }
+                    for user_id in (1, 2)
+                ],
+            )
+            await connection.execute(
+                insert(Category.__table__),
+                [{"name": "Home", "description": "bills", "updated_at": datetime(2026, 1, 1)}],
+            )
+        try:
+            yield async_sessionmaker(engine, expire_on_commit=False)
+        finally:
+            await engine.dispose()
+
+    return open_database
+
+
+class FakeUnitOfWork:
+    """
+    Counts what the use cases ask of the unit of work
+    """
+
+    def __init__(self) -> None:
+        self.commits = 0
+        self.rollbacks = 0
+        self.savepoints = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncIterator[None]:
+        self.savepoints += 1
+        yield
+
+
+class FakeCategoryRepo:
+    """
+    Holds the category Food (id 1) and records every lookup by name
+    """
+
+    def __init__(self) -> None:
+        self.categories = {1: CategoryEntity(category_id=1, name="Food", description="")}
+        self.lookups: list[str] = []
+        self.loads = 0
+
+    async def get_categories_version(self) -> str:
+        return ",".join(f"{c.category_id}:{c.name}" for c in self.categories.values())
+
+    async def fetch_every_category(self) -> list[CategoryEntity]:
+        self.loads += 1
+        return list(self.categories.values())
+
+    async def get_category_id_by_name(self, name: str) -> int:
+        self.lookups.append(name)
+        for category in self.categories.values():
+            if category.name.lower() == name.lower():
+                return category.category_id
+        return 0
+
+    async def get_category_by_id(self, category_id: int) -> CategoryEntity | None:
+        return self.categories.get(category_id)
+
+
+@pytest.fixture
+def unit_of_work() -> FakeUnitOfWork:
+    return FakeUnitOfWork()
+
+
+@pytest.fixture
+def category_repo() -> FakeCategoryRepo:
+    return FakeCategoryRepo()
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from app.api.admission import AdmissionController
+from app.domain.exceptions.admission import ServiceOverloadedException
+
+
+def test_requests_beyond_the_queue_fail_fast_with_retry_after():
+    async def scenario():
+        controller = AdmissionController(
+            endpoint="test",
+            max_concurrent=1,
+            max_queue=1,
+            queue_timeout_seconds=5,
+            retry_after_seconds=3,
+        )
+        release = asyncio.Event()
+
+        async def hold():
+            async with controller.admit():
+                await release.wait()
+
+        running = asyncio.ensure_future(hold())
+        queued = asyncio.ensure_future(hold())
+        await asyncio.sleep(0)
+        with pytest.raises(ServiceOverloadedException) as rejected:
+            async with controller.admit():
+                pass
+        release.set()
+        await asyncio.gather(running, queued)
+        return rejected.value.headers
+
+    assert asyncio.run(scenario()) == {"Retry-After": "3"}
+
+
+def test_queued_requests_give_up_after_the_timeout():
+    async def scenario():
+        controller = AdmissionController(
+            endpoint="test",
+            max_concurrent=1,
+            max_queue=5,
+            queue_timeout_seconds=0.01,
+            retry_after_seconds=1,
+        )
+        async with controller.admit():
+            with pytest.raises(ServiceOverloadedException):
+                async with controller.admit():
+                    pass
+        async with controller.admit():
+            return "admitted again"
+
+    assert asyncio.run(scenario()) == "admitted again"
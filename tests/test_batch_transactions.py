@@ -0,0 +1,160 @@
+import asyncio
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+
+from app.api.v1.dtos.batches import BatchTransactionsRequestDTO, settings
+from app.domain.entities.transactions import SaveTransaction, TransactionEntity
+from app.domain.exceptions.transactions import (
+    BatchTooLargeException,
+    TransactionAlreadyExistsException,
+)
+from app.domain.value_objects.batches import (
+    BatchItemStatus,
+    BatchOperation,
+    BatchOperationType,
+    BatchRejection,
+    BatchWrite,
+)
+from app.usecases.transactions.batch_transactions import BatchTransactionsUseCase
+
+
+def _transaction(description: str, category: str = "Food") -> SaveTransaction:
+    return SaveTransaction(
+        description=description,
+        amount=Decimal("10"),
+        type_of_transaction="income",
+        transaction_status="received",
+        registration_date=datetime(2026, 3, 1),
+        due_date=None,
+        category=category,
+    )
+
+
+def _entity(transaction_id: int, transaction: SaveTransaction) -> TransactionEntity:
+    return TransactionEntity(
+        transaction_id=transaction_id,
+        description=transaction.description,
+        amount=transaction.amount,
+        type_of_transaction=transaction.type_of_transaction,  # type: ignore
+        transaction_status=transaction.transaction_status,  # type: ignore
+        registration_date=date(2026, 3, 1),
+        due_date=None,
+        user_id=1,
+        category_id=1,
+    )
+
+
+class FakeTransactionRepo:
+    """
+    Owns transactions 1 and 2; creations named "duplicate" are skipped and
+    updates named "taken" break a uniqueness rule
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+
+    async def apply_batch(self, user_id, creates, updates, deletes) -> BatchWrite:
+        self.calls.append((creates, updates, deletes))
+        if any(transaction.description == "taken" for _, transaction, _ in updates):
+            raise TransactionAlreadyExistsException()
+        return BatchWrite(
+            created=[
+                None if transaction.description == "duplicate" else _entity(10 + i, transaction)
+                for i, (transaction, _) in enumerate(creates)
+            ],
+            updated={
+                transaction_id: _entity(transaction_id, transaction)
+                for transaction_id, transaction, _ in updates
+                if transaction_id in (1, 2)
+            },
+            deleted=frozenset(
+                transaction_id for transaction_id in deletes if transaction_id in (1, 2)
+            ),
+            registration_dates=frozenset({date(2026, 3, 1)}),
+        )
+
+
+def test_batch_reports_a_result_per_operation_and_writes_once(category_repo, unit_of_work):
+    transaction_repo = FakeTransactionRepo()
+    use_case = BatchTransactionsUseCase(
+        transaction_repo=transaction_repo,  # type: ignore
+        category_repo=category_repo,  # type: ignore
+        unit_of_work=unit_of_work,  # type: ignore
+        max_operations=10,
+    )
+    operations = [
+        BatchOperation(0, BatchOperationType.CREATE, transaction=_transaction("lunch")),
+        BatchOperation(1, BatchOperationType.CREATE, transaction=_transaction("duplicate")),
+        BatchOperation(2, BatchOperationType.UPDATE, 1, _transaction("dinner", category="FOOD")),
+        BatchOperation(3, BatchOperationType.UPDATE, 3, _transaction("not mine")),
+        BatchOperation(4, BatchOperationType.DELETE, 2),
+        BatchOperation(5, BatchOperationType.DELETE, 1),
+        BatchOperation(6, BatchOperationType.CREATE, transaction=_transaction("x", "Games")),
+        BatchRejection(7, reason="amount: invalid"),
+    ]
+
+    results = asyncio.run(use_case.execute(user_id=1, operations=operations))
+
+    assert [result.status for result in results] == [
+        BatchItemStatus.CREATED,
+        BatchItemStatus.CONFLICT,
+        BatchItemStatus.UPDATED,
+        BatchItemStatus.NOT_FOUND,
+        BatchItemStatus.DELETED,
+        BatchItemStatus.INVALID,
+        BatchItemStatus.INVALID,
+        BatchItemStatus.INVALID,
+    ]
+    assert results[0].transaction_id == 10
+    assert results[7].error == "amount: invalid"
+    assert len(transaction_repo.calls) == 1
+    assert unit_of_work.commits == 1
+    assert sorted(category_repo.lookups) == ["food", "games"]
+
+
+def test_batch_retries_updates_one_savepoint_each_when_one_conflicts(category_repo, unit_of_work):
+    use_case = BatchTransactionsUseCase(
+        transaction_repo=FakeTransactionRepo(),  # type: ignore
+        category_repo=category_repo,  # type: ignore
+        unit_of_work=unit_of_work,  # type: ignore
+        max_operations=10,
+    )
+    operations = [
+        BatchOperation(0, BatchOperationType.UPDATE, 1, _transaction("taken")),
+        BatchOperation(1, BatchOperationType.UPDATE, 2, _transaction("dinner")),
+        BatchOperation(2, BatchOperationType.CREATE, transaction=_transaction("lunch")),
+    ]
+
+    results = asyncio.run(use_case.execute(user_id=1, operations=operations))
+
+    assert [result.status for result in results] == [
+        BatchItemStatus.CONFLICT,
+        BatchItemStatus.UPDATED,
+        BatchItemStatus.CREATED,
+    ]
+    # the whole batch, then one savepoint per update
+    assert unit_of_work.savepoints == 3
+    assert unit_of_work.commits == 1
+
+
+def test_batch_rejects_too_many_operations(category_repo, unit_of_work):
+    use_case = BatchTransactionsUseCase(
+        transaction_repo=FakeTransactionRepo(),  # type: ignore
+        category_repo=category_repo,  # type: ignore
+        unit_of_work=unit_of_work,  # type: ignore
+        max_operations=1,
+    )
+    operations = [BatchOperation(i, BatchOperationType.DELETE, 1) for i in range(2)]
+
+    with pytest.raises(BatchTooLargeException):
+        asyncio.run(use_case.execute(user_id=1, operations=operations))
+
+
+def test_batch_request_rejects_too_many_operations_before_validating_them():
+    operations = [{"op": "delete", "id": 1}] * (settings.BATCH_MAX_OPERATIONS + 1)
+
+    with pytest.raises(ValidationError):
+        BatchTransactionsRequestDTO.model_validate({"operations": operations})
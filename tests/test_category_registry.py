@@ -0,0 +1,49 @@
+import asyncio
+
+from app.domain.entities.categories import CategoryEntity
+from app.usecases.categories.registry import CategoryRegistry, resolve_category_id
+
+
+def test_registry_resolves_names_from_memory_until_invalidated(category_repo):
+    async def scenario():
+        registry = CategoryRegistry(refresh_interval_seconds=60)
+
+        first = await registry.get_category_id(category_repo=category_repo, name="food")
+        second = await registry.get_category_id(category_repo=category_repo, name="FOOD")
+        loads_before_write = category_repo.loads
+
+        category_repo.categories[1] = CategoryEntity(category_id=1, name="Meals", description="")
+        registry.invalidate()
+        renamed = await registry.get_category_id(category_repo=category_repo, name="food")
+
+        return first, second, loads_before_write, renamed, category_repo.loads
+
+    assert asyncio.run(scenario()) == (1, 1, 1, 0, 2)
+
+
+def test_registry_reloads_when_another_worker_changes_the_version(category_repo):
+    async def scenario():
+        registry = CategoryRegistry(refresh_interval_seconds=0)
+        await registry.refresh(category_repo=category_repo)
+
+        category_repo.categories[2] = CategoryEntity(category_id=2, name="Rent", description="")
+        rent = await registry.get_by_name(category_repo=category_repo, name="rent")
+
+        return rent.category_id if rent else None, registry.version
+
+    assert asyncio.run(scenario()) == (2, "1:Food,2:Rent")
+
+
+def test_category_ids_resolve_through_the_registry_when_there_is_one(category_repo):
+    async def scenario():
+        registry = CategoryRegistry(refresh_interval_seconds=60)
+        resolved = [
+            await resolve_category_id(
+                category_repo=category_repo, category_registry=category_registry, name="FOOD"
+            )
+            for category_registry in (None, registry, registry)
+        ]
+        return resolved, category_repo.lookups, category_repo.loads
+
+    # without the registry the repository looks the name up; with it, one load serves both
+    assert asyncio.run(scenario()) == ([1, 1, 1], ["FOOD"], 1)
@@ -0,0 +1,27 @@
+import asyncio
+
+from sqlalchemy import event
+
+from app.infra.repositories.categories import AdapterCategoryRepo
+
+
+def test_get_category_by_id_selects_only_the_entity_columns(open_database):
+    async def scenario():
+        statements: list[str] = []
+        async with open_database() as new_session, new_session() as session:
+            event.listen(
+                session.get_bind(),
+                "before_cursor_execute",
+                lambda _connection, _cursor, statement, *_: statements.append(statement),
+            )
+            category_repo = AdapterCategoryRepo(session=session)
+            found = await category_repo.get_category_by_id(category_id=1)
+            missing = await category_repo.get_category_by_id(category_id=2)
+        return found, missing, statements
+
+    found, missing, statements = asyncio.run(scenario())
+
+    assert (found.category_id, found.name, found.description) == (1, "Home", "bills")
+    assert missing is None
+    assert len(statements) == 2
+    assert "updated_at" not in statements[0]
@@ -0,0 +1,96 @@
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+from app.domain.business_logic.dashboard import dashboards_covering
+from app.domain.value_objects.dashboard import DashboardResume, DashboardValues
+from app.infra.cache.memory import InMemoryCacheBackend
+from app.usecases.dashboards.cache import DashboardResumeCache
+from app.usecases.dashboards.resume import DashboardResumeUseCase
+
+RESUME = DashboardResume(
+    monthly_revenues=Decimal(1),
+    monthly_expenses=Decimal(0),
+    yearly_revenues=Decimal(1),
+    yearly_expenses=Decimal(0),
+)
+
+
+def test_dashboards_covering_a_day():
+    covering = dashboards_covering(date(2026, 3, 15))
+
+    # the whole 2026 (year period) and the whole 2027 (previous year period)
+    assert sorted(covering) == sorted(
+        [(month, year) for year in (2026, 2027) for month in range(1, 13)]
+    )
+
+
+def test_dashboard_cache_invalidates_only_dashboards_covering_the_day():
+    async def scenario():
+        cache = DashboardResumeCache(backend=InMemoryCacheBackend(max_entries=10))
+        await cache.set(user_id=1, month=3, year=2026, resume=RESUME)
+        await cache.set(user_id=1, month=3, year=2028, resume=RESUME)
+        await cache.set(user_id=2, month=3, year=2026, resume=RESUME)
+
+        await cache.invalidate(1, date(2026, 3, 15), None)
+
+        return (
+            await cache.get(user_id=1, month=3, year=2026),
+            await cache.get(user_id=1, month=3, year=2028),
+            await cache.get(user_id=2, month=3, year=2026),
+        )
+
+    assert asyncio.run(scenario()) == (None, RESUME, RESUME)
+
+
+class InvalidatedWhileSummingRepo:
+    """
+    A write to 2026-03-15 commits and invalidates while the first resume is computed
+    """
+
+    def __init__(self, cache: DashboardResumeCache) -> None:
+        self.cache = cache
+        self.income = Decimal(1)
+
+    async def get_sums_by_periods(self, user_id, periods) -> dict[str, DashboardValues]:
+        sums = {
+            period.name: DashboardValues(total_expense=Decimal(0), total_income=self.income)
+            for period in periods
+        }
+        if self.income == 1:
+            self.income = Decimal(2)
+            await self.cache.invalidate(user_id, date(2026, 3, 15))
+        return sums
+
+
+def test_dashboard_cache_drops_a_resume_computed_before_an_invalidation():
+    async def scenario():
+        cache = DashboardResumeCache(backend=InMemoryCacheBackend(max_entries=10))
+        use_case = DashboardResumeUseCase(
+            transaction_repo=InvalidatedWhileSummingRepo(cache=cache), cache=cache
+        )
+
+        stale = await use_case.execute(user_id=1, month=3, year=2026)
+        after_stale = await cache.get(user_id=1, month=3, year=2026)
+        fresh = await use_case.execute(user_id=1, month=3, year=2026)
+        after_fresh = await cache.get(user_id=1, month=3, year=2026)
+        return stale, after_stale, fresh, after_fresh
+
+    stale, after_stale, fresh, after_fresh = asyncio.run(scenario())
+
+    assert stale.monthly_revenues == Decimal(1)
+    assert after_stale is None
+    assert fresh.monthly_revenues == Decimal(2)
+    assert after_fresh == fresh
+
+
+def test_dashboard_cache_keeps_the_most_recently_invalidated_generations():
+    cache = DashboardResumeCache(backend=InMemoryCacheBackend(max_entries=10), max_generations=24)
+
+    asyncio.run(cache.invalidate(1, date(2026, 3, 15)))
+    invalidated = cache.generation(user_id=1, month=3, year=2026)
+    asyncio.run(cache.invalidate(2, date(2026, 3, 15)))
+
+    assert invalidated > 0
+    assert cache.generation(user_id=1, month=3, year=2026) == 0
+    assert cache.generation(user_id=2, month=3, year=2026) > invalidated
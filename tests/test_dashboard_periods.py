@@ -0,0 +1,90 @@
+from datetime import date
+from decimal import Decimal
+
+from pytest import mark
+
+from app.api.v1.dtos.dashboard import DashboardResponse
+from app.domain.business_logic.dashboard import build_dashboard_periods
+from app.domain.value_objects.dashboard import DashboardResume, DashboardValues
+
+
+def _periods(month: int, year: int) -> dict[str, tuple[date, date]]:
+    return {
+        period.name: (period.start_date, period.end_date)
+        for period in build_dashboard_periods(month=month, year=year)
+    }
+
+
+def test_january_compares_with_december_of_the_previous_year():
+    assert _periods(month=1, year=2026) == {
+        "month": (date(2026, 1, 1), date(2026, 1, 31)),
+        "year": (date(2026, 1, 1), date(2026, 12, 31)),
+        "previous_month": (date(2025, 12, 1), date(2025, 12, 31)),
+        "previous_year": (date(2025, 1, 1), date(2025, 12, 31)),
+        "trailing_twelve_months": (date(2025, 2, 1), date(2026, 1, 31)),
+    }
+
+
+@mark.parametrize(
+    "month, year, previous_month",
+    [
+        (12, 2025, (date(2025, 11, 1), date(2025, 11, 30))),
+        (3, 2024, (date(2024, 2, 1), date(2024, 2, 29))),
+        (3, 2026, (date(2026, 2, 1), date(2026, 2, 28))),
+    ],
+)
+def test_previous_month_is_the_whole_calendar_month(month, year, previous_month):
+    assert _periods(month=month, year=year)["previous_month"] == previous_month
+
+
+def test_deltas_against_empty_previous_periods_are_the_current_values():
+    resume = DashboardResume(
+        monthly_revenues=Decimal("100"),
+        monthly_expenses=Decimal("40"),
+        yearly_revenues=Decimal("0"),
+        yearly_expenses=Decimal("0"),
+    )
+
+    assert (
+        resume.monthly_revenues_delta,
+        resume.monthly_expenses_delta,
+        resume.monthly_balance_delta,
+    ) == (Decimal("100"), Decimal("40"), Decimal("60"))
+    assert (
+        resume.yearly_revenues_delta,
+        resume.yearly_expenses_delta,
+        resume.yearly_balance_delta,
+    ) == (Decimal(0), Decimal(0), Decimal(0))
+
+
+def test_deltas_subtract_the_previous_periods():
+    resume = DashboardResume(
+        monthly_revenues=Decimal("100"),
+        monthly_expenses=Decimal("40"),
+        yearly_revenues=Decimal("1000"),
+        yearly_expenses=Decimal("900"),
+        previous_month=DashboardValues(total_expense=Decimal("50"), total_income=Decimal("80")),
+        previous_year=DashboardValues(total_expense=Decimal("0"), total_income=Decimal("1200")),
+    )
+
+    assert resume.monthly_balance_delta == Decimal("30")
+    assert resume.yearly_revenues_delta == Decimal("-200")
+    assert resume.yearly_balance_delta == Decimal("-1100")
+
+
+def test_every_amount_of_the_response_is_in_brl():
+    resume = DashboardResume(
+        monthly_revenues=Decimal("1234.5"),
+        monthly_expenses=Decimal("0"),
+        yearly_revenues=Decimal("0"),
+        yearly_expenses=Decimal("0"),
+    )
+
+    serialized = DashboardResponse.model_validate(resume, from_attributes=True).model_dump(
+        by_alias=True
+    )
+
+    assert len(serialized) == len(DashboardResponse.model_fields)
+    assert serialized["monthlyRevenues"] == "R$ 1.234,50"
+    assert serialized["monthlyRevenuesDelta"] == "R$ 1.234,50"
+    assert serialized["previousYearlyBalance"] == "R$ 0,00"
@@ -0,0 +1,273 @@
+import asyncio
+from collections.abc import Callable, Iterator
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.domain.entities.transactions import SaveTransaction, TransactionEntity
+from app.domain.exceptions.transactions import TransactionAlreadyExistsException
+from app.infra.database import mapped_registry
+from app.infra.database.orm_category import Category
+from app.infra.database.orm_user import User
+from app.infra.database.threadpool import ThreadPoolRunner, open_threadpool_session
+from app.infra.database.unit_of_work import SqlAlchemyUnitOfWork
+from app.infra.repositories.transactions import AdapterTransactionRepo
+from app.usecases.transactions.group_commit import TransactionGroupCommit
+
+
+def _expense(description: str) -> SaveTransaction:
+    return SaveTransaction(
+        description=description,
+        amount=Decimal("10"),
+        type_of_transaction="expense",
+        transaction_status="not_paid",
+        registration_date=datetime(2026, 3, 1),
+        due_date=datetime(2026, 3, 10),
+        category="Home",
+    )
+
+
+class FakeTransactionRepo:
+    """
+    Skips expenses named "duplicate"; a category id 0 breaks a foreign key
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    async def save_many(self, new_transactions) -> list[TransactionEntity | None]:
+        self.calls.append(len(new_transactions))
+        if any(category_id == 0 for *_, category_id in new_transactions):
+            raise TransactionAlreadyExistsException()
+        return [
+            None
+            if new_transaction.description == "duplicate"
+            else TransactionEntity(
+                transaction_id=len(self.calls) * 100 + position,
+                description=new_transaction.description,
+                amount=new_transaction.amount,
+                type_of_transaction=new_transaction.type_of_transaction,  # type: ignore
+                transaction_status=new_transaction.transaction_status,  # type: ignore
+                registration_date=date(2026, 3, 1),
+                due_date=date(2026, 3, 10),
+                user_id=user_id,
+                category_id=category_id,
+            )
+            for position, (new_transaction, user_id, category_id) in enumerate(new_transactions)
+        ]
+
+
+def _group_commit(unit_of_work, max_size: int = 10):
+    transaction_repo = FakeTransactionRepo()
+
+    @asynccontextmanager
+    async def open_writer():
+        yield transaction_repo, unit_of_work
+
+    group_commit = TransactionGroupCommit(
+        open_writer=open_writer,  # type: ignore
+        window_seconds=0.01,
+        max_size=max_size,
+    )
+    return group_commit, transaction_repo
+
+
+async def _save_all(group_commit: TransactionGroupCommit, *saves: tuple[str, int, int]) -> list:
+    return await asyncio.gather(
+        *(
+            group_commit.save(
+                new_transaction=_expense(description), user_id=user_id, category_id=category_id
+            )
+            for description, user_id, category_id in saves
+        ),
+        return_exceptions=True,
+    )
+
+
+def test_concurrent_saves_share_one_insert_and_one_commit(unit_of_work):
+    group_commit, transaction_repo = _group_commit(unit_of_work)
+
+    rent, duplicate, power = asyncio.run(
+        _save_all(group_commit, ("rent", 1, 1), ("duplicate", 1, 1), ("power", 2, 1))
+    )
+
+    assert (rent.description, rent.user_id) == ("rent", 1)
+    assert isinstance(duplicate, TransactionAlreadyExistsException)
+    assert (power.description, power.user_id) == ("power", 2)
+    assert transaction_repo.calls == [3]
+    assert unit_of_work.commits == 1
+
+
+def test_a_failing_row_only_fails_its_own_caller(unit_of_work):
+    group_commit, transaction_repo = _group_commit(unit_of_work)
+
+    rent, unknown_category, power = asyncio.run(
+        _save_all(group_commit, ("rent", 1, 1), ("gone", 1, 0), ("power", 2, 1))
+    )
+
+    assert rent.description == "rent"
+    assert isinstance(unknown_category, TransactionAlreadyExistsException)
+    assert power.description == "power"
+    assert transaction_repo.calls == [3, 1, 1, 1]
+    assert (unit_of_work.rollbacks, unit_of_work.commits) == (1, 1)
+
+
+def test_a_full_group_is_written_without_waiting_for_the_window(unit_of_work):
+    group_commit, transaction_repo = _group_commit(unit_of_work, max_size=2)
+    group_commit.window_seconds = 60
+
+    saved = asyncio.run(
+        asyncio.wait_for(_save_all(group_commit, ("rent", 1, 1), ("power", 1, 1)), timeout=1)
+    )
+
+    assert [transaction.description for transaction in saved] == ["rent", "power"]
+    assert transaction_repo.calls == [2]
+
+
+def test_close_writes_what_is_waiting(unit_of_work):
+    async def scenario():
+        group_commit, transaction_repo = _group_commit(unit_of_work)
+        group_commit.window_seconds = 60
+        save = asyncio.create_task(
+            group_commit.save(new_transaction=_expense("rent"), user_id=1, category_id=1)
+        )
+        await asyncio.sleep(0)
+        await group_commit.close()
+        return await save, transaction_repo.calls
+
+    transaction, calls = asyncio.run(scenario())
+
+    assert transaction.description == "rent"
+    assert calls == [1]
+
+
+def test_an_unexpected_error_reaches_every_caller(unit_of_work):
+    group_commit, transaction_repo = _group_commit(unit_of_work)
+
+    async def broken_save_many(new_transactions):
+        raise ConnectionError("database is gone")
+
+    transaction_repo.save_many = broken_save_many  # type: ignore
+
+    results = asyncio.run(_save_all(group_commit, ("rent", 1, 1), ("power", 2, 1)))
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+
+def test_a_cancelled_write_cancels_every_caller(unit_of_work):
+    async def scenario():
+        group_commit, transaction_repo = _group_commit(unit_of_work)
+        writing = asyncio.Event()
+
+        async def hanging_save_many(new_transactions):
+            writing.set()
+            await asyncio.Event().wait()
+
+        transaction_repo.save_many = hanging_save_many  # type: ignore
+        saves = asyncio.create_task(_save_all(group_commit, ("rent", 1, 1), ("power", 2, 1)))
+        await writing.wait()
+        [write] = group_commit._writes
+        write.cancel()
+        return await asyncio.wait_for(saves, timeout=1), write.cancelled()
+
+    results, write_cancelled = asyncio.run(scenario())
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert write_cancelled
+    assert unit_of_work.commits == 0
+
+
+@pytest.fixture
+def new_sync_session(tmp_path) -> Iterator[sessionmaker[Session]]:
+    """
+    A sync SQLite database with user 1 and category 1, for sessions on the threadpool
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'fintracker.db'}")
+    mapped_registry.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(User.__table__),
+            {
+                "username": "user1",
+                "password_hash": b"",
+                "email": "user1@example.com",
+                "updated_at": datetime(2026, 1, 1),
+            },
+        )
+        connection.execute(
+            insert(Category.__table__),
+            {"name": "Home", "description": "bills", "updated_at": datetime(2026, 1, 1)},
+        )
+    yield sessionmaker(engine, expire_on_commit=False)
+    engine.dispose()
+
+
+@pytest.fixture
+def new_runner(new_sync_session) -> Iterator[Callable[[int], ThreadPoolRunner]]:
+    """
+    Joins the runner threads before the database goes away, as a save cancelled
+    by a timeout may still be running on one of them
+    """
+    runners: list[ThreadPoolRunner] = []
+
+    def new_runner(max_workers: int) -> ThreadPoolRunner:
+        runners.append(ThreadPoolRunner(max_workers=max_workers))
+        return runners[-1]
+
+    yield new_runner
+    for runner in runners:
+        runner._executor.shutdown(wait=True)
+
+
+async def _requests_creating(
+    new_session: sessionmaker[Session], request_runner: ThreadPoolRunner, writer_runner
+) -> list[TransactionEntity]:
+    """
+    Two requests, each holding a slot of `request_runner` while it waits for its save
+    """
+
+    @asynccontextmanager
+    async def open_writer():
+        async with open_threadpool_session(new_session, writer_runner) as session:
+            yield AdapterTransactionRepo(session=session), SqlAlchemyUnitOfWork(session=session)
+
+    group_commit = TransactionGroupCommit(open_writer=open_writer, window_seconds=60, max_size=2)
+
+    async def request(description: str) -> TransactionEntity:
+        async with open_threadpool_session(new_session, request_runner):
+            return await group_commit.save(
+                new_transaction=_expense(description), user_id=1, category_id=1
+            )
+
+    async with asyncio.timeout(1):
+        return await asyncio.gather(request("rent"), request("power"))
+
+
+def test_the_writer_deadlocks_when_it_shares_the_slots_of_the_requests(
+    new_sync_session, new_runner
+):
+    request_runner = new_runner(2)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(
+            _requests_creating(new_sync_session, request_runner, writer_runner=request_runner)
+        )
+
+
+def test_the_writer_saves_on_its_own_slot_while_the_requests_hold_every_other(
+    new_sync_session, new_runner
+):
+    saved = asyncio.run(
+        _requests_creating(
+            new_sync_session, request_runner=new_runner(2), writer_runner=new_runner(1)
+        )
+    )
+
+    assert [(transaction.description, transaction.user_id) for transaction in saved] == [
+        ("rent", 1),
+        ("power", 1),
+    ]
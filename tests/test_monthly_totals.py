@@ -0,0 +1,176 @@
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+from pytest import mark
+from sqlalchemy import select, update
+
+from app.domain.entities.transactions import SaveTransaction
+from app.infra.database.orm_monthly_total import MONTHLY_TOTAL_KEY_COLUMNS, MonthlyTotal
+from app.infra.repositories.monthly_totals import CENTS, MonthlyTotalsRollup, is_month_aligned
+from app.infra.repositories.transactions import AdapterTransactionRepo
+
+
+@mark.parametrize(
+    "start_date, end_date, expected",
+    [
+        (date(2026, 1, 1), date(2026, 1, 31), True),
+        (date(2026, 1, 1), date(2026, 12, 31), True),
+        (date(2024, 2, 1), date(2024, 2, 29), True),
+        (date(2026, 1, 2), date(2026, 1, 31), False),
+        (date(2026, 1, 1), date(2026, 1, 30), False),
+        (date(2026, 2, 1), date(2026, 1, 31), False),
+    ],
+)
+def test_is_month_aligned(start_date, end_date, expected):
+    assert is_month_aligned(start_date=start_date, end_date=end_date) is expected
+
+
+def _income(description: str, amount: str, day: date | None) -> SaveTransaction:
+    return SaveTransaction(
+        description=description,
+        amount=Decimal(amount),
+        type_of_transaction="income",
+        transaction_status="received",
+        registration_date=day,
+        due_date=None,
+        category="Home",
+    )
+
+
+async def _rollup_and_aggregate(session) -> tuple[list[tuple], list[tuple]]:
+    """
+    The rollup rows next to the same totals summed straight from the transactions
+    """
+    key = [getattr(MonthlyTotal, column) for column in MONTHLY_TOTAL_KEY_COLUMNS]
+    rollup = await session.execute(
+        select(*key, MonthlyTotal.total_amount, MonthlyTotal.transactions_count)
+    )
+    aggregate = await session.execute(MonthlyTotalsRollup.source_query())
+
+    def normalized(rows) -> list[tuple]:
+        return sorted(
+            ((*row[:6], Decimal(row[6]).quantize(CENTS), row[7]) for row in rows), key=repr
+        )
+
+    return normalized(rollup.all()), normalized(aggregate.all())
+
+
+def test_the_rollup_equals_the_aggregate_after_every_write(open_database):
+    async def scenario():
+        comparisons = {}
+        async with open_database() as new_session:
+
+            async def write(name: str, change) -> None:
+                async with new_session() as session:
+                    await change(AdapterTransactionRepo(session=session))
+                    await session.commit()
+                    comparisons[name] = await _rollup_and_aggregate(session)
+
+            async def save(transaction_repo):
+                await transaction_repo.save(
+                    new_transaction=_income("salary", "100", date(2026, 1, 5)),
+                    user_id=1,
+                    category_id=1,
+                )
+                # twice on the uncategorized key of the same month
+                for description in ("gift", "refund"):
+                    await transaction_repo.save(
+                        new_transaction=_income(description, "10.10", date(2026, 1, 9)),
+                        user_id=1,
+                        category_id=None,
+                    )
+
+            async def update(transaction_repo):
+                # amount only, then into the uncategorized key of another month
+                await transaction_repo.update(
+                    transaction_id=1,
+                    edit_transaction=_income("salary", "120", date(2026, 1, 5)),
+                    category_id=1,
+                    user_id=1,
+                )
+                await transaction_repo.update(
+                    transaction_id=2,
+                    edit_transaction=_income("gift", "5", date(2026, 2, 1)),
+                    category_id=None,
+                    user_id=1,
+                )
+
+            async def delete(transaction_repo):
+                await transaction_repo.delete(transaction_id=3, user_id=1)
+
+            async def batch(transaction_repo):
+                await transaction_repo.apply_batch(
+                    user_id=1,
+                    creates=[(_income("bonus", "7", date(2026, 2, 3)), None)],
+                    updates=[(1, _income("salary", "130", date(2026, 3, 5)), None)],
+                    deletes=[2],
+                )
+
+            async def bulk(transaction_repo):
+                await transaction_repo.bulk_save(
+                    new_transactions=[
+                        (_income("old salary", "90", date(2025, 12, 5)), 1),
+                        (_income("cashback", "1.5", date(2026, 2, 20)), None),
+                        (_income("undated", "3", None), None),
+                    ],
+                    user_id=1,
+                )
+                await transaction_repo.save_many(
+                    new_transactions=[(_income("salary", "80", date(2026, 1, 5)), 2, None)]
+                )
+
+            for name, change in [
+                ("save", save),
+                ("update", update),
+                ("delete", delete),
+                ("batch", batch),
+                ("import", bulk),
+            ]:
+                await write(name, change)
+        return comparisons
+
+    comparisons = asyncio.run(scenario())
+
+    assert list(comparisons) == ["save", "update", "delete", "batch", "import"]
+    for rollup, aggregate in comparisons.values():
+        assert rollup == aggregate
+    assert comparisons["save"][0] == [
+        (1, 2026, 1, "income", "received", 1, Decimal("100.00"), 1),
+        (1, 2026, 1, "income", "received", None, Decimal("20.20"), 2),
+    ]
+
+
+def test_verify_finds_drift_that_rebuild_repairs(open_database):
+    async def scenario():
+        async with open_database() as new_session, new_session() as session:
+            transaction_repo = AdapterTransactionRepo(session=session)
+            for user_id in (1, 2):
+                await transaction_repo.save(
+                    new_transaction=_income("salary", "100", date(2026, 1, 5)),
+                    user_id=user_id,
+                    category_id=None,
+                )
+            await session.execute(
+                update(MonthlyTotal).values(total_amount=MonthlyTotal.total_amount + 1)
+            )
+            await session.commit()
+
+            rollup = MonthlyTotalsRollup(session=session)
+            drifts = await rollup.verify()
+            await rollup.rebuild(user_id=1)
+            await session.commit()
+            remaining = await rollup.verify()
+            await rollup.rebuild()
+            await session.commit()
+            return drifts, remaining, await rollup.verify()
+
+    drifts, remaining, after_full_rebuild = asyncio.run(scenario())
+
+    assert sorted((drift.key.user_id, drift.actual_amount) for drift in drifts) == [
+        (1, Decimal("101.00")),
+        (2, Decimal("101.00")),
+    ]
+    assert all(drift.expected_amount == Decimal("100.00") for drift in drifts)
+    assert [drift.key.user_id for drift in remaining] == [2]
+    assert after_full_rebuild == []
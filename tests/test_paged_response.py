@@ -0,0 +1,28 @@
+from pytest import mark
+
+from app.domain.entities.base import PagedResponse
+from app.domain.value_objects.pagination import CountStrategy
+
+
+@mark.parametrize(
+    "total_count, more_items, expected_pages, expected_next",
+    [
+        (25, None, 3, 2),
+        (25, True, 3, 2),
+        (None, True, None, 2),
+        (None, False, None, None),
+        (0, None, 1, None),
+    ],
+)
+def test_paged_response_next_page(total_count, more_items, expected_pages, expected_next):
+    response = PagedResponse(
+        items=[],
+        page=1,
+        total_count=total_count,
+        items_per_page=10,
+        count_strategy=CountStrategy.NONE if total_count is None else CountStrategy.EXACT,
+        more_items=more_items,
+    )
+
+    assert response.total_of_pages == expected_pages
+    assert response.next_page == expected_next
@@ -0,0 +1,32 @@
+from datetime import date
+
+from pytest import mark, raises
+
+from app.domain.business_logic.pagination import (
+    decode_transaction_cursor,
+    encode_transaction_cursor,
+)
+from app.domain.exceptions.pagination import InvalidCursorException
+from app.domain.value_objects.pagination import CursorDirection, TransactionCursor
+
+
+@mark.parametrize(
+    "cursor",
+    [
+        TransactionCursor(registration_date=date(2026, 1, 5), transaction_id=5),
+        TransactionCursor(
+            registration_date=date(2020, 12, 31),
+            transaction_id=1,
+            direction=CursorDirection.PREV,
+        ),
+        TransactionCursor(registration_date=None, transaction_id=7),
+    ],
+)
+def test_transaction_cursor_round_trip(cursor):
+    assert decode_transaction_cursor(cursor=encode_transaction_cursor(cursor=cursor)) == cursor
+
+
+@mark.parametrize("raw_cursor", ["garbage", "", "e30", "eyJkIjoiMjAyNi0wMS0wNSJ9"])
+def test_invalid_transaction_cursor(raw_cursor):
+    with raises(InvalidCursorException):
+        decode_transaction_cursor(cursor=raw_cursor)
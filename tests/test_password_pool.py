@@ -0,0 +1,27 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.domain.exceptions.auth import PasswordHashingUnavailableException
+from app.infra.auth.password_pool import PasswordHashingPool
+
+
+def test_pool_rejects_jobs_beyond_its_queue():
+    release = threading.Event()
+
+    async def scenario():
+        pool = PasswordHashingPool(executor="thread", max_workers=1, max_queue=1)
+        running = asyncio.ensure_future(pool.run("hash", release.wait, 5))
+        queued = asyncio.ensure_future(pool.run("hash", release.wait, 5))
+        await asyncio.sleep(0)
+        try:
+            with pytest.raises(PasswordHashingUnavailableException):
+                await pool.run("hash", release.wait, 5)
+        finally:
+            release.set()
+        results = await asyncio.gather(running, queued)
+        pool.shutdown()
+        return results
+
+    assert asyncio.run(scenario()) == [True, True]
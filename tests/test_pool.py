@@ -0,0 +1,46 @@
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine
+
+from app.infra.configs.settings import Settings
+from app.infra.database.pool import engine_options, instrument_engine
+
+
+def _sample(name: str, label: str) -> float | None:
+    return REGISTRY.get_sample_value(f"fintracker_db_pool_{name}", {"engine": label})
+
+
+def test_pgbouncer_mode_disables_prepared_statement_caches():
+    settings = Settings(DATABASE_PGBOUNCER_MODE=True)
+
+    connect_args = engine_options(settings, label="pgbouncer", is_async=True)["connect_args"]
+    sync_options = engine_options(settings, label="pgbouncer")
+
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    assert connect_args["prepared_statement_name_func"]() != (
+        connect_args["prepared_statement_name_func"]()
+    )
+    assert "connect_args" not in sync_options
+    assert "connect_args" not in engine_options(Settings(), label="direct", is_async=True)
+
+
+def test_an_instrumented_engine_tracks_its_checkouts(tmp_path):
+    settings = Settings()
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        **engine_options(settings, label="instrumented", pool_size=1, max_overflow=1),
+    )
+    instrument_engine(engine, label="instrumented", settings=settings, pool_size=1, max_overflow=1)
+
+    first, second = engine.connect(), engine.connect()
+    both = _sample("checked_out", "instrumented"), _sample("overflow", "instrumented")
+    first.close()
+    second.close()
+    engine.dispose()
+
+    assert both == (2, 1)
+    assert _sample("checked_out", "instrumented") == 0
+    assert _sample("overflow", "instrumented") == 0
+    assert _sample("checkouts_total", "instrumented") == 2
+    assert _sample("connects_total", "instrumented") == 2
+    assert (_sample("size", "instrumented"), _sample("max_overflow", "instrumented")) == (1, 1)
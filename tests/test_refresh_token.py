@@ -0,0 +1,122 @@
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+from starlette.requests import Request
+
+from app.domain.exceptions.auth import InvalidTokenException
+from app.domain.value_objects.auth import PublicToken, RefreshTokenGrant, RefreshTokenRecord
+from app.infra.auth.token import TokenProvider
+from app.usecases.auth.refresh_token import RefreshAccessTokenUseCase, RevokeRefreshTokenUseCase
+
+
+class FakeTokenProvider:
+    def __init__(self) -> None:
+        self.issued = 0
+        self.revoked: list[str] = []
+
+    def encode_token(self, username: str, user_id: int | None = None) -> PublicToken:
+        return PublicToken(access_token=f"access-{username}", token_type="bearer")
+
+    def encode_refresh_token(self) -> RefreshTokenGrant:
+        self.issued += 1
+        token = f"refresh-{self.issued}"
+        return RefreshTokenGrant(
+            token=token, token_hash=self.hash_refresh_token(token), expires_at=datetime.now(UTC)
+        )
+
+    def hash_refresh_token(self, refresh_token: str) -> bytes:
+        return refresh_token.encode()
+
+    def revoke_token(self, token: str) -> None:
+        self.revoked.append(token)
+
+
+class FakeRefreshTokenRepo:
+    def __init__(self) -> None:
+        self.tokens: dict[bytes, RefreshTokenRecord] = {}
+
+    async def save(self, user_id: int, grant: RefreshTokenGrant, family_id: str | None = None):
+        self.tokens[grant.token_hash] = RefreshTokenRecord(
+            refresh_token_id=len(self.tokens) + 1,
+            user_id=user_id,
+            username="ana",
+            family_id=family_id or "family",
+            revoked=False,
+        )
+
+    async def get_unexpired_by_hash(self, token_hash: bytes) -> RefreshTokenRecord | None:
+        return self.tokens.get(token_hash)
+
+    async def rotate(self, current: RefreshTokenRecord, grant: RefreshTokenGrant) -> None:
+        await self.revoke(current)
+        await self.save(user_id=current.user_id, grant=grant, family_id=current.family_id)
+
+    async def revoke(self, record: RefreshTokenRecord) -> None:
+        for token_hash, token in self.tokens.items():
+            if token.refresh_token_id == record.refresh_token_id:
+                self.tokens[token_hash] = RefreshTokenRecord(**{**vars(token), "revoked": True})
+
+    async def revoke_family(self, family_id: str) -> None:
+        for token in list(self.tokens.values()):
+            if token.family_id == family_id:
+                await self.revoke(token)
+
+
+def test_reusing_a_rotated_refresh_token_revokes_its_family(unit_of_work):
+    async def scenario():
+        token_provider = FakeTokenProvider()
+        refresh_token_repo = FakeRefreshTokenRepo()
+        await refresh_token_repo.save(user_id=1, grant=token_provider.encode_refresh_token())
+        use_case = RefreshAccessTokenUseCase(
+            refresh_token_repo=refresh_token_repo,
+            token_provider=token_provider,
+            unit_of_work=unit_of_work,  # type: ignore
+        )
+
+        rotated = await use_case.execute(refresh_token="refresh-1")
+        with pytest.raises(InvalidTokenException):
+            await use_case.execute(refresh_token="refresh-1")
+        with pytest.raises(InvalidTokenException):
+            await use_case.execute(refresh_token=rotated.refresh_token)
+        # the rotation and both revocations are committed although two of them fail
+        assert unit_of_work.commits == 3
+        return rotated
+
+    assert asyncio.run(scenario()) == PublicToken(
+        access_token="access-ana", token_type="bearer", refresh_token="refresh-2"
+    )
+
+
+def test_revoking_a_session_revokes_its_access_token_too(unit_of_work):
+    async def scenario():
+        token_provider = FakeTokenProvider()
+        refresh_token_repo = FakeRefreshTokenRepo()
+        await refresh_token_repo.save(user_id=1, grant=token_provider.encode_refresh_token())
+        use_case = RevokeRefreshTokenUseCase(
+            refresh_token_repo=refresh_token_repo,
+            token_provider=token_provider,
+            unit_of_work=unit_of_work,  # type: ignore
+        )
+
+        await use_case.execute(refresh_token="refresh-1", access_token="access-ana")
+        return token_provider.revoked, [
+            token.revoked for token in refresh_token_repo.tokens.values()
+        ]
+
+    assert asyncio.run(scenario()) == (["access-ana"], [True])
+
+
+def test_a_revoked_access_token_is_rejected_before_it_expires():
+    token_provider = TokenProvider()
+    access_token = token_provider.encode_token(username="ana", user_id=1).access_token
+    request = Request(
+        {"type": "http", "headers": [(b"authorization", f"Bearer {access_token}".encode())]}
+    )
+
+    verified = token_provider.decode_token(request=request)
+    token_provider.revoke_token(token=access_token)
+
+    assert (verified.sub, verified.uid) == ("ana", 1)
+    with pytest.raises(InvalidTokenException):
+        token_provider.decode_token(request=request)
@@ -0,0 +1,136 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.infra.database import routing
+from app.infra.database.routing import ROUTER_INFO_KEY, ReplicaRouter, execute_read, mark_write
+
+WHO_ANSWERS = text("SELECT name FROM source")
+
+
+@pytest.fixture(autouse=True)
+def replica_lag(monkeypatch):
+    """
+    SQLite has no replication functions; the lag query reads the lag to simulate instead
+    """
+    monkeypatch.setattr(routing, "REPLICA_LAG_QUERY", text("SELECT lag FROM source"))
+
+
+async def _database(url: str, name: str, lag: int = 0, **engine_options) -> AsyncEngine:
+    engine = create_async_engine(url, **engine_options)
+    async with engine.begin() as connection:
+        await connection.execute(text("CREATE TABLE source (name TEXT, lag INTEGER)"))
+        await connection.execute(
+            text("INSERT INTO source VALUES (:name, :lag)"), {"name": name, "lag": lag}
+        )
+    return engine
+
+
+@asynccontextmanager
+async def _routed_sessions(
+    tmp_path, replica: AsyncEngine, max_lag_seconds: float = 10
+) -> AsyncIterator[Callable[[], AsyncSession]]:
+    """
+    Yields a factory of primary sessions that share one router to `replica`
+    """
+    primary = await _database(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}", name="primary")
+    router = ReplicaRouter(
+        open_replica_session=async_sessionmaker(replica),
+        sticky_seconds=60,
+        max_lag_seconds=max_lag_seconds,
+        health_check_interval=60,
+    )
+
+    def new_session() -> AsyncSession:
+        session = async_sessionmaker(primary)()
+        session.info[ROUTER_INFO_KEY] = router
+        return session
+
+    try:
+        yield new_session
+    finally:
+        await primary.dispose()
+        await replica.dispose()
+
+
+async def _answers(session, user_id: int | None = None) -> str:
+    result = await execute_read(session, statement=WHO_ANSWERS, user_id=user_id)
+    return result.scalar_one()
+
+
+def test_reads_leave_the_replica_after_a_write(tmp_path):
+    async def scenario():
+        replica = await _database(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}", "replica")
+        async with _routed_sessions(tmp_path, replica=replica) as new_session:
+            async with new_session() as session:
+                before_write = await _answers(session, user_id=1)
+                mark_write(session, user_id=1)
+                after_write = await _answers(session, user_id=1)
+
+            # the next request of the same user, in the same process
+            async with new_session() as session:
+                sticky_user = await _answers(session, user_id=1)
+                other_user = await _answers(session, user_id=2)
+
+        return before_write, after_write, sticky_user, other_user
+
+    assert asyncio.run(scenario()) == ("replica", "primary", "primary", "replica")
+
+
+def test_a_lagging_replica_is_skipped(tmp_path):
+    async def scenario():
+        replica = await _database(
+            f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}", "replica", lag=30
+        )
+        async with (
+            _routed_sessions(tmp_path, replica=replica, max_lag_seconds=10) as new_session,
+            new_session() as session,
+        ):
+            return await _answers(session)
+
+    assert asyncio.run(scenario()) == "primary"
+
+
+def test_an_unreachable_replica_falls_back_to_the_primary(tmp_path):
+    async def scenario():
+        replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'r.db'}")
+        async with (
+            _routed_sessions(tmp_path, replica=replica) as new_session,
+            new_session() as session,
+        ):
+            answer = await _answers(session)
+            return answer, session.info[ROUTER_INFO_KEY]._healthy
+
+    assert asyncio.run(scenario()) == ("primary", False)
+
+
+def test_a_full_replica_pool_falls_back_to_the_primary(tmp_path):
+    async def scenario():
+        replica = await _database(
+            f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}",
+            "replica",
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+        )
+        async with (
+            _routed_sessions(tmp_path, replica=replica) as new_session,
+            new_session() as session,
+        ):
+            healthy_answer = await _answers(session)
+            async with replica.connect():
+                exhausted_answer = await _answers(session)
+            return healthy_answer, exhausted_answer
+
+    assert asyncio.run(scenario()) == ("replica", "primary")
@@ -0,0 +1,34 @@
+import asyncio
+
+from app.domain.value_objects.auth import JWTPayload
+from app.infra.cache.memory import InMemoryCacheBackend
+from app.usecases.auth.resolve_user import ResolveUserIdUseCase
+
+
+class FakeUserRepo:
+    def __init__(self) -> None:
+        self.lookups = 0
+
+    async def get_user_id_by_username(self, username: str) -> int | None:
+        self.lookups += 1
+        return 7 if username == "ana" else None
+
+
+def test_uid_claim_skips_the_username_lookup():
+    user_repo = FakeUserRepo()
+    use_case = ResolveUserIdUseCase(user_repo=user_repo, cache=InMemoryCacheBackend(10))
+
+    user_id = asyncio.run(use_case.execute(token_payload=JWTPayload(sub="ana", exp=0, uid=7)))
+
+    assert (user_id, user_repo.lookups) == (7, 0)
+
+
+def test_legacy_token_looks_the_username_up_once():
+    user_repo = FakeUserRepo()
+    use_case = ResolveUserIdUseCase(user_repo=user_repo, cache=InMemoryCacheBackend(10))
+    legacy_payload = JWTPayload(sub="ana", exp=0)
+
+    async def resolve_twice():
+        return [await use_case.execute(token_payload=legacy_payload) for _ in range(2)]
+
+    assert (asyncio.run(resolve_twice()), user_repo.lookups) == ([7, 7], 1)
@@ -0,0 +1,111 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.api.v1.dtos.imports import validate_import_rows
+from app.domain.exceptions.transactions import ImportCategoryNotProvidedException
+from app.domain.value_objects.imports import ImportedChunk, ImportFormat
+from app.infra.imports.parsers import read_statement
+from app.usecases.transactions.import_transactions import ImportTransactionsUseCase
+
+CSV_STATEMENT = [
+    "description;amount;typeOfTransaction;registrationDate;dueDate;category;status\n",
+    "aluguel;R$ 1.500,00;expense;01/03/2026;10/03/2026;casa;already_paid\n",
+    '"luz; agua";R$ 200,50;expense;02/03/2026;15/03/2026;casa;not_paid\n',
+    "freela;R$ 800,00;income;05/03/2026;;casa;received\n",
+]
+
+OFX_STATEMENT = [
+    "OFXHEADER:100\n",
+    "<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>\n",
+    "<STMTTRN>\n",
+    "<TRNTYPE>DEBIT\n",
+    "<DTPOSTED>20260310120000[-3:BRT]\n",
+    "<TRNAMT>-1045.90\n",
+    "<MEMO>Padaria\n",
+    "</STMTTRN>\n",
+    "<STMTTRN><TRNTYPE>CREDIT<DTPOSTED>20260311<TRNAMT>1200.00<NAME>PIX</STMTTRN>\n",
+    "</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>\n",
+]
+
+
+def test_csv_rows_are_keyed_like_the_transaction_payload():
+    rows = list(read_statement(lines=CSV_STATEMENT, import_format=ImportFormat.CSV))
+
+    assert [line_number for line_number, _ in rows] == [2, 3, 4]
+    assert rows[1][1]["description"] == "luz; agua"
+    assert rows[1][1]["amount"] == "R$ 200,50"
+    assert rows[2][1]["dueDate"] == ""
+
+
+def test_ofx_entries_become_paid_expenses_and_received_incomes():
+    rows = list(
+        read_statement(lines=OFX_STATEMENT, import_format=ImportFormat.OFX, category="casa")
+    )
+
+    assert rows == [
+        (
+            3,
+            {
+                "description": "Padaria",
+                "amount": "R$ 1.045,90",
+                "typeOfTransaction": "expense",
+                "registrationDate": "10/03/2026",
+                "dueDate": "10/03/2026",
+                "category": "casa",
+                "status": "already_paid",
+            },
+        ),
+        (
+            9,
+            {
+                "description": "PIX",
+                "amount": "R$ 1.200,00",
+                "typeOfTransaction": "income",
+                "registrationDate": "11/03/2026",
+                "dueDate": None,
+                "category": "casa",
+                "status": "received",
+            },
+        ),
+    ]
+
+
+def test_ofx_requires_a_category():
+    with pytest.raises(ImportCategoryNotProvidedException):
+        read_statement(lines=OFX_STATEMENT, import_format=ImportFormat.OFX)
+
+
+class FakeBulkTransactionRepo:
+    async def bulk_save(self, new_transactions, user_id) -> ImportedChunk:
+        return ImportedChunk(
+            inserted=len(new_transactions),
+            registration_dates=frozenset(
+                transaction.registration_date.date() for transaction, _ in new_transactions
+            ),
+        )
+
+
+def test_the_statement_is_parsed_off_the_event_loop(unit_of_work, category_repo):
+    reading_threads: set[threading.Thread] = set()
+
+    def lines():
+        for line in CSV_STATEMENT:
+            reading_threads.add(threading.current_thread())
+            yield line.replace("casa", "food")
+
+    use_case = ImportTransactionsUseCase(
+        transaction_repo=FakeBulkTransactionRepo(),  # type: ignore
+        category_repo=category_repo,
+        unit_of_work=unit_of_work,
+        chunk_size=2,
+        max_reported_rejections=10,
+    )
+    rows = validate_import_rows(read_statement(lines=lines(), import_format=ImportFormat.CSV))
+
+    summary = asyncio.run(use_case.execute(user_id=1, rows=rows))
+
+    assert (summary.inserted, summary.rejected) == (3, 0)
+    assert unit_of_work.commits == 2
+    assert threading.main_thread() not in reading_threads
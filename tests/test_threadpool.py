@@ -0,0 +1,88 @@
+import asyncio
+import threading
+from collections.abc import Iterator
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.infra.database.threadpool import ThreadPoolRunner, open_threadpool_session
+
+
+def _slots_in_use() -> float | None:
+    return REGISTRY.get_sample_value("fintracker_db_threadpool_in_use")
+
+
+@pytest.fixture
+def new_session(tmp_path) -> Iterator[sessionmaker[Session]]:
+    engine = create_engine(f"sqlite:///{tmp_path / 'threadpool.db'}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE numbers (number INTEGER)"))
+    yield sessionmaker(engine)
+    engine.dispose()
+
+
+def test_queries_run_off_the_event_loop_thread(new_session):
+    async def scenario():
+        runner = ThreadPoolRunner(max_workers=1)
+        async with open_threadpool_session(new_session, runner) as session:
+            await session.execute(text("INSERT INTO numbers VALUES (1), (2), (3)"))
+            await session.commit()
+            thread_name = await session.run_sync(lambda _: threading.current_thread().name)
+            total = await session.scalar(text("SELECT SUM(number) FROM numbers"))
+
+            stream = await session.stream(text("SELECT number FROM numbers ORDER BY number"))
+            partitions = [
+                [number for (number,) in partition] async for partition in stream.partitions(size=2)
+            ]
+            await stream.close()
+        return thread_name, total, partitions
+
+    thread_name, total, partitions = asyncio.run(scenario())
+
+    assert thread_name.startswith("fintracker-db")
+    assert total == 6
+    assert partitions == [[1, 2], [3]]
+
+
+def test_a_failing_savepoint_rolls_back_only_its_own_writes(new_session):
+    async def scenario():
+        runner = ThreadPoolRunner(max_workers=1)
+        async with open_threadpool_session(new_session, runner) as session:
+            await session.execute(text("INSERT INTO numbers VALUES (1)"))
+            async with session.begin_nested():
+                await session.execute(text("INSERT INTO numbers VALUES (2)"))
+            with pytest.raises(ValueError):
+                async with session.begin_nested():
+                    await session.execute(text("INSERT INTO numbers VALUES (3)"))
+                    raise ValueError()
+            await session.commit()
+            result = await session.execute(text("SELECT number FROM numbers ORDER BY number"))
+            return result.scalars().all()
+
+    assert asyncio.run(scenario()) == [1, 2]
+
+
+def test_a_session_holds_its_slot_until_it_is_closed(new_session):
+    async def scenario():
+        runner = ThreadPoolRunner(max_workers=1)
+        in_use_before = _slots_in_use()
+        async with open_threadpool_session(new_session, runner):
+            in_use_while_open = _slots_in_use()
+            # a second session for the same task never gets the only slot
+            with pytest.raises(TimeoutError):
+                async with asyncio.timeout(0.1):
+                    async with open_threadpool_session(new_session, runner):
+                        pass
+        in_use_after = _slots_in_use()
+
+        # released, the slot goes to the next session
+        async with asyncio.timeout(1), open_threadpool_session(new_session, runner) as session:
+            await session.execute(text("SELECT 1"))
+        return in_use_before, in_use_while_open, in_use_after
+
+    in_use_before, in_use_while_open, in_use_after = asyncio.run(scenario())
+
+    assert in_use_while_open == in_use_before + 1
+    assert in_use_after == in_use_before
@@ -0,0 +1,27 @@
+import time
+
+from app.domain.value_objects.auth import JWTPayload
+from app.infra.auth.token_cache import VerifiedTokenCache
+
+
+def test_verified_tokens_are_served_from_the_cache_until_revoked():
+    cache = VerifiedTokenCache(max_entries=10)
+    payload = JWTPayload(sub="ana", exp=int(time.time()) + 60, uid=7)
+
+    first_lookup = cache.get("token")
+    cache.set("token", payload)
+    second_lookup = cache.get("token")
+    cache.revoke("token", expires_at=payload.exp)
+    cache.set("token", payload)
+
+    assert (first_lookup, second_lookup, cache.get("token")) == (None, payload, None)
+    assert cache.is_revoked("token")
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_expired_tokens_are_not_cached():
+    cache = VerifiedTokenCache(max_entries=10)
+
+    cache.set("token", JWTPayload(sub="ana", exp=int(time.time()) - 1))
+
+    assert cache.get("token") is None
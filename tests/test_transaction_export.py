@@ -0,0 +1,76 @@
+import asyncio
+import json
+from datetime import date
+from decimal import Decimal
+
+from app.domain.value_objects.exports import ExportedTransaction, ExportFormat
+from app.infra.exports.encoders import encode_export
+
+RENT = ExportedTransaction(
+    transaction_id=2,
+    description="aluguel; casa",
+    amount=Decimal("1500"),
+    type_of_transaction="expense",
+    transaction_status="already_paid",
+    registration_date=date(2026, 3, 1),
+    due_date=date(2026, 3, 10),
+    category="Casa",
+)
+SALARY = ExportedTransaction(
+    transaction_id=1,
+    description="salário",
+    amount=Decimal("5000.5"),
+    type_of_transaction="income",
+    transaction_status="received",
+    registration_date=date(2026, 3, 5),
+    due_date=None,
+    category=None,
+)
+
+
+async def _batches(*batches):
+    for batch in batches:
+        yield batch
+
+
+def _encode(export_format, *batches) -> list[str]:
+    async def collect():
+        return [
+            chunk
+            async for chunk in encode_export(
+                batches=_batches(*batches), export_format=export_format
+            )
+        ]
+
+    return asyncio.run(collect())
+
+
+def test_csv_export_writes_one_chunk_per_batch_in_the_import_layout():
+    chunks = _encode(ExportFormat.CSV, [RENT], [SALARY])
+
+    assert chunks == [
+        "id;description;amount;typeOfTransaction;registrationDate;dueDate;category;status\n"
+        '2;"aluguel; casa";R$ 1.500,00;expense;01/03/2026;10/03/2026;Casa;already_paid\n',
+        "1;salário;R$ 5.000,50;income;05/03/2026;;;received\n",
+    ]
+
+
+def test_csv_export_keeps_the_header_when_nothing_matched():
+    assert _encode(ExportFormat.CSV) == [
+        "id;description;amount;typeOfTransaction;registrationDate;dueDate;category;status\n"
+    ]
+
+
+def test_ndjson_export_writes_one_object_per_line():
+    lines = "".join(_encode(ExportFormat.NDJSON, [RENT, SALARY])).splitlines()
+
+    assert [json.loads(line) for line in lines][1] == {
+        "id": 1,
+        "description": "salário",
+        "amount": "R$ 5.000,50",
+        "typeOfTransaction": "income",
+        "registrationDate": "05/03/2026",
+        "dueDate": "",
+        "category": "",
+        "status": "received",
+    }
@@ -0,0 +1,335 @@
+import asyncio
+from dataclasses import replace
+from datetime import date
+from decimal import Decimal
+from functools import partial
+
+import pytest
+from sqlalchemy import event, insert, update
+
+from app.domain.entities.transactions import SaveTransaction
+from app.domain.value_objects.pagination import CountStrategy, CursorDirection, TransactionCursor
+from app.domain.value_objects.transactions import SearchMode, TransactionsFilter
+from app.infra.database.orm_transaction import Transaction
+from app.infra.database.unit_of_work import SqlAlchemyUnitOfWork
+from app.infra.repositories.counting import listing_count_cache
+from app.infra.repositories.transactions import AdapterTransactionRepo
+
+EVERYTHING = TransactionsFilter(
+    username="user1",
+    month=None,
+    year=None,
+    description=None,
+    category=None,
+    type_of_transaction=None,
+    status_of_transaction=None,
+)
+
+
+@pytest.fixture(autouse=True)
+def forget_counts():
+    """
+    Every test database starts its ids at 1, so cached totals of user 1 must not leak
+    """
+    listing_count_cache.invalidate(AdapterTransactionRepo._count_cache_scope(user_id=1))
+
+
+async def _insert(new_session, *registration_dates: date | None, user_id: int = 1) -> None:
+    """
+    Inserts one income per date, described by its position in `registration_dates`
+    """
+    async with new_session() as session:
+        await session.execute(
+            insert(Transaction.__table__),
+            [
+                {
+                    "description": f"t{position}",
+                    "amount": 1,
+                    "type_of_transaction": "income",
+                    "registration_date": registration_date,
+                    "user_id": user_id,
+                    "category_id": 1,
+                    "status": "received",
+                }
+                for position, registration_date in enumerate(registration_dates)
+            ],
+        )
+        await session.commit()
+
+
+async def _describe(new_session, *descriptions: str) -> None:
+    """
+    Renames the rows inserted by `_insert`, in order
+    """
+    async with new_session() as session:
+        for transaction_id, description in enumerate(descriptions, start=1):
+            await session.execute(
+                update(Transaction)
+                .where(Transaction.transaction_id == transaction_id)
+                .values(description=description)
+            )
+        await session.commit()
+
+
+def _descriptions(transactions) -> list[str]:
+    return [transaction.description for transaction in transactions]
+
+
+def test_cursor_pages_walk_undated_rows_first_in_both_directions(open_database):
+    async def scenario():
+        async with open_database() as new_session:
+            await _insert(
+                new_session,
+                date(2026, 1, 5),  # t0
+                None,  # t1
+                date(2026, 2, 1),  # t2
+                None,  # t3
+                date(2026, 1, 5),  # t4
+            )
+            await _insert(new_session, None, user_id=2)
+            async with new_session() as session:
+                transaction_repo = AdapterTransactionRepo(session=session)
+                pages, cursor, has_more = [], None, True
+                while has_more:
+                    page, _, has_more = await transaction_repo.fetch_all_by_cursor(
+                        user_id=1, filters=EVERYTHING, page_size=2, cursor=cursor
+                    )
+                    pages.append(_descriptions(page))
+                    cursor = TransactionCursor(
+                        registration_date=page[-1].registration_date,
+                        transaction_id=page[-1].transaction_id,
+                    )
+
+                # back from the first row of the last page
+                last_page_start = TransactionCursor(
+                    registration_date=date(2026, 1, 5),
+                    transaction_id=1,
+                    direction=CursorDirection.PREV,
+                )
+                previous_page, _, more_before = await transaction_repo.fetch_all_by_cursor(
+                    user_id=1, filters=EVERYTHING, page_size=2, cursor=last_page_start
+                )
+                # back from a dated row reaches the undated rows
+                first_dated = TransactionCursor(
+                    registration_date=date(2026, 2, 1),
+                    transaction_id=3,
+                    direction=CursorDirection.PREV,
+                )
+                undated_page, _, more_undated = await transaction_repo.fetch_all_by_cursor(
+                    user_id=1, filters=EVERYTHING, page_size=2, cursor=first_dated
+                )
+            previous_page = (_descriptions(previous_page), more_before)
+            undated_page = (_descriptions(undated_page), more_undated)
+            return pages, previous_page, undated_page
+
+    pages, previous_page, undated_page = asyncio.run(scenario())
+
+    assert pages == [["t3", "t1"], ["t2", "t4"], ["t0"]]
+    assert previous_page == (["t2", "t4"], True)
+    assert undated_page == (["t3", "t1"], False)
+
+
+def test_fetch_all_lists_undated_rows_first(open_database):
+    async def scenario():
+        async with open_database() as new_session:
+            await _insert(new_session, date(2026, 1, 5), None, date(2026, 2, 1))
+            async with new_session() as session:
+                transactions, total, _ = await AdapterTransactionRepo(session=session).fetch_all(
+                    user_id=1, filters=EVERYTHING, page=1, page_size=10
+                )
+            return _descriptions(transactions), total
+
+    assert asyncio.run(scenario()) == (["t1", "t2", "t0"], 3)
+
+
+async def _page(
+    new_session, count_strategy: CountStrategy, page: int = 1, page_size: int = 2, **filters
+):
+    async with new_session() as session:
+        transactions, total, has_more = await AdapterTransactionRepo(session=session).fetch_all(
+            user_id=1,
+            filters=replace(EVERYTHING, **filters),
+            page=page,
+            page_size=page_size,
+            count_strategy=count_strategy,
+        )
+    return _descriptions(transactions), total, has_more
+
+
+def test_exact_count_is_the_window_total_of_the_filtered_rows(open_database):
+    async def scenario():
+        async with open_database() as new_session:
+            await _insert(new_session, *[date(2026, 1, day) for day in range(1, 6)])
+            await _insert(new_session, date(2026, 1, 1), user_id=2)
+            first_page = await _page(new_session, CountStrategy.EXACT)
+            last_page = await _page(new_session, CountStrategy.EXACT, page=3)
+            past_the_end = await _page(new_session, CountStrategy.EXACT, page=4)
+            filtered = await _page(new_session, CountStrategy.EXACT, description="t1")
+        return first_page, last_page, past_the_end, filtered
+
+    first_page, last_page, past_the_end, filtered = asyncio.run(scenario())
+
+    assert first_page == (["t4", "t3"], 5, True)
+    assert last_page == (["t0"], 5, False)
+    assert past_the_end == ([], 5, False)
+    assert filtered == (["t1"], 1, False)
+
+
+def test_cached_count_is_reused_until_a_write_commits(open_database):
+    async def scenario():
+        async with open_database() as new_session:
+            await _insert(new_session, date(2026, 1, 1), date(2026, 1, 2))
+            counted = await _page(new_session, CountStrategy.CACHED)
+
+            # rows written outside the repository leave the cached total alone
+            await _insert(new_session, date(2026, 1, 3))
+            cached = await _page(new_session, CountStrategy.CACHED)
+
+            async with new_session() as session:
+                await AdapterTransactionRepo(session=session).save(
+                    new_transaction=SaveTransaction(
+                        description="salary",
+                        amount=Decimal("100"),
+                        type_of_transaction="income",
+                        transaction_status="received",
+                        registration_date=date(2026, 1, 4),
+                        due_date=None,
+                        category="Home",
+                    ),
+                    user_id=1,
+                    category_id=1,
+                )
+                await SqlAlchemyUnitOfWork(session=session).commit()
+            recounted = await _page(new_session, CountStrategy.CACHED)
+        return counted, cached, recounted
+
+    counted, cached, recounted = asyncio.run(scenario())
+
+    assert counted == (["t1", "t0"], 2, False)
+    assert cached == (["t0", "t1"], 2, True)
+    assert recounted == (["salary", "t0"], 4, True)
+
+
+def test_cached_count_is_not_stored_when_a_write_commits_while_counting(open_database):
+    scope = AdapterTransactionRepo._count_cache_scope(user_id=1)
+
+    async def scenario():
+        async with open_database() as new_session:
+            await _insert(new_session, date(2026, 1, 1), date(2026, 1, 2))
+            async with new_session() as session:
+                # a write of another request commits while the total is counted
+                event.listen(
+                    session.get_bind(),
+                    "after_cursor_execute",
+                    lambda *_: listing_count_cache.invalidate(scope),
+                    once=True,
+                )
+                _, counted, _ = await AdapterTransactionRepo(session=session).fetch_all(
+                    user_id=1,
+                    filters=EVERYTHING,
+                    page=1,
+                    page_size=2,
+                    count_strategy=CountStrategy.CACHED,
+                )
+            return counted, listing_count_cache.get(scope, EVERYTHING)
+
+    counted, cached = asyncio.run(scenario())
+
+    assert counted == 2
+    assert cached is None
+
+
+def test_no_count_still_reports_a_next_page(open_database):
+    async def scenario():
+        async with open_database() as new_session:
+            await _insert(new_session, date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 3))
+            return (
+                await _page(new_session, CountStrategy.NONE),
+                await _page(new_session, CountStrategy.NONE, page=2),
+            )
+
+    assert asyncio.run(scenario()) == ((["t2", "t1"], None, True), (["t0"], None, False))
+
+
+def test_month_and_year_filters(open_database):
+    async def scenario():
+        async with open_database() as new_session:
+            await _insert(
+                new_session,
+                date(2025, 3, 31),  # t0
+                date(2026, 3, 1),  # t1
+                date(2026, 4, 1),  # t2
+                date(2024, 3, 15),  # t3
+                date(2026, 2, 28),  # t4
+                None,  # t5
+            )
+            listed = partial(_page, new_session, CountStrategy.EXACT, page_size=10)
+            return await listed(month=3), await listed(year=2026), await listed(month=3, year=2026)
+
+    every_march, in_2026, march_2026 = asyncio.run(scenario())
+
+    assert every_march == (["t1", "t0", "t3"], 3, False)
+    assert in_2026 == (["t2", "t1", "t4"], 3, False)
+    assert march_2026 == (["t1"], 1, False)
+
+
+def _search(new_session, search_mode: SearchMode, description: str):
+    return _page(
+        new_session,
+        CountStrategy.EXACT,
+        page_size=10,
+        description=description,
+        search_mode=search_mode,
+    )
+
+
+def test_contains_search_ignores_case(open_database):
+    async def scenario():
+        async with open_database() as new_session:
+            await _insert(new_session, date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 3))
+            await _describe(new_session, "Grocery store", "GROCERIES", "rent")
+            return await _search(new_session, SearchMode.CONTAINS, "grocer")
+
+    assert asyncio.run(scenario()) == (["GROCERIES", "Grocery store"], 2, False)
+
+
+def test_fulltext_search_matches_every_word_in_any_order(open_database):
+    async def scenario():
+        async with open_database() as new_session:
+            await _insert(new_session, date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 3))
+            await _describe(new_session, "monthly rent payment", "Payment of the Rent", "rent")
+            return await _search(new_session, SearchMode.FULLTEXT, "payment rent")
+
+    assert asyncio.run(scenario()) == (["Payment of the Rent", "monthly rent payment"], 2, False)
+
+
+def test_fuzzy_search_falls_back_to_a_substring_off_postgres(open_database):
+    async def scenario():
+        async with open_database() as new_session:
+            await _insert(new_session, date(2026, 1, 1), date(2026, 1, 2))
+            await _describe(new_session, "Supermarket", "Super market")
+            return (
+                await _search(new_session, SearchMode.FUZZY, "perm"),
+                await _search(new_session, SearchMode.FUZZY, "supermarkte"),
+            )
+
+    substring, misspelled = asyncio.run(scenario())
+
+    assert substring == (["Supermarket"], 1, False)
+    assert misspelled == ([], 0, False)
+
+
+@pytest.mark.parametrize("search_mode", list(SearchMode))
+def test_search_without_a_rank_keeps_the_listing_order(open_database, search_mode):
+    async def scenario():
+        async with open_database() as new_session:
+            await _insert(new_session, date(2026, 1, 5), None, date(2026, 2, 1), date(2026, 1, 5))
+            await _describe(new_session, "rent a", "rent b", "rent c", "rent d")
+            return (
+                await _page(new_session, CountStrategy.EXACT, page_size=10),
+                await _search(new_session, search_mode, "rent"),
+            )
+
+    listed, searched = asyncio.run(scenario())
+
+    assert searched == listed == (["rent b", "rent c", "rent d", "rent a"], 4, False)
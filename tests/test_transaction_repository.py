@@ -0,0 +1,249 @@
+import asyncio
+from dataclasses import fields
+from datetime import date, datetime
+from decimal import Decimal
+
+from pytest import raises
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.domain.entities.transactions import SaveTransaction, TransactionEntity
+from app.domain.exceptions.transactions import (
+    TransactionAlreadyExistsException,
+    TransactionNotFoundException,
+)
+from app.domain.value_objects.transactions import TransactionsFilter
+from app.infra.database.orm_transaction import Transaction
+from app.infra.repositories.transactions import ENTITY_COLUMNS, AdapterTransactionRepo
+
+
+def _expense(description: str = "rent", amount: str = "10", day: int = 1) -> SaveTransaction:
+    return SaveTransaction(
+        description=description,
+        amount=Decimal(amount),
+        type_of_transaction="expense",
+        transaction_status="not_paid",
+        registration_date=datetime(2026, 3, day),
+        due_date=datetime(2026, 3, 10),
+        category="Home",
+    )
+
+
+async def _saved(new_session, *new_transactions: SaveTransaction, user_id: int = 1) -> list[int]:
+    async with new_session() as session:
+        transaction_repo = AdapterTransactionRepo(session=session)
+        saved = [
+            await transaction_repo.save(
+                new_transaction=new_transaction, user_id=user_id, category_id=1
+            )
+            for new_transaction in new_transactions
+        ]
+        await session.commit()
+    return [transaction.transaction_id for transaction in saved]
+
+
+async def _descriptions(new_session) -> list[str]:
+    async with new_session() as session:
+        result = await session.execute(
+            select(Transaction.description).order_by(Transaction.transaction_id)
+        )
+        return list(result.scalars())
+
+
+def test_update_returns_the_transaction_before_and_after(open_database):
+    async def scenario():
+        async with open_database() as new_session:
+            [transaction_id] = await _saved(new_session, _expense())
+            async with new_session() as session:
+                previous, transaction = await AdapterTransactionRepo(session=session).update(
+                    transaction_id=transaction_id,
+                    edit_transaction=_expense(description="rent (April)", amount="12.5", day=2),
+                    category_id=1,
+                    user_id=1,
+                )
+                await session.commit()
+            return previous, transaction, await _descriptions(new_session)
+
+    previous, transaction, descriptions = asyncio.run(scenario())
+
+    assert (previous.description, previous.amount, previous.registration_date) == (
+        "rent",
+        Decimal("10"),
+        date(2026, 3, 1),
+    )
+    assert (transaction.description, transaction.amount, transaction.registration_date) == (
+        "rent (April)",
+        Decimal("12.5"),
+        date(2026, 3, 2),
+    )
+    assert transaction.transaction_id == previous.transaction_id
+    assert descriptions == ["rent (April)"]
+
+
+def test_update_of_another_users_transaction_is_not_found(open_database):
+    async def scenario():
+        async with open_database() as new_session:
+            [transaction_id] = await _saved(new_session, _expense())
+            async with new_session() as session:
+                with raises(TransactionNotFoundException):
+                    await AdapterTransactionRepo(session=session).update(
+                        transaction_id=transaction_id,
+                        edit_transaction=_expense(description="taken"),
+                        category_id=1,
+                        user_id=2,
+                    )
+                await session.commit()
+            return await _descriptions(new_session)
+
+    assert asyncio.run(scenario()) == ["rent"]
+
+
+def test_update_into_an_existing_expense_conflicts(open_database):
+    async def scenario():
+        async with open_database() as new_session:
+            _, power_id = await _saved(new_session, _expense("rent"), _expense("power"))
+            async with new_session() as session:
+                with raises(TransactionAlreadyExistsException):
+                    await AdapterTransactionRepo(session=session).update(
+                        transaction_id=power_id,
+                        edit_transaction=_expense("rent"),
+                        category_id=1,
+                        user_id=1,
+                    )
+
+    asyncio.run(scenario())
+
+
+def test_save_of_an_existing_expense_conflicts(open_database):
+    async def scenario():
+        async with open_database() as new_session:
+            await _saved(new_session, _expense())
+            with raises(TransactionAlreadyExistsException):
+                await _saved(new_session, _expense())
+            return await _descriptions(new_session)
+
+    assert asyncio.run(scenario()) == ["rent"]
+
+
+def test_delete_returns_the_deleted_transaction(open_database):
+    async def scenario():
+        async with open_database() as new_session:
+            [transaction_id] = await _saved(new_session, _expense())
+            async with new_session() as session:
+                deleted = await AdapterTransactionRepo(session=session).delete(
+                    transaction_id=transaction_id, user_id=1
+                )
+                await session.commit()
+            return deleted, await _descriptions(new_session)
+
+    deleted, descriptions = asyncio.run(scenario())
+
+    assert (deleted.description, deleted.user_id) == ("rent", 1)
+    assert descriptions == []
+
+
+def test_delete_of_another_users_transaction_is_not_found(open_database):
+    async def scenario():
+        async with open_database() as new_session:
+            [transaction_id] = await _saved(new_session, _expense())
+            async with new_session() as session:
+                with raises(TransactionNotFoundException):
+                    await AdapterTransactionRepo(session=session).delete(
+                        transaction_id=transaction_id, user_id=2
+                    )
+                await session.commit()
+            return await _descriptions(new_session)
+
+    assert asyncio.run(scenario()) == ["rent"]
+
+
+def test_postgres_update_locks_and_returns_the_previous_row():
+    transactions = Transaction.__table__
+    statement = AdapterTransactionRepo._update_returning_previous(
+        owned=(transactions.c.transaction_id == 1) & (transactions.c.user_id == 2),
+        edited_values={"description": "rent"},
+    )
+
+    sql = " ".join(str(statement.compile(dialect=postgresql.dialect())).split())
+
+    assert "FROM (SELECT transactions.transaction_id" in sql
+    assert "transactions.user_id = %(user_id_1)s FOR UPDATE) AS previous" in sql
+    assert sql.endswith(
+        "RETURNING " + ", ".join(f"previous.{column.key}" for column in transactions.c)
+    )
+
+
+def test_fetch_one_for_user_finds_only_the_users_own_transactions(open_database):
+    async def scenario():
+        async with open_database() as new_session:
+            [transaction_id] = await _saved(new_session, _expense())
+            async with new_session() as session:
+                transaction_repo = AdapterTransactionRepo(session=session)
+                return [
+                    await transaction_repo.fetch_one_for_user(
+                        transaction_id=wanted_id, user_id=user_id
+                    )
+                    for wanted_id, user_id in [
+                        (transaction_id, 1),
+                        (transaction_id, 2),
+                        (transaction_id + 1, 1),
+                    ]
+                ]
+
+    own, other_users, missing = asyncio.run(scenario())
+
+    assert (own.description, own.amount, own.user_id, own.category_id) == (
+        "rent",
+        Decimal("10"),
+        1,
+        1,
+    )
+    assert (other_users, missing) == (None, None)
+
+
+def test_entity_columns_follow_the_entity_fields():
+    # the entity calls the status column transaction_status
+    column_of = {"transaction_status": "status"}
+
+    assert [column.key for column in ENTITY_COLUMNS] == [
+        column_of.get(field.name, field.name) for field in fields(TransactionEntity)
+    ]
+
+
+def test_fetch_all_builds_every_field_of_the_entities(open_database):
+    async def scenario():
+        async with open_database() as new_session:
+            [transaction_id] = await _saved(new_session, _expense(day=7))
+            await _saved(new_session, _expense(description="not mine"), user_id=2)
+            async with new_session() as session:
+                return transaction_id, await AdapterTransactionRepo(session=session).fetch_all(
+                    user_id=1,
+                    filters=TransactionsFilter(
+                        username="user1",
+                        month=None,
+                        year=None,
+                        description=None,
+                        category=None,
+                        type_of_transaction=None,
+                        status_of_transaction=None,
+                    ),
+                    page=1,
+                    page_size=10,
+                )
+
+    transaction_id, (transactions, total, has_more) = asyncio.run(scenario())
+
+    assert transactions == [
+        TransactionEntity(
+            transaction_id=transaction_id,
+            description="rent",
+            amount=Decimal("10"),
+            type_of_transaction="expense",  # type: ignore
+            transaction_status="not_paid",  # type: ignore
+            registration_date=date(2026, 3, 7),
+            due_date=date(2026, 3, 10),
+            user_id=1,
+            category_id=1,
+        )
+    ]
+    assert (total, has_more) == (1, False)
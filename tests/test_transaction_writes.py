@@ -0,0 +1,95 @@
+import asyncio
+from dataclasses import replace
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from app.domain.entities.transactions import SaveTransaction, TransactionEntity
+from app.domain.exceptions.transactions import TransactionNotFoundException
+from app.usecases.transactions.delete_transaction import DeleteTransactionUseCase
+from app.usecases.transactions.edit_transaction import UpdateTransactionUseCase
+
+STORED = TransactionEntity(
+    transaction_id=1,
+    description="rent",
+    amount=Decimal("10"),
+    type_of_transaction="expense",  # type: ignore
+    transaction_status="not_paid",  # type: ignore
+    registration_date=date(2026, 3, 1),
+    due_date=date(2026, 3, 10),
+    user_id=1,
+    category_id=1,
+)
+
+
+class FakeTransactionRepo:
+    """
+    Holds one transaction of user 1, like the user-scoped RETURNING writes
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def _owned(self, transaction_id: int, user_id: int) -> TransactionEntity:
+        self.calls += 1
+        if (transaction_id, user_id) != (STORED.transaction_id, STORED.user_id):
+            raise TransactionNotFoundException(f"Transaction with id {transaction_id} not found")
+        return STORED
+
+    async def update(self, transaction_id, edit_transaction, category_id, user_id):
+        previous = self._owned(transaction_id=transaction_id, user_id=user_id)
+        return previous, replace(
+            previous, registration_date=edit_transaction.registration_date.date()
+        )
+
+    async def delete(self, transaction_id, user_id):
+        return self._owned(transaction_id=transaction_id, user_id=user_id)
+
+
+class FakeDashboardCache:
+    def __init__(self) -> None:
+        self.invalidated: list[tuple] = []
+
+    async def invalidate(self, user_id: int, *dates: date) -> None:
+        self.invalidated.append((user_id, *dates))
+
+
+def test_update_invalidates_the_months_before_and_after_in_one_repository_call(
+    category_repo, unit_of_work
+):
+    transaction_repo = FakeTransactionRepo()
+    dashboard_cache = FakeDashboardCache()
+    use_case = UpdateTransactionUseCase(
+        transaction_repo=transaction_repo,  # type: ignore
+        category_repo=category_repo,  # type: ignore
+        unit_of_work=unit_of_work,  # type: ignore
+        dashboard_cache=dashboard_cache,  # type: ignore
+    )
+    moved = SaveTransaction(
+        description="rent",
+        amount=Decimal("10"),
+        type_of_transaction="expense",
+        transaction_status="not_paid",
+        registration_date=datetime(2026, 4, 1),
+        due_date=datetime(2026, 4, 10),
+        category="Food",
+    )
+
+    transaction = asyncio.run(use_case.execute(transaction_id=1, edit_transaction=moved, user_id=1))
+
+    assert transaction.registration_date == date(2026, 4, 1)
+    assert transaction_repo.calls == 1
+    assert unit_of_work.commits == 1
+    assert dashboard_cache.invalidated == [(1, date(2026, 3, 1), date(2026, 4, 1))]
+
+
+def test_delete_of_a_missing_transaction_commits_nothing(unit_of_work):
+    use_case = DeleteTransactionUseCase(
+        transaction_repo=FakeTransactionRepo(),  # type: ignore
+        unit_of_work=unit_of_work,  # type: ignore
+    )
+
+    with pytest.raises(TransactionNotFoundException):
+        asyncio.run(use_case.execute(transaction_id=1, user_id=2))
+    assert unit_of_work.commits == 0